@@ -0,0 +1,84 @@
+"""Benchmark for the resolution of ground preconditions and effects.
+
+Generates logistics problems and, for every reachable action, resolves the indices of its preconditions and
+effects both through the compiled 'ActionSchema' objects used by 'Parser' and through 'find_proposition',
+which maps the arguments by name and looks up each proposition. The time of 'print_bdds' is reported too.
+
+Usage:
+    python3 benchmarks/bench_action_schemas.py [--sizes 4 8 12]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.custom_types import Object, Proposition
+from src.parser_pddl import Parser
+from src.proposition_space import PropositionSpace
+from generators import GENERATORS, write_logistics_problem
+
+DOMAIN = GENERATORS["logistics"][0]
+
+def find_proposition(generic_proposition: Proposition, object_combination: tuple[Object],
+                     propositions: PropositionSpace, parameters: list[Object]) -> Proposition:
+    """Finds the ground proposition of a generic one, by matching its objects with the parameters of the action."""
+    proposition_objects = []
+    for object in generic_proposition.get_objects():
+        for index, parameter in enumerate(parameters):
+            if object == parameter:
+                proposition_objects.append(object_combination[index])
+    return propositions.get_proposition(generic_proposition.get_predicate(), proposition_objects)
+
+def resolve_by_name(parser: Parser) -> int:
+    """Resolves every ground precondition and effect with 'find_proposition', returning the number of atoms."""
+    propositions = parser.get_propositions()
+    count = 0
+    for action, parameters in parser.get_reachable_actions():
+        atoms = action.get_preconditions() + [effect for scenario in action.get_effects() for effect in scenario]
+        for generic_proposition, _ in atoms:
+            find_proposition(generic_proposition, parameters, propositions, action.get_parameters())
+            count += 1
+    return count
+
+def resolve_by_schema(parser: Parser) -> int:
+    """Resolves every ground precondition and effect with the compiled schemas, returning the number of atoms."""
+    schemas = {schema.get_action(): schema for schema in parser.schemas}
+    global_ids = parser.get_propositions().global_ids
+    count = 0
+    for action, parameters in parser.get_reachable_actions():
+        schema = schemas[action]
+        binding = [global_ids[parameter.get_name()] for parameter in parameters]
+        count += len(schema.ground_preconditions(binding))
+        count += sum(len(scenario) for scenario in schema.ground_effects(binding))
+    return count
+
+def main() -> None:
+    argument_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    argument_parser.add_argument("--sizes", type=int, nargs="+", default=[4, 8, 12],
+                                 help="Numbers of locations (and trucks) of the generated problems.")
+    arguments = argument_parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        print("size   actions     atoms  by-name(s)  schema(s)  print_bdds(s)")
+        for size in arguments.sizes:
+            problem_path = os.path.join(directory, "problem-" + str(size) + ".pddl")
+            write_logistics_problem(problem_path, size)
+            parser = Parser(DOMAIN, problem_path, prune_static=False)
+
+            start = time.perf_counter()
+            num_atoms = resolve_by_name(parser)
+            by_name = time.perf_counter() - start
+            start = time.perf_counter()
+            resolve_by_schema(parser)
+            by_schema = time.perf_counter() - start
+            start = time.perf_counter()
+            parser.print_bdds(os.path.join(directory, "output-" + str(size) + ".txt"))
+            printing = time.perf_counter() - start
+            print(f"{size:4d} {len(parser.get_reachable_actions()):9d} {num_atoms:9d} "
+                  f"{by_name:11.3f} {by_schema:10.3f} {printing:14.3f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Benchmark for reading the text and binary output formats.
+
+Generates logistics problems, writes them in both formats, and measures the time to read them back: the text format
+is tokenized by 'read_text_bdds', while the binary format is mapped by 'BinaryBdds' and its actions are decoded.
+
+Usage:
+    python3 benchmarks/bench_binary_format.py [--sizes 8 16 24]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.parser_pddl import Parser
+from src.binary_format import BinaryBdds, read_text_bdds
+from bench_action_schemas import DOMAIN, write_problem
+
+def read_binary(path: str) -> int:
+    """Maps a binary output and decodes the preconditions and effects of every action, returning the number of actions."""
+    with BinaryBdds(path) as bdds:
+        for position in range(bdds.num_actions):
+            bdds.get_preconditions(position)
+            bdds.get_effects(position)
+        return bdds.num_actions
+
+def main() -> None:
+    argument_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    argument_parser.add_argument("--sizes", type=int, nargs="+", default=[8, 16, 24],
+                                 help="Numbers of locations (and trucks) of the generated problems.")
+    arguments = argument_parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        print("size   actions   text(MiB)  binary(MiB)  read text(s)  read binary(s)  map binary(s)")
+        for size in arguments.sizes:
+            problem_path = os.path.join(directory, "problem-" + str(size) + ".pddl")
+            write_problem(problem_path, size)
+            parser = Parser(DOMAIN, problem_path)
+            text_path = os.path.join(directory, "output-" + str(size) + ".out")
+            binary_path = os.path.join(directory, "output-" + str(size) + ".bin")
+            parser.print_bdds(text_path)
+            parser.print_binary(binary_path)
+
+            start = time.perf_counter()
+            read_text_bdds(text_path)
+            text_time = time.perf_counter() - start
+            start = time.perf_counter()
+            num_actions = read_binary(binary_path)
+            binary_time = time.perf_counter() - start
+            start = time.perf_counter()
+            BinaryBdds(binary_path).close()
+            map_time = time.perf_counter() - start
+            print(f"{size:4d} {num_actions:9d} {os.path.getsize(text_path) / 2**20:11.2f} "
+                  f"{os.path.getsize(binary_path) / 2**20:12.2f} {text_time:13.3f} {binary_time:15.3f} {map_time:14.5f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Benchmark for the construction of the initial and goal states.
+
+Generates graph problems whose ':init' section lists every edge between distinct nodes, and
+measures the construction time of 'Parser', which should grow linearly with the number of facts. Since 'edge' is
+static, the problems are parsed with 'prune_static=False', so that every fact is resolved to a proposition index.
+
+Usage:
+    python3 benchmarks/bench_initial_state.py [--sizes 50 100 224]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.parser_pddl import Parser
+
+DOMAIN = """(define (domain graph)
+  (:requirements :strips :typing)
+  (:types node)
+  (:predicates (edge ?from - node ?to - node))
+)
+"""
+
+def write_problem(path: str, num_nodes: int) -> int:
+    """Writes a graph problem with 'num_nodes' fully connected nodes, returning the number of facts in ':init'."""
+    nodes = ["n" + str(i) for i in range(num_nodes)]
+    facts = ["(edge " + a + " " + b + ")" for a in nodes for b in nodes if a != b]
+    with open(path, "w") as problem_file:
+        problem_file.write("(define (problem graph-" + str(num_nodes) + ")\n")
+        problem_file.write("  (:domain graph)\n")
+        problem_file.write("  (:objects " + " ".join(nodes) + " - node)\n")
+        problem_file.write("  (:init " + "\n    ".join(facts) + ")\n")
+        problem_file.write("  (:goal (edge n0 n1)))\n")
+    return len(facts)
+
+def main() -> None:
+    argument_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    argument_parser.add_argument("--sizes", type=int, nargs="+", default=[50, 100, 158, 224],
+                                 help="Numbers of nodes of the generated problems (224 nodes yield ~50k atoms).")
+    arguments = argument_parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        domain_path = os.path.join(directory, "domain.pddl")
+        with open(domain_path, "w") as domain_file:
+            domain_file.write(DOMAIN)
+        print("nodes      facts   seconds   us/fact")
+        for num_nodes in arguments.sizes:
+            problem_path = os.path.join(directory, "problem-" + str(num_nodes) + ".pddl")
+            num_facts = write_problem(problem_path, num_nodes)
+            start = time.perf_counter()
+            Parser(domain_path, problem_path, prune_static=False)
+            elapsed = time.perf_counter() - start
+            print(f"{num_nodes:5d} {num_facts:10d} {elapsed:9.3f} {1e6 * elapsed / num_facts:9.2f}")
+
+if __name__ == "__main__":
+    main()
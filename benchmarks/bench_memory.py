@@ -0,0 +1,105 @@
+"""Benchmark for the memory used by the core types ('Object', 'Predicate', 'Proposition' and 'Action').
+
+Generates problems, materializes every proposition of their 'PropositionSpace' and reports the bytes allocated per
+proposition, measured with 'tracemalloc', before and after building the names of the propositions. The memory
+of the 'Domain' objects built from each parsed domain, and the number of distinct 'Object' instances referenced by
+their actions, are reported too. Finally, the peak memory of parsing, grounding and writing each problem is compared
+with and without 'streaming', in which the actions are grounded while they are written instead of being kept.
+
+Usage:
+    python3 benchmarks/bench_memory.py [--generators gripper logistics] [--sizes 20 40]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.parser_pddl import Parser
+from src.domain import Domain
+from pddl import parse_domain
+from generators import GENERATORS, generate
+
+def measure_peak(function) -> int:
+    """Calls a function, returning the peak number of bytes allocated while it ran."""
+    tracemalloc.start()
+    try:
+        function()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return peak
+
+def write_output(domain_path: str, problem_path: str, output_path: str, streaming: bool) -> None:
+    """Parses, grounds and writes a problem."""
+    Parser(domain_path, problem_path, streaming=streaming).print_bdds(output_path)
+
+def measure(function) -> tuple[int, object]:
+    """Calls a function, returning the bytes it allocated and still held on return, and its result."""
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = function()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    return (after - before, result)
+
+def build_names(propositions: list) -> None:
+    """Builds the name of every proposition."""
+    for proposition in propositions:
+        str(proposition)
+
+def count_objects(domain) -> tuple[int, int]:
+    """Counts the references to 'Object' instances in the actions of a domain, and the distinct instances among them."""
+    references = []
+    for action in domain.get_actions():
+        references.extend(action.get_parameters())
+        atoms = list(action.get_preconditions()) + [atom for scenario in action.get_effects() for atom in scenario]
+        for proposition, _ in atoms:
+            references.extend(proposition.get_objects())
+    return (len(references), len({id(object) for object in references}))
+
+def main() -> None:
+    argument_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    argument_parser.add_argument("--generators", nargs="+", choices=list(GENERATORS), default=list(GENERATORS),
+                                 help="Generators of the problems to run.")
+    argument_parser.add_argument("--sizes", type=int, nargs="+", default=[20, 80],
+                                 help="Sizes of the generated problems.")
+    arguments = argument_parser.parse_args()
+
+    print("domain           bytes  references  instances")
+    for name in arguments.generators:
+        parsed_domain = parse_domain(GENERATORS[name][0])
+        domain_bytes, domain = measure(lambda: Domain(parsed_domain))
+        references, instances = count_objects(domain)
+        print(f"{name:<14} {domain_bytes:7d} {references:11d} {instances:10d}")
+
+    print()
+    print("generator       size     props  bytes/prop  with names")
+    with tempfile.TemporaryDirectory() as directory:
+        for name in arguments.generators:
+            for size in arguments.sizes:
+                domain_path, problem_path = generate(name, directory, size)
+                space = Parser(domain_path, problem_path).get_propositions()
+                materialized_bytes, propositions = measure(lambda: list(space))
+                named_bytes, _ = measure(lambda: build_names(propositions))
+                print(f"{name:<14} {size:5d} {len(propositions):9d} {materialized_bytes / len(propositions):11.1f} "
+                      f"{(materialized_bytes + named_bytes) / len(propositions):11.1f}")
+
+        print()
+        print("generator       size   actions   peak (MiB)  streaming (MiB)")
+        output_path = os.path.join(directory, "output.out")
+        for name in arguments.generators:
+            for size in arguments.sizes:
+                domain_path, problem_path = generate(name, directory, size)
+                peak = measure_peak(lambda: write_output(domain_path, problem_path, output_path, False))
+                streaming_peak = measure_peak(lambda: write_output(domain_path, problem_path, output_path, True))
+                with open(output_path) as output_file:
+                    num_actions = next(int(next(output_file)) for line in output_file if line == "begin_actions\n")
+                print(f"{name:<14} {size:5d} {num_actions:9d} {peak / 2**20:12.1f} {streaming_peak / 2**20:16.1f}")
+
+if __name__ == "__main__":
+    main()
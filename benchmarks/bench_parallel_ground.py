@@ -0,0 +1,59 @@
+"""Benchmark for the scaling of the parallel grounding with the number of worker processes.
+
+Generates logistics problems and grounds each of them with 'run_ground_layered' and with 'run_ground_parallel' for
+every requested number of workers, checking that the instantiations are the same and in the same order. The time
+includes starting the worker processes.
+
+Usage:
+    python3 benchmarks/bench_parallel_ground.py [--sizes 12 20] [--workers 1 2 4 8]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.parser_pddl import Parser
+from src.ground import GroundActionRegistry, run_ground_layered
+from src.parallel_ground import run_ground_parallel
+from generators import GENERATORS, write_logistics_problem
+
+def ground(parser: Parser, workers: int) -> tuple[float, list[tuple[int, tuple[int, ...]]]]:
+    """Grounds the problem of a parser, serially if 'workers' is 0, returning the time and the instantiations."""
+    registry = GroundActionRegistry()
+    start = time.perf_counter()
+    if workers == 0:
+        run_ground_layered(parser.initial_state, parser.propositions, parser.schemas, parser.relation_bases,
+                           parser.static_facts, registry)
+    else:
+        run_ground_parallel(parser.initial_state, parser.propositions, parser.schemas, parser.relation_bases,
+                            parser.static_facts, registry, workers)
+    elapsed = time.perf_counter() - start
+    return (elapsed, [(schema.get_index(), parameters) for schema, parameters in registry])
+
+def main() -> None:
+    argument_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    argument_parser.add_argument("--sizes", type=int, nargs="+", default=[12, 20],
+                                 help="Numbers of locations (and trucks) of the generated problems.")
+    argument_parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8],
+                                 help="Numbers of worker processes.")
+    arguments = argument_parser.parse_args()
+
+    print("cpus:", os.cpu_count())
+    with tempfile.TemporaryDirectory() as directory:
+        print("size   actions  workers  time(s)  speedup  identical")
+        for size in arguments.sizes:
+            problem_path = os.path.join(directory, "problem-" + str(size) + ".pddl")
+            write_logistics_problem(problem_path, size)
+            parser = Parser(GENERATORS["logistics"][0], problem_path, grounding="layered")
+            serial_time, serial_instantiations = ground(parser, 0)
+            print(f"{size:4d} {len(serial_instantiations):9d}   serial {serial_time:8.3f} {1:8.2f}")
+            for workers in arguments.workers:
+                elapsed, instantiations = ground(parser, workers)
+                print(f"{size:4d} {len(instantiations):9d} {workers:8d} {elapsed:8.3f} {serial_time / elapsed:8.2f}  "
+                      f"{instantiations == serial_instantiations}")
+
+if __name__ == "__main__":
+    main()
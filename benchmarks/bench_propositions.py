@@ -0,0 +1,67 @@
+"""Benchmark for the construction of the proposition space.
+
+Builds the propositions of the triangle-tire predicates over an n x n grid of locations, both with the
+'PropositionSpace' used by 'Parser' and with the eager Cartesian product it replaced, and reports the
+construction time and peak memory of each.
+
+Usage:
+    python3 benchmarks/bench_propositions.py [--grid 30]
+"""
+import argparse
+import itertools
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.custom_types import Object, Predicate, Proposition
+from src.proposition_space import PropositionSpace
+
+def build_eager(predicates: dict[str, Predicate], objects: dict[str, list[Object]]) -> dict[str, Proposition]:
+    """Builds every proposition eagerly, as the former 'Parser.__store_propositions' did."""
+    propositions = []
+    dict_propositions = {}
+    for predicate in predicates.values():
+        products = itertools.product(*[objects.get(t, []) for t in predicate.get_variable_types()])
+        for tup in products:
+            if len(tup) == len(set(tup)):
+                proposition = Proposition(predicate, list(tup), len(propositions))
+                propositions.append(proposition)
+                dict_propositions[str(proposition)] = proposition
+    return dict_propositions
+
+def measure(build, *arguments) -> tuple[float, int, object]:
+    """Calls 'build', returning the elapsed time, the peak traced memory and the result."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = build(*arguments)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak, result
+
+def main() -> None:
+    argument_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    argument_parser.add_argument("--grid", type=int, default=30, help="Side of the grid of locations.")
+    argument_parser.add_argument("--skip-eager", action="store_true", help="Do not run the eager construction.")
+    arguments = argument_parser.parse_args()
+
+    locations = [Object("l-" + str(i) + "-" + str(j), "location")
+                 for i in range(1, arguments.grid + 1) for j in range(1, arguments.grid + 1)]
+    objects = {"location": locations}
+    predicates = {"vehicle-at": Predicate("vehicle-at", ["location"]),
+                  "spare-in": Predicate("spare-in", ["location"]),
+                  "road": Predicate("road", ["location", "location"]),
+                  "not-flattire": Predicate("not-flattire", [])}
+
+    elapsed, peak, space = measure(PropositionSpace, predicates, objects)
+    print(f"propositions: {len(space)}")
+    print(f"space: {elapsed:10.4f} s {peak / 2**20:10.2f} MiB")
+    if not arguments.skip_eager:
+        elapsed, peak, _ = measure(build_eager, predicates, objects)
+        print(f"eager: {elapsed:10.4f} s {peak / 2**20:10.2f} MiB")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""Generators of PDDL problems of scalable size for the benchmarks.
+
+Each generator writes a problem of a given size for a fixed domain file:
+
+- gripper: the 'gripper3' domain with two rooms and 'size' balls, all of them in the first room.
+- triangle-tire: the 'triangle-tire' domain on a triangle of side 2 * 'size' + 1; sizes 1 and 2 give the same
+  facts as the 'triangle-tire-1' and 'triangle-tire-2' examples.
+- logistics: the 'logistics' domain with one city, 'size' locations, 'size' trucks and 2 * 'size' packages. The
+  'drive' action joins two locations of the same city for every truck.
+- blocksworld: the 4-operator blocksworld domain with 'size' blocks stacked in a single tower. The 'stack' and
+  'unstack' actions join every pair of blocks.
+
+The problems only depend on their size, so that the same size always gives the same file.
+"""
+import os
+
+EXAMPLES_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "tests", "examples"))
+DOMAINS_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "domains"))
+
+def write_problem_file(path: str, name: str, domain: str, objects: list[str], facts: list[str], goal: str) -> None:
+    """Writes a PDDL problem given the declarations of its objects, its initial facts and its goal."""
+    with open(path, "w") as problem_file:
+        problem_file.write("(define (problem " + name + ")\n")
+        problem_file.write("  (:domain " + domain + ")\n")
+        problem_file.write("  (:objects " + " ".join(objects) + ")\n")
+        problem_file.write("  (:init " + "\n    ".join(facts) + ")\n")
+        problem_file.write("  (:goal " + goal + "))\n")
+
+def write_gripper_problem(path: str, size: int) -> None:
+    """Writes a gripper problem with two rooms and 'size' balls, all of them whole and in the first room."""
+    balls = ["ball" + str(i) for i in range(1, size + 1)]
+    facts = ["(free left)", "(free right)", "(at-robby rooma)"]
+    facts += ["(at-ball " + ball + " rooma)" for ball in balls]
+    facts += ["(whole " + ball + ")" for ball in balls]
+    goal = "(and " + " ".join("(at-ball " + ball + " roomb)" for ball in balls) + " (at-robby roomb))"
+    write_problem_file(path, "gripper3-" + str(size), "gripper3", ["rooma roomb - room", " ".join(balls) + " - ball"],
+                       facts, goal)
+
+def write_triangle_tire_problem(path: str, size: int) -> None:
+    """Writes a triangle-tire problem on a triangle of side 2 * 'size' + 1, with the car in one corner and the goal in another."""
+    side = 2 * size + 1
+    locations = ["l-" + str(row) + "-" + str(column) for row in range(1, side + 1) for column in range(1, side + 1)]
+    location = lambda row, column: "l-" + str(row) + "-" + str(column)
+    facts = ["(vehicle-at l-1-1)"]
+    for row in range(1, side, 2):
+        width = side - row + 1
+        facts += ["(road " + location(row, column) + " " + location(row, column + 1) + ")" for column in range(1, width)]
+        for column in range(1, width):
+            facts.append("(road " + location(row, column) + " " + location(row + 1, column) + ")")
+            facts.append("(road " + location(row + 1, column) + " " + location(row, column + 1) + ")")
+            facts.append("(spare-in " + location(row + 1, column) + ")")
+        for column in range(1, width - 1, 2):
+            facts.append("(road " + location(row + 1, column) + " " + location(row + 2, column) + ")")
+            facts.append("(road " + location(row + 2, column) + " " + location(row + 1, column + 1) + ")")
+            facts.append("(spare-in " + location(row + 2, column) + ")")
+    facts.append("(not-flattire)")
+    write_problem_file(path, "triangle-tire-" + str(size), "triangle-tire", [" ".join(locations) + " - location"],
+                       facts, "(vehicle-at " + location(1, side) + ")")
+
+def write_logistics_problem(path: str, size: int) -> None:
+    """Writes a logistics problem with one city, 'size' locations, 'size' trucks and 2 * 'size' packages."""
+    locations = ["loc" + str(i) for i in range(size)]
+    trucks = ["truck" + str(i) for i in range(size)]
+    packages = ["pkg" + str(i) for i in range(2 * size)]
+    facts = ["(in-city " + location + " city0)" for location in locations]
+    facts += ["(at-truck " + truck + " loc" + str(i) + ")" for i, truck in enumerate(trucks)]
+    facts += ["(at-pkg " + package + " loc" + str(i % size) + ")" for i, package in enumerate(packages)]
+    objects = [" ".join(locations) + " - location", "city0 - city", " ".join(trucks) + " - truck",
+               " ".join(packages) + " - package"]
+    write_problem_file(path, "logistics-" + str(size), "logistics", objects, facts, "(at-pkg pkg0 loc1)")
+
+def write_blocksworld_problem(path: str, size: int) -> None:
+    """Writes a blocksworld problem with 'size' blocks stacked in a single tower, whose goal is the reversed tower."""
+    blocks = ["b" + str(i) for i in range(size)]
+    facts = ["(handempty)", "(ontable b0)", "(clear " + blocks[-1] + ")"]
+    facts += ["(on " + blocks[i] + " " + blocks[i - 1] + ")" for i in range(1, size)]
+    goal = "(and " + " ".join("(on " + blocks[i - 1] + " " + blocks[i] + ")" for i in range(1, size)) + ")"
+    write_problem_file(path, "blocksworld-" + str(size), "blocksworld", [" ".join(blocks) + " - block"], facts, goal)
+
+GENERATORS = {
+    "gripper": (os.path.join(EXAMPLES_DIR, "gripper3.pddl"), write_gripper_problem),
+    "triangle-tire": (os.path.join(EXAMPLES_DIR, "triangle-tire.pddl"), write_triangle_tire_problem),
+    "logistics": (os.path.join(EXAMPLES_DIR, "logistics.pddl"), write_logistics_problem),
+    "blocksworld": (os.path.join(DOMAINS_DIR, "blocksworld.pddl"), write_blocksworld_problem),
+}
+
+def generate(name: str, directory: str, size: int) -> tuple[str, str]:
+    """Writes a problem of a generator in a directory, returning the paths of its domain and of the problem."""
+    domain_path, write_problem = GENERATORS[name]
+    problem_path = os.path.join(directory, name + "-" + str(size) + ".pddl")
+    write_problem(problem_path, size)
+    return (domain_path, problem_path)
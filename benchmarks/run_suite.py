@@ -0,0 +1,243 @@
+"""Benchmark suite of the parser on generated problems of increasing size, with results that can be compared across commits.
+
+For every generator of 'generators.py' and every size, a problem is written and parsed, grounded and written out
+'--repeat' times, and the smallest time of each scenario is kept:
+
+- parse: parsing and building the domain and the problem;
+- propositions: building the propositions, the static facts and the initial and goal states;
+- ground: compiling the action schemas and grounding the reachable actions;
+- write: writing the output with 'print_bdds';
+- total: all of the above.
+
+The startup of 'main.py' is measured too, in fresh interpreters started with 'python -X importtime':
+
+- import: the cumulative import time of the 'src' package, as reported by '-X importtime';
+- cli: the wall time of 'main.py' on a small gripper problem;
+- cli_cached: the same, when the problem is found in a '--cache-dir' cache, which must not import 'pddl' at all
+  (the number of 'pddl' and 'lark' modules imported is kept as the 'pddl_imports' counter, and flagged if it changes).
+
+The results, along with the time of every phase and the counters of 'ParserStats', the commit, the package version
+and the machine, are written as JSON. With '--baseline', the times are compared with those of an earlier results
+file, and the scenarios slower by more than '--threshold' (and longer than '--min-time') are flagged; the number of
+propositions and actions of each problem is checked too, since a change in them means that the two runs did not do
+the same work. The exit status is 1 if any regression is flagged, so that the suite can gate a change.
+
+Usage:
+    python3 benchmarks/run_suite.py [--generators gripper logistics] [--sizes 10 20] [--repeat 3]
+                                    [--grounding queue] [--output results.json] [--baseline old.json]
+    python3 benchmarks/run_suite.py --compare old.json new.json
+    python3 benchmarks/run_suite.py --skip-startup
+"""
+import argparse
+import datetime
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.parser_pddl import Parser
+from src.version import __version__
+from generators import GENERATORS, generate
+
+SCENARIOS = {
+    "parse": ("parse_domain", "build_domain", "parse_problem", "build_problem"),
+    "propositions": ("propositions", "static_facts", "states"),
+    "ground": ("compile_schemas", "ground"),
+    "write": ("write",),
+}
+
+STARTUP_SIZE = 10
+
+DEFAULT_SIZES = {
+    "gripper": [10, 40, 160],
+    "triangle-tire": [5, 10, 20],
+    "logistics": [4, 8, 16],
+    "blocksworld": [10, 20, 40],
+}
+
+def get_commit() -> dict:
+    """Gets the current commit of the repository and whether the tree has local changes, or None if git is unavailable."""
+    root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], cwd=root, capture_output=True, text=True, check=True)
+        status = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], cwd=root,
+                                capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return {"commit": None, "dirty": None}
+    return {"commit": commit.stdout.strip(), "dirty": status.stdout.strip() != ""}
+
+def get_metadata(arguments: argparse.Namespace) -> dict:
+    """Gets the description of the run: commit, package version, machine and options."""
+    metadata = get_commit()
+    metadata.update({
+        "version": __version__,
+        "date": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpus": os.cpu_count(),
+        "repeat": arguments.repeat,
+        "grounding": arguments.grounding,
+        "prune_static": not arguments.keep_static,
+    })
+    return metadata
+
+def run_problem(domain_path: str, problem_path: str, output_path: str, arguments: argparse.Namespace) -> dict:
+    """Parses, grounds and writes a problem '--repeat' times, returning the smallest time of each phase and scenario."""
+    phases = {}
+    counters = {}
+    for _ in range(arguments.repeat):
+        parser = Parser(domain_path, problem_path, prune_static=not arguments.keep_static,
+                        grounding=arguments.grounding, stats=True)
+        parser.print_bdds(output_path)
+        stats = parser.get_stats()
+        for name, phase in stats.phases.items():
+            phases[name] = min(phases.get(name, phase["time"]), phase["time"])
+        counters = stats.get_counters()
+    times = {scenario: sum(phases.get(name, 0.0) for name in names) for scenario, names in SCENARIOS.items()}
+    times["total"] = sum(times.values())
+    return {"times": times, "phases": phases, "counters": dict(counters)}
+
+def get_import_times(stderr: str) -> dict[str, float]:
+    """Gets the cumulative import time, in seconds, of each module from the output of 'python -X importtime'."""
+    times = {}
+    for line in stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            _, cumulative, name = line[len("import time:"):].split("|")
+            if cumulative.strip().isdigit():
+                times[name.strip()] = int(cumulative) / 1e6
+    return times
+
+def run_startup(directory: str, arguments: argparse.Namespace) -> dict:
+    """Measures the import of 'src' and the runs of 'main.py' on a small problem in fresh interpreters.
+
+    The fastest of '--repeat' runs is kept; the cache of the cached runs is filled by a first run, which is not timed.
+    """
+    root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+    domain_path, problem_path = generate("gripper", directory, STARTUP_SIZE)
+    command = [sys.executable, "-X", "importtime", os.path.join(root, "main.py"), domain_path, problem_path,
+               "--output-dir", os.path.join(directory, "startup")]
+    cache_dir = os.path.join(directory, "startup_cache")
+    subprocess.run(command + ["--cache-dir", cache_dir], capture_output=True, check=True)
+    times = {"import": float("inf"), "cli": float("inf"), "cli_cached": float("inf")}
+    pddl_imports = 0
+    for _ in range(arguments.repeat):
+        process = subprocess.run([sys.executable, "-X", "importtime", "-c", "import src"], cwd=root, capture_output=True,
+                                 text=True, check=True)
+        times["import"] = min(times["import"], get_import_times(process.stderr)["src"])
+        for scenario, options in (("cli", []), ("cli_cached", ["--cache-dir", cache_dir])):
+            start = time.perf_counter()
+            process = subprocess.run(command + options, capture_output=True, text=True, check=True)
+            times[scenario] = min(times[scenario], time.perf_counter() - start)
+            if scenario == "cli_cached":
+                pddl_imports = sum(1 for name in get_import_times(process.stderr) if name.split(".")[0] in ("pddl", "lark"))
+    return {"generator": "startup", "size": STARTUP_SIZE, "times": times, "phases": {},
+            "counters": {"pddl_imports": pddl_imports}}
+
+def run_suite(arguments: argparse.Namespace) -> dict:
+    """Runs every requested generator and size, printing a line per problem, and returns the results."""
+    results = []
+    print(f"{'generator':<14} {'size':>5} {'props':>7} {'actions':>8} "
+          + " ".join(f"{scenario:>12}" for scenario in list(SCENARIOS) + ["total"]))
+    with tempfile.TemporaryDirectory() as directory:
+        for name in arguments.generators:
+            for size in arguments.sizes or DEFAULT_SIZES[name]:
+                domain_path, problem_path = generate(name, directory, size)
+                result = {"generator": name, "size": size}
+                result.update(run_problem(domain_path, problem_path, os.path.join(directory, "output.out"), arguments))
+                results.append(result)
+                print(f"{name:<14} {size:5d} {result['counters']['propositions']:7d} {result['counters']['actions']:8d} "
+                      + " ".join(f"{time:12.4f}" for time in result["times"].values()))
+        if not arguments.skip_startup:
+            result = run_startup(directory, arguments)
+            results.append(result)
+            print(f"startup: import {result['times']['import']:.4f}s, cli {result['times']['cli']:.4f}s, cli_cached "
+                  f"{result['times']['cli_cached']:.4f}s, pddl modules imported on a cache hit: "
+                  f"{result['counters']['pddl_imports']}")
+    return {"metadata": get_metadata(arguments), "results": results}
+
+def compare(baseline: dict, current: dict, threshold: float, min_time: float) -> int:
+    """Prints the ratio of the times of two results for the problems in both, returning the number of regressions.
+
+    A scenario is a regression if its time grew by more than 'threshold' (a fraction of the baseline time), unless both
+    times are under 'min_time' seconds, where the noise of the timer dominates; a problem whose number of propositions
+    or actions changed is reported, and counted as a regression.
+    """
+    print("baseline:", baseline["metadata"].get("commit"), " current:", current["metadata"].get("commit"))
+    baseline_results = {(result["generator"], result["size"]): result for result in baseline["results"]}
+    regressions = 0
+    print(f"{'generator':<14} {'size':>5} {'scenario':<13} {'baseline':>10} {'current':>10} {'ratio':>7}")
+    for result in current["results"]:
+        old = baseline_results.get((result["generator"], result["size"]))
+        if old is None:
+            continue
+        for counter in ("propositions", "actions", "pddl_imports"):
+            if old["counters"].get(counter) != result["counters"].get(counter):
+                print(f"{result['generator']:<14} {result['size']:5d} {counter} changed: "
+                      f"{old['counters'].get(counter)} -> {result['counters'].get(counter)}")
+                regressions += 1
+        for scenario, time in result["times"].items():
+            old_time = old["times"].get(scenario)
+            if old_time is None:
+                continue
+            ratio = time / old_time if old_time > 0 else float("inf")
+            flag = ""
+            if max(time, old_time) >= min_time:
+                if ratio > 1 + threshold:
+                    flag = "  slower"
+                    regressions += 1
+                elif ratio < 1 / (1 + threshold):
+                    flag = "  faster"
+            print(f"{result['generator']:<14} {result['size']:5d} {scenario:<13} {old_time:10.4f} {time:10.4f} "
+                  f"{ratio:7.2f}{flag}")
+    return regressions
+
+def load_results(path: str) -> dict:
+    """Loads a results file written by the suite."""
+    with open(path) as results_file:
+        return json.load(results_file)
+
+def main() -> None:
+    argument_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    argument_parser.add_argument("--generators", nargs="+", choices=list(GENERATORS), default=list(GENERATORS),
+                                 help="Generators of the problems to run.")
+    argument_parser.add_argument("--sizes", type=int, nargs="+",
+                                 help="Sizes of the generated problems; each generator has its own defaults.")
+    argument_parser.add_argument("--repeat", type=int, default=3,
+                                 help="Number of runs of each problem, of which the fastest is kept.")
+    argument_parser.add_argument("--grounding", choices=["queue", "layered", "parallel"], default="queue",
+                                 help="Grounding engine of the parser.")
+    argument_parser.add_argument("--keep-static", action="store_true",
+                                 help="Keep the propositions of static predicates (prune_static=False).")
+    argument_parser.add_argument("--skip-startup", action="store_true",
+                                 help="Do not measure the startup of 'main.py' with 'python -X importtime'.")
+    argument_parser.add_argument("--output", help="Path of the JSON file where the results are written.")
+    argument_parser.add_argument("--baseline", help="Path of an earlier results file to compare the results with.")
+    argument_parser.add_argument("--compare", nargs=2, metavar=("BASELINE", "CURRENT"),
+                                 help="Only compare two results files, without running the suite.")
+    argument_parser.add_argument("--threshold", type=float, default=0.1,
+                                 help="Relative slowdown above which a scenario is flagged. Defaults to 0.1.")
+    argument_parser.add_argument("--min-time", type=float, default=0.01,
+                                 help="Time, in seconds, under which a scenario is never flagged. Defaults to 0.01.")
+    arguments = argument_parser.parse_args()
+
+    if arguments.compare is not None:
+        regressions = compare(load_results(arguments.compare[0]), load_results(arguments.compare[1]), arguments.threshold,
+                              arguments.min_time)
+    else:
+        results = run_suite(arguments)
+        if arguments.output is not None:
+            with open(arguments.output, "w") as output_file:
+                json.dump(results, output_file, indent=2)
+        regressions = 0
+        if arguments.baseline is not None:
+            regressions = compare(load_results(arguments.baseline), results, arguments.threshold, arguments.min_time)
+    sys.exit(1 if regressions > 0 else 0)
+
+if __name__ == "__main__":
+    main()
@@ -1,19 +1,101 @@
-from src.parser_pddl import Parser
-import sys,os
+from src.batch import parse_many
+from src.domain import load_domain
+from src.stats import ParserStats
+import argparse, glob, os, sys, time
+
+def expand_problem_paths(patterns: list[str], domain_path: str) -> list[str]:
+    """Expands the problem arguments into a list of problem files.
+
+    Args:
+        patterns (list[str]): Problem file paths, directories (whose '.pddl' files are taken) or glob patterns.
+        domain_path (str): The domain file path, which is left out if a directory or pattern matches it.
+
+    Returns:
+        list[str]: The problem file paths, in the order given (sorted within each directory or pattern), without repetitions.
+    """
+    paths = []
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            matches = sorted(glob.glob(os.path.join(pattern, "*.pddl")))
+        elif any(character in pattern for character in "*?["):
+            matches = sorted(glob.glob(pattern))
+        else:
+            matches = [pattern]
+        for path in matches:
+            if os.path.abspath(path) != os.path.abspath(domain_path) and path not in paths:
+                paths.append(path)
+    return paths
 
 def main():
-    arguments = sys.argv[1:]
-    if len(arguments) != 2:
-        raise Exception("Wrong input format.\nUse: python3 main.py <domain_path> <problem_path>")
-    
-    domain_path = arguments[0]
-    problem_path = arguments[1]
-    problem_name = problem_path.split('/')[-1].split(".")[0]
-    output_dir = "output"
-    output_path = output_dir + "/" + problem_name + '.out'
-    os.makedirs(output_dir, exist_ok=True)
-    parser = Parser(domain_path, problem_path)
-    parser.print_bdds(output_path)
+    argument_parser = argparse.ArgumentParser(
+        description="Parses PDDL problems of a domain, writing one '.out' file per problem.",
+        usage="python3 main.py <domain_path> <problem_path> [<problem_path> ...] [--output-dir DIR]")
+    argument_parser.add_argument("domain_path", help="The PDDL domain file.")
+    argument_parser.add_argument("problem_paths", nargs="+",
+                                 help="PDDL problem files, directories of problem files, or glob patterns.")
+    argument_parser.add_argument("--output-dir", default="output", help="The directory of the output files (default: output).")
+    argument_parser.add_argument("--workers", type=int, default=1, help="The number of problems parsed in parallel (default: 1).")
+    argument_parser.add_argument("--timeout", type=float, default=None, help="The time limit, in seconds, for each problem.")
+    argument_parser.add_argument("--memory-limit", type=int, default=None,
+                                 help="The memory limit, in MiB, of each worker process.")
+    argument_parser.add_argument("--cache-dir", default=None,
+                                 help="A directory where parsed problems are cached, so that unchanged ones are not parsed again.")
+    argument_parser.add_argument("--streaming", action="store_true",
+                                 help="Ground the actions while writing them, without keeping them in memory.")
+    argument_parser.add_argument("--reader", choices=("pddl", "builtin"), default="pddl",
+                                 help="The reader of the PDDL files (default: pddl); 'builtin' falls back to 'pddl' for "
+                                      "files outside the subset it supports.")
+    argument_parser.add_argument("--no-grammar-cache", action="store_true",
+                                 help="Build the grammar of the 'pddl' library on every run, instead of caching its tables "
+                                      "in a private directory of the user ('~/.cache/parser-pddl').")
+    argument_parser.add_argument("--relevant-only", action="store_true",
+                                 help="Write only the actions and propositions relevant to the goal, and print the number "
+                                      "of actions left out.")
+    argument_parser.add_argument("--stats", action="store_true",
+                                 help="Print the time of each phase and the work counters of each problem, and write them "
+                                      "as JSON next to its output file ('<problem_name>.stats.json').")
+    argument_parser.add_argument("--track-memory", action="store_true",
+                                 help="With --stats, also measure the peak memory of each phase (much slower).")
+    arguments = argument_parser.parse_args()
+
+    domain_path = arguments.domain_path
+    problem_paths = expand_problem_paths(arguments.problem_paths, domain_path)
+    if len(problem_paths) == 0:
+        raise Exception("No problem files found in: " + " ".join(arguments.problem_paths))
+    output_dir = arguments.output_dir
+    memory_limit = arguments.memory_limit * 2**20 if arguments.memory_limit is not None else None
+
+    grammar_cache = not arguments.no_grammar_cache
+    domain = domain_path
+    if arguments.cache_dir is None:
+        # With a cache, the domain is only parsed if a problem is not found in it.
+        start = time.perf_counter()
+        domain = load_domain(domain_path, reader=arguments.reader, grammar_cache=grammar_cache)
+        domain_time = time.perf_counter() - start
+        print(f"domain {domain_path}: {domain_time:.3f}s")
+    removed_header = f" {'removed':>9}" if arguments.relevant_only else ""
+    print(f"{'problem':<40} {'parse(s)':>9} {'write(s)':>9} {'actions':>9}" + removed_header)
+
+    failures = 0
+    total_start = time.perf_counter()
+    for result in parse_many(domain, problem_paths, arguments.workers, output_dir, timeout=arguments.timeout,
+                             memory_limit=memory_limit, cache=arguments.cache_dir, streaming=arguments.streaming,
+                             reader=arguments.reader, relevant_only=arguments.relevant_only, grammar_cache=grammar_cache,
+                             stats=ParserStats(arguments.track_memory) if arguments.stats else None):
+        problem_name = os.path.basename(result.get_problem_path()).split(".")[0]
+        if not result.succeeded():
+            failures += 1
+            print(f"{problem_name:<40} failed: {result.get_error().splitlines()[0]}")
+            continue
+        removed = f" {result.num_irrelevant_actions:9d}" if arguments.relevant_only else ""
+        print(f"{problem_name:<40} {result.parse_time:9.3f} {result.write_time:9.3f} {result.num_actions:9d}" + removed)
+        if result.get_stats() is not None:
+            result.get_stats().write_json(os.path.join(output_dir, problem_name + ".stats.json"))
+            print("    " + result.get_stats().format().replace("\n", "\n    "))
+    total_time = time.perf_counter() - total_start
+    print(f"{len(problem_paths) - failures} of {len(problem_paths)} problems written to {output_dir} in {total_time:.3f}s")
+    if failures > 0:
+        sys.exit(1)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
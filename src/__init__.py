@@ -1,5 +1,19 @@
+from .version import __version__
+from .cache import *
+from .stats import *
 from .custom_types import *
+from .pddl_grammar import *
 from .domain import *
 from .problem import *
+from .reader import *
+from .proposition_space import *
+from .action_schema import *
 from .ground import *
-from .parser_pddl import *
\ No newline at end of file
+from .incremental_ground import *
+from .parallel_ground import *
+from .binary_format import *
+from .writer import *
+from .relevance import *
+from .vectors import *
+from .parser_pddl import *
+from .batch import *
\ No newline at end of file
@@ -0,0 +1,169 @@
+from .custom_types import Action, Object, Predicate, Proposition
+from .proposition_space import PropositionSpace
+from typing import Sequence
+
+class ActionSchema:
+    """Represents an action compiled against a proposition space, so that its ground propositions are computed arithmetically.
+
+    A binding assigns the global id of an object (see 'PropositionSpace.global_ids') to each parameter. The constants
+    mentioned by the action are appended to the binding, and every precondition and effect stores the positions, in the
+    extended binding, of its arguments.
+
+    Attributes:
+        action (Action): The compiled action.
+        index (int): The position of the action in the list of actions of the domain.
+        propositions (PropositionSpace): The space the action is compiled against.
+        parameter_types (list[str]): The type of each parameter.
+        constants (tuple[int, ...]): The global ids of the constants mentioned by the action.
+        preconditions (list[tuple[int, int, tuple[int, ...], bool]]): For each precondition, its relation id (see 'get_relation_id'),
+            predicate id in 'propositions' (-1 for static predicates not in the space), argument positions and value.
+        effects (list[list[tuple[int, tuple[int, ...], bool]]]): For each effect scenario, the predicate id, argument positions
+            and value of each effect.
+
+    Examples:
+        >>> relation_bases = get_relation_bases(propositions, domain.get_predicates())
+        >>> schemas = compile_actions(domain.get_actions(), propositions, relation_bases)
+        >>> schemas[0].ground_preconditions((0, 1))
+        [(4, True)]
+    """
+
+    def __init__(self, action: Action, index: int, propositions: PropositionSpace, relation_bases: dict[str, int]) -> None:
+        """Initializes an 'ActionSchema' object.
+
+        Args:
+            action (Action): The action to be compiled.
+            index (int): The position of the action in the list of actions of the domain.
+            propositions (PropositionSpace): The space of all propositions of the problem.
+            relation_bases (dict[str, int]): A map from predicate names to their predicate number (see 'get_relation_bases').
+        """
+        self.action = action
+        self.index = index
+        self.propositions = propositions
+        parameters = action.get_parameters()
+        self.parameter_types = [parameter.get_type() for parameter in parameters]
+        constants = []
+        self.preconditions = []
+        for generic_proposition, value in action.get_preconditions():
+            predicate_name = generic_proposition.get_predicate().get_name()
+            arguments = self.__compile_arguments(generic_proposition, parameters, constants)
+            predicate_id = propositions.predicate_ids.get(predicate_name, -1)
+            relation_id = get_relation_id(relation_bases[predicate_name], value)
+            self.preconditions.append((relation_id, predicate_id, arguments, bool(value)))
+        self.effects = []
+        for effect_scenario in action.get_effects():
+            scenario = []
+            for generic_proposition, value in effect_scenario:
+                predicate_id = propositions.predicate_ids[generic_proposition.get_predicate().get_name()]
+                arguments = self.__compile_arguments(generic_proposition, parameters, constants)
+                scenario.append((predicate_id, arguments, bool(value)))
+            self.effects.append(scenario)
+        self.constants = tuple(constants)
+
+    def __compile_arguments(self, generic_proposition: Proposition, parameters: list[Object],
+                            constants: list[int]) -> tuple[int, ...]:
+        """Maps the arguments of a generic proposition to positions in the extended binding.
+
+        Args:
+            generic_proposition (Proposition): The generic proposition of a precondition or effect.
+            parameters (list[Object]): The list of parameters of the action.
+            constants (list[int]): The global ids of the constants found so far; new constants are appended to it.
+
+        Returns:
+            tuple[int, ...]: The position of each argument in the extended binding.
+        """
+        parameter_positions = {parameter.get_name(): i for i, parameter in enumerate(parameters)}
+        arguments = []
+        for object in generic_proposition.get_objects():
+            position = parameter_positions.get(object.get_name())
+            if position is None:
+                global_id = self.propositions.global_ids[object.get_name()]
+                if global_id not in constants:
+                    constants.append(global_id)
+                position = len(parameters) + constants.index(global_id)
+            arguments.append(position)
+        return tuple(arguments)
+
+    def extend_binding(self, binding: Sequence[int]) -> tuple[int, ...]:
+        """Appends the global ids of the constants to a binding of the parameters."""
+        return tuple(binding) + self.constants
+
+    def resolve(self, predicate_id: int, arguments: tuple[int, ...], extended_binding: Sequence[int]) -> int:
+        """Computes the index of a ground proposition.
+
+        Args:
+            predicate_id (int): The predicate id of the proposition.
+            arguments (tuple[int, ...]): The argument positions in the extended binding.
+            extended_binding (Sequence[int]): The global ids of the parameters, followed by those of the constants.
+
+        Returns:
+            int: The index of the proposition, or -1 if it is not part of the space.
+        """
+        return self.propositions.encode_objects(predicate_id, [extended_binding[argument] for argument in arguments])
+
+    def ground_preconditions(self, binding: Sequence[int]) -> list[tuple[int, bool]]:
+        """Computes the (proposition index, value) pairs of the preconditions over predicates in the proposition space.
+
+        Args:
+            binding (Sequence[int]): The global ids of the objects assigned to the parameters.
+
+        Returns:
+            list[tuple[int, bool]]: The ground preconditions; those over static predicates not in the space are left out.
+        """
+        extended_binding = self.extend_binding(binding)
+        return [(self.resolve(predicate_id, arguments, extended_binding), value)
+                for _, predicate_id, arguments, value in self.preconditions if predicate_id != -1]
+
+    def ground_effects(self, binding: Sequence[int]) -> list[list[tuple[int, bool]]]:
+        """Computes the (proposition index, value) pairs of each effect scenario.
+
+        Args:
+            binding (Sequence[int]): The global ids of the objects assigned to the parameters.
+
+        Returns:
+            list[list[tuple[int, bool]]]: For each effect scenario, the list of ground effects.
+        """
+        extended_binding = self.extend_binding(binding)
+        return [[(self.resolve(predicate_id, arguments, extended_binding), value)
+                 for predicate_id, arguments, value in scenario] for scenario in self.effects]
+
+    def get_action(self) -> Action:
+        """Gets the compiled action."""
+        return self.action
+
+    def get_index(self) -> int:
+        """Gets the position of the action in the domain."""
+        return self.index
+
+def get_relation_bases(propositions: PropositionSpace, predicates: dict[str, Predicate]) -> dict[str, int]:
+    """Numbers the predicates, so that those in the proposition space keep their predicate ids.
+
+    Args:
+        propositions (PropositionSpace): The space of all propositions of the problem.
+        predicates (dict[str, Predicate]): A map from the names of all predicates of the domain to the 'Predicate' objects.
+
+    Returns:
+        dict[str, int]: A map from predicate names to predicate numbers; predicates outside the space come after the others.
+    """
+    relation_bases = dict(propositions.predicate_ids)
+    for name in predicates:
+        if name not in relation_bases:
+            relation_bases[name] = len(relation_bases)
+    return relation_bases
+
+def get_relation_id(predicate_number: int, value: bool) -> int:
+    """Combines a predicate number and a truth value into a relation id."""
+    return 2 * predicate_number + int(value)
+
+def compile_actions(actions: list[Action], propositions: PropositionSpace,
+                    relation_bases: dict[str, int]) -> list[ActionSchema]:
+    """Compiles every action of a domain against a proposition space.
+
+    Args:
+        actions (list[Action]): The list of actions of the domain.
+        propositions (PropositionSpace): The space of all propositions of the problem.
+        relation_bases (dict[str, int]): A map from predicate names to their predicate number (see 'get_relation_bases').
+
+    Returns:
+        list[ActionSchema]: The compiled actions, in the same order.
+    """
+    return [ActionSchema(action, index, propositions, relation_bases) for index, action in enumerate(actions)]
@@ -0,0 +1,215 @@
+from .domain import Domain, load_domain
+from .parser_pddl import Parser
+from .stats import ParserStats
+from typing import Iterator, Union
+import copy
+import os
+import signal
+import time
+
+class ProblemResult:
+    """Represents the outcome of parsing one problem of a batch (see 'parse_many').
+
+    Attributes:
+        problem_path (str): The file path to the PDDL problem definition.
+        output_path (Union[str, None]): The path of the output file written for the problem, or None if none was written.
+        parser (Union[Parser, None]): The parser of the problem, if it was requested and the problem was parsed; None otherwise.
+        num_propositions (int): The number of propositions of the problem (0 if it failed).
+        num_actions (int): The number of reachable actions of the problem (0 if it failed, or if it was parsed with the
+            'streaming' option of 'Parser' and no output file was written).
+        num_irrelevant_actions (int): The number of reachable actions left out of the output as irrelevant to the goal, if
+            the problem was parsed with the 'relevant_only' option of 'Parser' (0 otherwise).
+        parse_time (float): The time, in seconds, spent parsing and grounding the problem.
+        write_time (float): The time, in seconds, spent writing the output file, including the grounding with 'streaming'.
+        error (Union[str, None]): The description of the error that stopped the problem, or None if it succeeded.
+        stats (Union[ParserStats, None]): The instrumentation of the parser, if requested with the 'stats' option of 'Parser'.
+    """
+
+    def __init__(self, problem_path: str) -> None:
+        """Initializes a 'ProblemResult' object for a problem not processed yet.
+
+        Args:
+            problem_path (str): The file path to the PDDL problem definition.
+        """
+        self.problem_path = problem_path
+        self.output_path = None
+        self.parser = None
+        self.num_propositions = 0
+        self.num_actions = 0
+        self.num_irrelevant_actions = 0
+        self.parse_time = 0.0
+        self.write_time = 0.0
+        self.error = None
+        self.stats = None
+
+    def get_problem_path(self) -> str:
+        """Gets the file path to the problem."""
+        return self.problem_path
+
+    def get_output_path(self) -> Union[str, None]:
+        """Gets the path of the output file, or None if none was written."""
+        return self.output_path
+
+    def get_parser(self) -> Union[Parser, None]:
+        """Gets the parser of the problem, or None if it was not kept."""
+        return self.parser
+
+    def get_error(self) -> Union[str, None]:
+        """Gets the description of the error that stopped the problem, or None if it succeeded."""
+        return self.error
+
+    def get_stats(self) -> Union[ParserStats, None]:
+        """Gets the instrumentation of the parser, or None if it was not requested."""
+        return self.stats
+
+    def succeeded(self) -> bool:
+        """Checks whether the problem was processed without errors."""
+        return self.error is None
+
+def describe_error(error: BaseException) -> str:
+    """Describes an error by its type and message."""
+    message = str(error).strip()
+    return type(error).__name__ + (": " + message if message else "")
+
+def get_output_path(problem_path: str, output_dir: str) -> str:
+    """Gets the path of the output file of a problem: the file name up to its first dot, with the '.out' extension, in 'output_dir'."""
+    return os.path.join(output_dir, os.path.basename(problem_path).split(".")[0] + ".out")
+
+_domain = None
+
+def _raise_timeout(signal_number, frame) -> None:
+    """Signal handler that interrupts a problem that ran out of time."""
+    raise TimeoutError("time limit exceeded")
+
+def _init_worker(domain: Union[str, Domain], memory_limit: Union[int, None], timeout: Union[float, None]) -> None:
+    """Stores the shared domain (or its path) in a worker process, and applies the memory limit and the timeout handler to it."""
+    global _domain
+    _domain = domain
+    if memory_limit is not None:
+        import resource
+        _, hard_limit = resource.getrlimit(resource.RLIMIT_AS)
+        resource.setrlimit(resource.RLIMIT_AS, (memory_limit, hard_limit))
+    if timeout is not None:
+        signal.signal(signal.SIGALRM, _raise_timeout)
+
+def _parse_in_worker(problem_path: str, output_dir: Union[str, None], keep_parser: bool, timeout: Union[float, None],
+                     parser_options: dict) -> ProblemResult:
+    """Parses one problem in a worker process with its shared domain, keeping the domain once loaded (see '_parse_problem')."""
+    global _domain
+    result, _domain = _parse_problem(_domain, problem_path, output_dir, keep_parser, timeout, parser_options)
+    return result
+
+def _parse_problem(domain: Union[str, Domain], problem_path: str, output_dir: Union[str, None], keep_parser: bool,
+                   timeout: Union[float, None], parser_options: dict) -> tuple[ProblemResult, Union[str, Domain]]:
+    """Parses, grounds and writes one problem, catching any error into the result.
+
+    Returns:
+        ProblemResult: The result of the problem.
+        Union[str, Domain]: The domain to use for the next problems: if 'domain' is a path, the domain loaded by the parser
+            of this problem, or still the path if the parser failed.
+    """
+    result = ProblemResult(problem_path)
+    if timeout is not None:
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        start = time.perf_counter()
+        parser = Parser(domain, problem_path, **parser_options)
+        result.parse_time = time.perf_counter() - start
+        if not isinstance(domain, Domain):
+            domain = parser.domain
+        result.num_propositions = len(parser.get_propositions())
+        if output_dir is not None:
+            output_path = get_output_path(problem_path, output_dir)
+            start = time.perf_counter()
+            parser.print_bdds(output_path)
+            result.write_time = time.perf_counter() - start
+            result.output_path = output_path
+        result.num_actions = len(parser.get_registry())
+        if parser.relevant_only:
+            result.num_irrelevant_actions = parser.get_relevance().get_num_removed()
+        result.stats = parser.get_stats()
+        if keep_parser:
+            result.parser = parser
+    except Exception as error:
+        result.error = describe_error(error)
+    finally:
+        if timeout is not None:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+    return (result, domain)
+
+def parse_many(domain_path: Union[str, Domain], problem_paths: list[str], workers: Union[int, None] = None,
+               output_dir: Union[str, None] = None, keep_parsers: bool = False, timeout: Union[float, None] = None,
+               memory_limit: Union[int, None] = None, **parser_options) -> Iterator[ProblemResult]:
+    """Parses and grounds several problems of the same domain in a pool of worker processes, yielding each result as it finishes.
+
+    The domain is parsed once, in the calling process, and sent once to each worker, where it is shared by the parsers
+    of all the problems the worker takes. With a 'cache', the domain is only parsed by the first problem of each worker
+    that is not found in the cache, so that a batch of cached problems never parses it. With a single worker and
+    neither 'timeout' nor 'memory_limit', the problems are processed in the calling process, without starting any.
+
+    Args:
+        domain_path (Union[str, Domain]): The file path to the PDDL domain definition, or a 'Domain' object already built from it.
+        problem_paths (list[str]): The file paths to the PDDL problem definitions.
+        workers (Union[int, None]): The number of worker processes; the number of CPUs if None.
+        output_dir (Union[str, None]): The directory where the output of each problem is written (see 'get_output_path');
+            nothing is written if None.
+        keep_parsers (bool): Whether the 'Parser' object of each problem is sent back in its result. Defaults to False.
+        timeout (Union[float, None]): The time limit, in seconds, for each problem (Unix only, since it relies on
+            'signal.setitimer'); no limit if None.
+        memory_limit (Union[int, None]): The limit, in bytes, of the address space of each worker process (Unix only);
+            no limit if None.
+        **parser_options: Further keyword arguments of 'Parser', such as 'prune_static', 'grounding', 'reader' or
+            'grammar_cache' (the last two also apply to the domain, if given as a path).
+
+    Yields:
+        ProblemResult: The result of each problem, in the order they finish. A problem that fails, runs out of time or
+            runs out of memory gets a result with its error, and the others go on; if a worker process dies, the
+            problems it held get a 'BrokenProcessPool' error.
+
+    Raises:
+        ValueError: If 'workers' is lower than 1, or if 'timeout' or 'memory_limit' is set on a platform that does not
+            support it.
+
+    Examples:
+        >>> for result in parse_many("domain.pddl", ["p1.pddl", "p2.pddl"], workers=2, output_dir="output", timeout=60):
+        ...     print(result.get_problem_path(), result.get_error())
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError("the number of workers must be positive: " + str(workers))
+    if timeout is not None and not (hasattr(signal, "setitimer") and hasattr(signal, "SIGALRM")):
+        raise ValueError("a timeout needs 'signal.setitimer' and 'SIGALRM', which this platform does not provide")
+    if memory_limit is not None:
+        try:
+            import resource
+        except ImportError:
+            raise ValueError("a memory limit needs the 'resource' module, which this platform does not provide") from None
+    domain = domain_path
+    if not isinstance(domain, Domain) and parser_options.get("cache") is None:
+        domain = load_domain(domain, reader=parser_options.get("reader", "pddl"),
+                             grammar_cache=parser_options.get("grammar_cache", True))
+    if output_dir is not None:
+        os.makedirs(output_dir, exist_ok=True)
+
+    if workers == 1 and timeout is None and memory_limit is None:
+        for problem_path in problem_paths:
+            # Each problem gets its own copy of the options, as the worker processes do when they receive them.
+            result, domain = _parse_problem(domain, problem_path, output_dir, keep_parsers, None,
+                                            copy.deepcopy(parser_options))
+            yield result
+        return
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+    executor = ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(domain, memory_limit, timeout))
+    try:
+        futures = {executor.submit(_parse_in_worker, problem_path, output_dir, keep_parsers, timeout, parser_options): problem_path
+                   for problem_path in problem_paths}
+        for future in as_completed(futures):
+            try:
+                result = future.result()
+            except Exception as error:
+                result = ProblemResult(futures[future])
+                result.error = describe_error(error)
+            yield result
+    finally:
+        executor.shutdown(cancel_futures=True)
\ No newline at end of file
@@ -0,0 +1,361 @@
+from array import array
+from typing import BinaryIO, Iterable, Iterator, TextIO, Union
+import mmap
+import os
+import struct
+import sys
+
+BINARY_MAGIC = b"PDDLBDD\0"
+BINARY_VERSION = 1
+HEADER = struct.Struct("<8s7I")
+
+class BinaryBdds:
+    """Represents a problem serialized in the binary format, read without copying its arrays.
+
+    The binary format holds the same content as the text format written by 'Parser.print_bdds'. It is composed of a
+    header, followed by little-endian int32 arrays and a string table:
+
+    - Header: the magic bytes 'PDDLBDD\\0', the format version, the number of propositions, goal entries, actions and
+      reachable propositions, the length of the action data and the length of the string table.
+    - String offsets: the offset of each string (problem name, proposition names, action names) in the string table,
+      followed by the length of the table.
+    - Initial state: the value of each proposition.
+    - Goal state: the (proposition index, value) pairs of the goal, flattened.
+    - Action offsets: the offset of the data of each action, followed by the length of the action data.
+    - Action data: for each action, the number of preconditions and their flattened (index, value) pairs, followed by
+      the number of effect scenarios and, for each scenario, the number of effects and their flattened pairs. As in the
+      text format, an empty scenario (or an action without effects) is written with the preconditions as effects.
+    - Reachable propositions: the indices of the reachable propositions.
+    - String table: the UTF-8 encoded strings, concatenated.
+
+    Attributes:
+        buffer (Union[bytes, mmap.mmap]): The serialized problem.
+        num_propositions (int): The number of propositions.
+        num_actions (int): The number of reachable actions.
+        initial_state (memoryview): The value of each proposition at the initial state.
+        goal_state (memoryview): The flattened (proposition index, value) pairs of the goal.
+        action_offsets (memoryview): The offset of the data of each action in 'action_data'.
+        action_data (memoryview): The preconditions and effects of the actions.
+        reachable_propositions (memoryview): The indices of the reachable propositions.
+
+    Examples:
+        >>> with BinaryBdds("parser_output.bin") as bdds:
+        ...     bdds.get_preconditions(0)
+        [(17, 1)]
+    """
+
+    def __init__(self, source: Union[str, os.PathLike, bytes, bytearray]) -> None:
+        """Initializes a 'BinaryBdds' object.
+
+        Args:
+            source (Union[str, os.PathLike, bytes, bytearray]): The path of a binary file, which is memory-mapped, or the
+                serialized problem itself.
+
+        Raises:
+            ValueError: If the source is not in the binary format, or its version is not supported.
+        """
+        self.__file = None
+        self.__views = []
+        if isinstance(source, (str, os.PathLike)):
+            self.__file = open(source, "rb")
+        try:
+            if self.__file is not None:
+                self.buffer = mmap.mmap(self.__file.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                self.buffer = source
+            self.__view = memoryview(self.buffer)
+            self.__views.append(self.__view)
+            if len(self.__view) < HEADER.size:
+                raise ValueError("not a binary problem: truncated header")
+            (magic, version, self.num_propositions, num_goal, self.num_actions, num_reachable,
+             action_data_length, strings_length) = HEADER.unpack_from(self.__view, 0)
+            if magic != BINARY_MAGIC:
+                raise ValueError("not a binary problem: bad magic bytes")
+            if version != BINARY_VERSION:
+                raise ValueError("unsupported binary problem version: " + str(version))
+
+            num_strings = 1 + self.num_propositions + self.num_actions
+            offset = HEADER.size
+            self.__string_offsets, offset = self.__int_array(offset, num_strings + 1)
+            self.initial_state, offset = self.__int_array(offset, self.num_propositions)
+            self.goal_state, offset = self.__int_array(offset, 2 * num_goal)
+            self.action_offsets, offset = self.__int_array(offset, self.num_actions + 1)
+            self.action_data, offset = self.__int_array(offset, action_data_length)
+            self.reachable_propositions, offset = self.__int_array(offset, num_reachable)
+            self.__strings = self.__view[offset:offset + strings_length]
+            self.__views.append(self.__strings)
+        except BaseException:
+            self.close()
+            raise
+
+    def __int_array(self, offset: int, length: int) -> tuple[memoryview, int]:
+        """Gets a view of the int32 array of the given length at the given byte offset, and the offset after it."""
+        end = offset + 4 * length
+        view = self.__view[offset:end]
+        if sys.byteorder == "little":
+            view = view.cast("i")
+        else:
+            swapped = array("i", view.tobytes())
+            swapped.byteswap()
+            view = memoryview(swapped)
+        self.__views.append(view)
+        return view, end
+
+    def __enter__(self) -> 'BinaryBdds':
+        return self
+
+    def __exit__(self, *exception) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Releases the views and, if the problem was read from a file, unmaps and closes it."""
+        for view in reversed(self.__views):
+            view.release()
+        self.__views = []
+        if self.__file is not None:
+            if isinstance(getattr(self, "buffer", None), mmap.mmap):
+                self.buffer.close()
+            self.__file.close()
+            self.__file = None
+
+    def __get_string(self, position: int) -> str:
+        """Decodes the string at the given position of the string table."""
+        return bytes(self.__strings[self.__string_offsets[position]:self.__string_offsets[position + 1]]).decode("utf-8")
+
+    def get_problem_name(self) -> str:
+        """Gets the problem name."""
+        return self.__get_string(0)
+
+    def get_proposition_name(self, index: int) -> str:
+        """Gets the name of the proposition with the given index."""
+        return self.__get_string(1 + index)
+
+    def get_action_name(self, position: int) -> str:
+        """Gets the name of the reachable action at the given position."""
+        return self.__get_string(1 + self.num_propositions + position)
+
+    def __read_atoms(self, offset: int) -> tuple[list[tuple[int, int]], int]:
+        """Reads a list of (proposition index, value) pairs, preceded by its length, returning it and the offset after it."""
+        data = self.action_data
+        length = data[offset]
+        atoms = [(data[i], data[i + 1]) for i in range(offset + 1, offset + 1 + 2 * length, 2)]
+        return atoms, offset + 1 + 2 * length
+
+    def get_preconditions(self, position: int) -> list[tuple[int, int]]:
+        """Gets the (proposition index, value) pairs of the preconditions of the reachable action at the given position."""
+        return self.__read_atoms(self.action_offsets[position])[0]
+
+    def get_effects(self, position: int) -> list[list[tuple[int, int]]]:
+        """Gets the (proposition index, value) pairs of each effect scenario of the reachable action at the given position."""
+        _, offset = self.__read_atoms(self.action_offsets[position])
+        num_scenarios = self.action_data[offset]
+        offset += 1
+        effects = []
+        for _ in range(num_scenarios):
+            scenario, offset = self.__read_atoms(offset)
+            effects.append(scenario)
+        return effects
+
+    def get_goal_state(self) -> list[tuple[int, int]]:
+        """Gets the (proposition index, value) pairs of the goal."""
+        goal = self.goal_state
+        return [(goal[i], goal[i + 1]) for i in range(0, len(goal), 2)]
+
+    def iter_blocks(self) -> Iterator[str]:
+        """Generates the content in the text format, as blocks of lines without the final line terminator (see 'BddsWriter')."""
+        yield "begin_problem_name\n" + self.get_problem_name() + "\nend_problem_name"
+        yield "begin_propositions\n" + str(self.num_propositions)
+        for i in range(self.num_propositions):
+            yield self.get_proposition_name(i) + " " + str(i)
+        yield "end_propositions"
+        yield "begin_initial_state\n" + str(self.num_propositions)
+        yield "\n".join([f"{i} {value}" for i, value in enumerate(self.initial_state)] + ["end_initial_state"])
+        yield "\n".join(["begin_goal_state"] + [f"{i} {value}" for i, value in self.get_goal_state()] + ["end_goal_state"])
+        yield "begin_actions\n" + str(self.num_actions)
+        for position in range(self.num_actions):
+            lines = ["begin_action", self.get_action_name(position), "preconditions",
+                     format_atoms(self.get_preconditions(position)), "begin_nd_effects"]
+            effects = self.get_effects(position)
+            lines.append(str(len(effects)))
+            for effect_scenario in effects:
+                lines.append("effects")
+                lines.append(format_atoms(effect_scenario))
+            lines.append("end_nd_effects\nend_action")
+            yield "\n".join(lines)
+        yield "end_actions"
+        reachable = [str(i) for i in self.reachable_propositions]
+        yield "\n".join(["begin_reachable_propositions", str(len(reachable))] + reachable + ["end_reachable_propositions"])
+
+def format_atoms(atoms: Iterable[tuple[int, int]]) -> str:
+    """Formats (proposition index, value) pairs in the text format, one per line, preceded by their number."""
+    lines = [f"{index} {int(value)}" for index, value in atoms]
+    return "\n".join([str(len(lines))] + lines)
+
+def pack_bdds(output: Union[str, os.PathLike, BinaryIO], problem_name: str, proposition_names: Iterable[str],
+              initial_state: list[int], goal_state: Iterable[tuple[int, int]],
+              actions: Iterable[tuple[str, list[tuple[int, int]], list[list[tuple[int, int]]]]],
+              reachable_propositions: Iterable[int]) -> None:
+    """Writes a problem in the binary format (see 'BinaryBdds').
+
+    Args:
+        output (Union[str, os.PathLike, BinaryIO]): The path of the output file, or a binary stream open for writing.
+        problem_name (str): The name of the problem.
+        proposition_names (Iterable[str]): The names of the propositions, in index order.
+        initial_state (list[int]): The value of each proposition at the initial state.
+        goal_state (Iterable[tuple[int, int]]): The (proposition index, value) pairs of the goal.
+        actions (Iterable[tuple[str, list[tuple[int, int]], list[list[tuple[int, int]]]]]): The name, the preconditions
+            and the effect scenarios of each reachable action, as written in the text format.
+        reachable_propositions (Iterable[int]): The indices of the reachable propositions.
+    """
+    strings = bytearray(problem_name.encode("utf-8"))
+    string_offsets = array("i", [0, len(strings)])
+    for name in proposition_names:
+        strings += name.encode("utf-8")
+        string_offsets.append(len(strings))
+    num_propositions = len(string_offsets) - 2
+
+    goal = array("i")
+    for index, value in goal_state:
+        goal.append(index)
+        goal.append(value)
+
+    action_offsets = array("i", [0])
+    action_data = array("i")
+    for name, preconditions, effects in actions:
+        strings += name.encode("utf-8")
+        string_offsets.append(len(strings))
+        pack_atoms(action_data, preconditions)
+        action_data.append(len(effects))
+        for effect_scenario in effects:
+            pack_atoms(action_data, effect_scenario)
+        action_offsets.append(len(action_data))
+    num_actions = len(action_offsets) - 1
+
+    initial = array("i", initial_state)
+    reachable = array("i", reachable_propositions)
+    header = HEADER.pack(BINARY_MAGIC, BINARY_VERSION, num_propositions, len(goal) // 2, num_actions, len(reachable),
+                         len(action_data), len(strings))
+    sections = [string_offsets, initial, goal, action_offsets, action_data, reachable]
+    if sys.byteorder != "little":
+        for section in sections:
+            section.byteswap()
+
+    if isinstance(output, (str, os.PathLike)):
+        with open(output, "wb") as output_file:
+            write_sections(output_file, header, sections, strings)
+    else:
+        write_sections(output, header, sections, strings)
+
+def pack_atoms(data: array, atoms: list[tuple[int, int]]) -> None:
+    """Appends (proposition index, value) pairs to an int32 array, preceded by their number."""
+    data.append(len(atoms))
+    for index, value in atoms:
+        data.append(index)
+        data.append(int(value))
+
+def write_sections(output_file: BinaryIO, header: bytes, sections: list[array], strings: bytearray) -> None:
+    """Writes the header, the int32 arrays and the string table to a binary stream."""
+    output_file.write(header)
+    for section in sections:
+        output_file.write(section.tobytes())
+    output_file.write(strings)
+
+def read_text_bdds(source: Union[str, os.PathLike, TextIO]) -> tuple:
+    """Reads a problem in the text format written by 'Parser.print_bdds'.
+
+    Args:
+        source (Union[str, os.PathLike, TextIO]): The path of the text file, or a text stream open for reading.
+
+    Returns:
+        tuple: The arguments of 'pack_bdds' after 'output', i.e., the problem name, the proposition names, the initial
+            state, the goal pairs, the (name, preconditions, effects) triples of the actions and the reachable propositions.
+
+    Raises:
+        ValueError: If the text is not in the expected format.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        with open(source) as source_file:
+            lines = source_file.read().split("\n")
+    else:
+        lines = source.read().split("\n")
+    position = 0
+
+    def next_line() -> str:
+        nonlocal position
+        if position >= len(lines):
+            raise ValueError("unexpected end of the text problem")
+        position += 1
+        return lines[position - 1]
+
+    def expect(tag: str) -> None:
+        line = next_line()
+        if line != tag:
+            raise ValueError("expected '" + tag + "' at line " + str(position) + ", found '" + line + "'")
+
+    def read_atoms() -> list[tuple[int, int]]:
+        atoms = []
+        for _ in range(int(next_line())):
+            index, value = next_line().split()
+            atoms.append((int(index), int(value)))
+        return atoms
+
+    expect("begin_problem_name")
+    problem_name = next_line()
+    expect("end_problem_name")
+    expect("begin_propositions")
+    proposition_names = [next_line().rsplit(" ", 1)[0] for _ in range(int(next_line()))]
+    expect("end_propositions")
+    expect("begin_initial_state")
+    initial_state = [int(next_line().split()[1]) for _ in range(int(next_line()))]
+    expect("end_initial_state")
+    expect("begin_goal_state")
+    goal_state = []
+    line = next_line()
+    while line != "end_goal_state":
+        index, value = line.split()
+        goal_state.append((int(index), int(value)))
+        line = next_line()
+    expect("begin_actions")
+    actions = []
+    for _ in range(int(next_line())):
+        expect("begin_action")
+        name = next_line()
+        expect("preconditions")
+        preconditions = read_atoms()
+        expect("begin_nd_effects")
+        effects = []
+        for _ in range(int(next_line())):
+            expect("effects")
+            effects.append(read_atoms())
+        expect("end_nd_effects")
+        expect("end_action")
+        actions.append((name, preconditions, effects))
+    expect("end_actions")
+    expect("begin_reachable_propositions")
+    reachable_propositions = [int(next_line()) for _ in range(int(next_line()))]
+    expect("end_reachable_propositions")
+    return (problem_name, proposition_names, initial_state, goal_state, actions, reachable_propositions)
+
+def text_to_binary(source: Union[str, os.PathLike, TextIO], output: Union[str, os.PathLike, BinaryIO]) -> None:
+    """Converts a problem from the text format to the binary format.
+
+    Args:
+        source (Union[str, os.PathLike, TextIO]): The path of the text file, or a text stream open for reading.
+        output (Union[str, os.PathLike, BinaryIO]): The path of the binary file, or a binary stream open for writing.
+    """
+    pack_bdds(output, *read_text_bdds(source))
+
+def binary_to_text(source: Union[str, os.PathLike, bytes, bytearray], output: Union[str, os.PathLike, TextIO]) -> None:
+    """Converts a problem from the binary format to the text format.
+
+    Args:
+        source (Union[str, os.PathLike, bytes, bytearray]): The path of the binary file, or the serialized problem.
+        output (Union[str, os.PathLike, TextIO]): The path of the text file, or a text stream open for writing.
+    """
+    with BinaryBdds(source) as bdds:
+        text = "\n".join(bdds.iter_blocks())
+    if isinstance(output, (str, os.PathLike)):
+        with open(output, "w") as output_file:
+            output_file.write(text)
+    else:
+        output.write(text)
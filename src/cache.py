@@ -0,0 +1,146 @@
+from .version import __version__
+from typing import Union
+import hashlib
+import os
+import pickle
+
+CACHE_FORMAT = 2
+
+def file_digest(path: Union[str, os.PathLike]) -> str:
+    """Computes the SHA-256 digest of the contents of a file, as a hexadecimal string."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as source:
+        for block in iter(lambda: source.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+class ParseCache:
+    """Represents a persistent cache of parsed and grounded problems, stored as one file per entry in a directory.
+
+    An entry is keyed by the digests of the domain and problem files, the version of the package, the format of the
+    stored state ('CACHE_FORMAT') and the options that change the result (see 'get_key'); editing a file, or upgrading
+    the package, simply leads to a different key. The
+    size of the directory is bounded by evicting the least recently used entries, the last use of an entry being the
+    modification time of its file.
+
+    Attributes:
+        directory (str): The directory of the cache, which is created if needed.
+        max_size (int): The maximum total size, in bytes, of the entries kept in the directory.
+        hits (int): The number of entries found by 'load'.
+        misses (int): The number of entries looked up by 'load' and not found.
+
+    Note:
+        Entries are pickled, so the directory must not be writable by untrusted users.
+
+    Examples:
+        >>> cache = ParseCache(".pddl_cache", max_size=2**30)
+        >>> parser = Parser("tests/examples/gripper3.pddl", "tests/examples/gripper3_3_balls.pddl", cache=cache)
+    """
+
+    def __init__(self, directory: Union[str, os.PathLike], max_size: int = 2**30) -> None:
+        """Initializes a 'ParseCache' object.
+
+        Args:
+            directory (Union[str, os.PathLike]): The directory of the cache, which is created if needed.
+            max_size (int): The maximum total size, in bytes, of the entries kept in the directory. Defaults to 1 GiB.
+        """
+        self.directory = os.fspath(directory)
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(self.directory, exist_ok=True)
+
+    def get_key(self, domain_digest: str, problem_digest: str, **options) -> str:
+        """Builds the key of an entry.
+
+        Args:
+            domain_digest (str): The digest of the domain file (see 'file_digest').
+            problem_digest (str): The digest of the problem file.
+            **options: The options that change the stored result, such as 'prune_static'.
+
+        Returns:
+            str: The hexadecimal SHA-256 digest of the digests, the package version, the format and the options.
+        """
+        parts = [__version__, str(CACHE_FORMAT), domain_digest, problem_digest]
+        parts += [name + "=" + repr(options[name]) for name in sorted(options)]
+        return hashlib.sha256("\0".join(parts).encode()).hexdigest()
+
+    def get_path(self, key: str) -> str:
+        """Gets the path of the file of an entry."""
+        return os.path.join(self.directory, key + ".pickle")
+
+    def load(self, key: str) -> Union[dict, None]:
+        """Loads an entry, marking it as recently used.
+
+        Args:
+            key (str): The key of the entry (see 'get_key').
+
+        Returns:
+            Union[dict, None]: The stored state, or None if there is no entry for the key, or it cannot be read.
+        """
+        path = self.get_path(key)
+        try:
+            with open(path, 'rb') as entry_file:
+                state = pickle.load(entry_file)
+            os.utime(path)
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return state
+
+    def store(self, key: str, state: dict) -> None:
+        """Stores an entry, then evicts the least recently used entries if the cache is over its size.
+
+        Args:
+            key (str): The key of the entry (see 'get_key').
+            state (dict): The state to be stored, which must be picklable.
+
+        Note:
+            The entry is written to a temporary file which is then renamed, so concurrent readers never see a partial entry.
+        """
+        import tempfile
+        descriptor, temporary_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(descriptor, 'wb') as entry_file:
+                pickle.dump(state, entry_file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temporary_path, self.get_path(key))
+        except BaseException:
+            os.remove(temporary_path)
+            raise
+        self.evict()
+
+    def evict(self) -> None:
+        """Removes the least recently used entries until the total size of the entries is at most 'max_size'."""
+        entries = []
+        total_size = 0
+        with os.scandir(self.directory) as directory_entries:
+            for entry in directory_entries:
+                if entry.name.endswith(".pickle"):
+                    entry_stat = entry.stat()
+                    entries.append((entry_stat.st_mtime, entry.path, entry_stat.st_size))
+                    total_size += entry_stat.st_size
+        entries.sort()
+        for _, path, size in entries:
+            if total_size <= self.max_size:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total_size -= size
+
+    def clear(self) -> None:
+        """Removes every entry of the cache."""
+        with os.scandir(self.directory) as directory_entries:
+            for entry in directory_entries:
+                if entry.name.endswith(".pickle"):
+                    os.remove(entry.path)
+
+    def get_hits(self) -> int:
+        """Gets the number of entries found by 'load'."""
+        return self.hits
+
+    def get_misses(self) -> int:
+        """Gets the number of entries not found by 'load'."""
+        return self.misses
\ No newline at end of file
@@ -1,6 +1,13 @@
+from typing import Sequence
+import weakref
+
 class Object:
     """Represents a PDDL object.
 
+    Objects are interned: building an object with the name and type of one that is still alive returns that same
+    instance, so that the domain, the problem and every action share a single instance per object. Objects must
+    therefore not be modified.
+
     Attributes:
         name (str): A descriptive name for the object.
         type (str): The type of the object.
@@ -8,17 +15,32 @@ class Object:
     Examples:
         >>> rooma = Object("rooma", "room")
         >>> ball1 = Object("ball1", "ball")
+        >>> Object("rooma", "room") is rooma
+        True
     """
 
-    def __init__(self, name: str, type: str) -> None:
-        """Initializes an 'Object' object.
+    __slots__ = ("name", "type", "__weakref__")
+
+    _instances = weakref.WeakValueDictionary()
+
+    def __new__(cls, name: str, type: str) -> 'Object':
+        """Gets the 'Object' instance with the given name and type, building it if there is none.
 
         Args:
             name (str): The name of the object.
             type (str): The type of the object.
         """
-        self.name = name
-        self.type = type
+        object = cls._instances.get((name, type))
+        if object is None:
+            object = super().__new__(cls)
+            object.name = name
+            object.type = type
+            object = cls._instances.setdefault((name, type), object)
+        return object
+
+    def __getnewargs__(self) -> tuple[str, str]:
+        """Gets the arguments of '__new__', so that unpickled objects are interned too."""
+        return (self.name, self.type)
     
     def __eq__(self, other: 'Object') -> bool:
         """Compares this object to another lexicographically, based on name.
@@ -71,24 +93,41 @@ class Object:
 class Predicate:
     """Represents a PDDL Predicate.
 
+    Predicates are interned like objects (see 'Object'): building a predicate with the name and variable types of one
+    that is still alive returns that same instance.
+
     Attributes:
         name (str): A descriptive name for the predicate.
-        variable_types (list[str]): The list of variable types of the predicate.
+        variable_types (tuple[str, ...]): The variable types of the predicate.
 
     Examples:
         >>> at_robby = Predicate("at-robby", [ "room" ])
         >>> at_ball = Predicate("at-ball", [ "ball", "room" ])
     """
 
-    def __init__(self, name: str, variable_types: list[str] = []) -> None:
-        """Initiliazes a 'Predicate' object.
+    __slots__ = ("name", "variable_types", "__weakref__")
+
+    _instances = weakref.WeakValueDictionary()
+
+    def __new__(cls, name: str, variable_types: Sequence[str] = ()) -> 'Predicate':
+        """Gets the 'Predicate' instance with the given name and variable types, building it if there is none.
 
         Args:
             name (str): The name of the predicate.
-            variable_types (list[str]): The list of variable types.
+            variable_types (Sequence[str]): The variable types.
         """
-        self.name = name
-        self.variable_types = variable_types[:]
+        variable_types = tuple(variable_types)
+        predicate = cls._instances.get((name, variable_types))
+        if predicate is None:
+            predicate = super().__new__(cls)
+            predicate.name = name
+            predicate.variable_types = variable_types
+            predicate = cls._instances.setdefault((name, variable_types), predicate)
+        return predicate
+
+    def __getnewargs__(self) -> tuple[str, tuple[str, ...]]:
+        """Gets the arguments of '__new__', so that unpickled predicates are interned too."""
+        return (self.name, self.variable_types)
 
     def __str__(self) -> str:
         """Provides a string representation for the predicates.
@@ -96,7 +135,7 @@ class Predicate:
         Returns:
             str: The name of the predicate besides its variable types list.
         """
-        output = self.name + " " + str(self.variable_types)
+        output = self.name + " " + str(list(self.variable_types))
         return output
 
     def __eq__(self, other: 'Predicate') -> bool:
@@ -124,7 +163,7 @@ class Predicate:
         """Gets the predicate's name."""
         return self.name
 
-    def get_variable_types(self) -> list[str]:
+    def get_variable_types(self) -> tuple[str, ...]:
         """Gets the variable types"""
         return self.variable_types
 
@@ -132,9 +171,9 @@ class Proposition:
     """Represents a PDDL Proposition, which is an instantiated predicate.
 
     Attributes:
-        name (str): A descriptive name for the proposition.
+        name (str): A descriptive name for the proposition, built the first time it is needed.
         predicate (Predicate): The predicate corresponding to the proposition.
-        objects (list[Object]): The list of (instantiated) objects corresponding to the proposition.
+        objects (tuple[Object, ...]): The (instantiated) objects corresponding to the proposition.
         index (int): An index associated with the proposition.
 
     Examples:
@@ -142,18 +181,28 @@ class Proposition:
         >>> objects = [ Object("ball1", "ball"), Object("rooma", "room") ]
         >>> at_ball_ball1_rooma = Proposition(at_ball, objects, 0)
     """
-    def __init__(self, predicate: Predicate, objects: list[Object], index: int = -1) -> None:
+
+    __slots__ = ("predicate", "objects", "index", "_name")
+
+    def __init__(self, predicate: Predicate, objects: Sequence[Object], index: int = -1) -> None:
         """Initializes a 'Proposition' object
 
         Args:
             predicate (Predicate): The predicate corresponding to the proposition.
-            objects (list[Objects]): The list of (instantiated) objects.
+            objects (Sequence[Object]): The (instantiated) objects.
             index (int): An index associated with the proposition.
         """
         self.predicate = predicate
-        self.objects = objects[:]
-        self.name = self.__build_proposition_name()
+        self.objects = tuple(objects)
         self.index = index
+        self._name = None
+
+    @property
+    def name(self) -> str:
+        """The name of the proposition, built on first access."""
+        if self._name is None:
+            self._name = self.__build_proposition_name()
+        return self._name
 
     def __str__(self) -> str:
         """Provides a string representation for propositions.
@@ -178,11 +227,7 @@ class Proposition:
 
     def __build_proposition_name(self) -> str:
         """Builds a proposition name by combining the predicate name and object names."""
-        names = ""
-        for object in self.objects:
-            names += "_" + object.get_name()
-        names = self.predicate.get_name() + names
-        return names
+        return "_".join([self.predicate.get_name()] + [object.get_name() for object in self.objects])
 
     def compare_names(self, prop_name: str) -> bool:
         """Compare the name of the proposition with the strings 'prop_name'.
@@ -201,7 +246,7 @@ class Proposition:
         """Gets predicate."""
         return self.predicate
 
-    def get_objects(self) -> list[Object]:
+    def get_objects(self) -> tuple[Object, ...]:
         """Gets objects."""
         return self.objects
 
@@ -221,6 +266,9 @@ class Action:
         preconditions (list[(Proposition, bool)]): A list of tuples, with a proposition and its corresponding (boolean) value.
         effects (list[list[(Proposition, bool)]]): A list of effects; each effect is a list of propositions and their corresponding values.
     """
+
+    __slots__ = ("name", "parameters", "preconditions", "effects")
+
     def __init__(self, name: str, parameters: list[Object], preconditions: list[tuple[Proposition, bool]],
                     effects: list[list[tuple[Proposition, bool]]]) -> None:
         """Initializes an 'Action' object.
@@ -1,5 +1,9 @@
 from .custom_types import Object, Predicate, Action, Proposition
+from .cache import file_digest
+from .pddl_grammar import parse_pddl_domain, get_plain_name
+from collections import OrderedDict
 from typing import Union
+import threading
 
 class Domain:
     """Represents a PDDL domain.
@@ -9,10 +13,15 @@ class Domain:
         predicates (dict[str, Predicate]): A map from the names of the predicates to the 'Predicate' objects.
         actions (list[Action]): A list of actions.
         pred_to_actions (dict[Predicate, list[Action]]): A dictionary mapping predicates to lists of actions that have those predicates in their preconditions.
+        static_predicates (dict[str, Predicate]): The predicates that do not appear in the effects of any action, whose truth values never change.
+        fluent_predicates (dict[str, Predicate]): The predicates that appear in the effects of some action.
+        source_digest (Union[str, None]): The digest of the domain file (see 'file_digest'), if the domain was built by
+            'load_domain'; None otherwise.
 
     Examples:
         >>> parsed_domain = parse_domain("tests/examples/gripper3.pddl")
         >>> domain = Domain(parsed_domain)
+        >>> domain = read_domain("tests/examples/gripper3.pddl")
     """
 
     def __init__(self, parsed_domain) -> None:
@@ -23,6 +32,29 @@ class Domain:
         self.constants = self.__store_constants(parsed_domain)
         self.predicates = self.__store_predicates(parsed_domain)
         self.actions, self.pred_to_actions = self.__store_actions(parsed_domain, self.predicates)
+        self.static_predicates, self.fluent_predicates = self.__classify_predicates(self.predicates, self.actions)
+        self.source_digest = None
+
+    @classmethod
+    def from_elements(cls, constants: dict[str, list[Object]], predicates: dict[str, Predicate],
+                      actions: list[Action]) -> 'Domain':
+        """Builds a 'Domain' object from its constants, predicates and actions, already built (see 'read_domain').
+
+        Args:
+            constants (dict[str, list[Object]]): A map from types to the 'Object' objects of the constants.
+            predicates (dict[str, Predicate]): A map from the names of the predicates to the 'Predicate' objects.
+            actions (list[Action]): The actions of the domain.
+        """
+        domain = cls.__new__(cls)
+        domain.constants = constants
+        domain.predicates = predicates
+        domain.actions = actions
+        domain.pred_to_actions = {}
+        for action in actions:
+            domain.pred_to_actions = domain.__store_actions_by_preconditions(action, domain.pred_to_actions)
+        domain.static_predicates, domain.fluent_predicates = domain.__classify_predicates(predicates, actions)
+        domain.source_digest = None
+        return domain
 
     def __store_actions(self, parsed_domain,
                             stored_predicates: dict[str, Predicate]) -> tuple[list[Action], dict[Predicate, list[Action]]]:
@@ -55,13 +87,13 @@ class Domain:
         Returns:
             Action: The instantiated action.
         """
-        action_name = parsed_action.name
+        action_name = get_plain_name(parsed_action.name)
         parameters = self.__process_action_parameters(parsed_action)
         preconditions = self.__store_preconditions_of_action(parsed_action, stored_predicates)
         all_possible_effects = []
         action_effect = parsed_action.effect
         self.__store_effects_of_action(action_effect, stored_predicates, all_possible_effects)
-        effects = self.__merge_effects(all_possible_effects)
+        effects = merge_effects(all_possible_effects)
         action = Action(action_name, parameters, preconditions, effects)
         return action
 
@@ -90,7 +122,7 @@ class Domain:
         Returns:
             Object: The instantiated object.
         """
-        object_name = parsed_object.name
+        object_name = get_plain_name(parsed_object.name)
         object_type = str(next(iter(parsed_object.type_tags)))
         object = Object(object_name, object_type)
         return object
@@ -168,34 +200,6 @@ class Domain:
             for possible_effect in action_effects.operands:
                 self.__store_effects_of_action(possible_effect, stored_predicates, all_possible_effects)
 
-    def __merge_effects(self,
-                        all_possible_effects: list[Union[list[tuple[Proposition, bool]], tuple[Proposition, bool]]]) -> list[list[tuple[Proposition, bool]]]:
-        """Combines deterministic and non-deterministic effects to a list of possible outcome scenarios.
-
-        Args:
-            all_possible_effects (list[list[(Proposition, bool)] or (Proposition, bool)]): A list containing both deterministic effects (represented as tuples) and non-deterministic effects (represented as lists of tuples).
-
-        Returns:
-            list[list[tuple[Proposition, bool]]]: A list of lists, where each inner list represents one possible combination of effects after the action. Deterministic effects are included in every outcome scenario.
-
-        Note:
-            This function assumes that non-deterministic effects have at most one level of alternative outcomes (i.e., no nested "OneOf" effects). This simplifies the merging process and limits the "depth" of potential effect combinations.
-        """
-        deterministic_effects = []
-        non_deterministic_effects = []
-        for effect in all_possible_effects:
-            if type(effect) == list:
-                for effect_scenario in effect:
-                    non_deterministic_effects.append(effect_scenario)
-            else:
-                deterministic_effects.append(effect)
-        if(len(non_deterministic_effects) == 0):
-            return [deterministic_effects]
-        effects = []
-        for effect in non_deterministic_effects:
-            effects.append(effect + deterministic_effects)
-        return effects
-
     def __store_one_effect_or_precondition_predicate(self, pred, stored_predicates: dict[str, Predicate]) -> tuple[Proposition, bool]:
         """Builds a tuple (Proposition, bool) representing a single effect or precondition.
 
@@ -246,7 +250,7 @@ class Domain:
             constant_type = str(next(iter(parsed_constant.type_tags)))
             if constant_type not in dict_const:
                 dict_const[constant_type] = []
-            constant_name = parsed_constant.name
+            constant_name = get_plain_name(parsed_constant.name)
             constant = Object(constant_name, constant_type)
             dict_const[constant_type].append(constant)
         return dict_const
@@ -265,10 +269,36 @@ class Domain:
             variable_types = []
             for object in predicate.terms:
                 variable_types.append(str(next(iter(object.type_tags))))
-            predicate_object = Predicate(predicate.name, variable_types)
-            predicates[predicate.name] = predicate_object
+            predicate_name = get_plain_name(predicate.name)
+            predicates[predicate_name] = Predicate(predicate_name, variable_types)
         return predicates
 
+    def __classify_predicates(self, stored_predicates: dict[str, Predicate],
+                                actions: list[Action]) -> tuple[dict[str, Predicate], dict[str, Predicate]]:
+        """Splits the predicates into static ones, which no action can modify, and fluent ones.
+
+        Args:
+            stored_predicates (dict[str, Predicate]): A map from predicate names to 'Predicate' objects.
+            actions (list[Action]): The list of actions of the domain.
+
+        Returns:
+            dict[str, Predicate]: A map from the names of the static predicates to the 'Predicate' objects.
+            dict[str, Predicate]: A map from the names of the fluent predicates to the 'Predicate' objects.
+        """
+        modified_predicates = set()
+        for action in actions:
+            for effect_scenario in action.get_effects():
+                for proposition, _ in effect_scenario:
+                    modified_predicates.add(proposition.get_predicate().get_name())
+        static_predicates = {}
+        fluent_predicates = {}
+        for name, predicate in stored_predicates.items():
+            if name in modified_predicates:
+                fluent_predicates[name] = predicate
+            else:
+                static_predicates[name] = predicate
+        return static_predicates, fluent_predicates
+
     def get_constants(self) -> dict[str, list[Object]]:
         """Gets name-to-Object mapping for domain constants."""
         return self.constants
@@ -283,4 +313,163 @@ class Domain:
 
     def get_pred_to_actions(self) -> dict[Predicate, list[Action]]:
         """Gets Predicate-to-actions mapping."""
-        return self.pred_to_actions
\ No newline at end of file
+        return self.pred_to_actions
+
+    def get_static_predicates(self) -> dict[str, Predicate]:
+        """Gets name-to-Predicate mapping for static predicates."""
+        return self.static_predicates
+
+    def get_fluent_predicates(self) -> dict[str, Predicate]:
+        """Gets name-to-Predicate mapping for fluent predicates."""
+        return self.fluent_predicates
+
+def merge_effects(all_possible_effects: list[Union[list[tuple[Proposition, bool]], tuple[Proposition, bool]]]) -> list[list[tuple[Proposition, bool]]]:
+    """Combines deterministic and non-deterministic effects to a list of possible outcome scenarios.
+
+    Args:
+        all_possible_effects (list[list[(Proposition, bool)] or (Proposition, bool)]): A list containing both deterministic effects (represented as tuples) and non-deterministic effects (represented as lists of tuples).
+
+    Returns:
+        list[list[tuple[Proposition, bool]]]: A list of lists, where each inner list represents one possible combination of effects after the action. Deterministic effects are included in every outcome scenario.
+
+    Note:
+        This function assumes that non-deterministic effects have at most one level of alternative outcomes (i.e., no nested "OneOf" effects). This simplifies the merging process and limits the "depth" of potential effect combinations.
+    """
+    deterministic_effects = []
+    non_deterministic_effects = []
+    for effect in all_possible_effects:
+        if type(effect) == list:
+            for effect_scenario in effect:
+                non_deterministic_effects.append(effect_scenario)
+        else:
+            deterministic_effects.append(effect)
+    if(len(non_deterministic_effects) == 0):
+        return [deterministic_effects]
+    effects = []
+    for effect in non_deterministic_effects:
+        effects.append(effect + deterministic_effects)
+    return effects
+
+def load_domain(domain_path: str, source_digest: Union[str, None] = None, reader: str = "pddl",
+                grammar_cache: Union[bool, str] = True) -> Domain:
+    """Parses a PDDL domain file and builds the corresponding 'Domain' object.
+
+    Args:
+        domain_path (str): The file path to the PDDL domain definition.
+        source_digest (Union[str, None]): The digest of the file (see 'file_digest'), if already computed. Defaults to None.
+        reader (str): The reader of the file: "pddl" for the 'pddl' library, or "builtin" for 'read_domain', which falls
+            back to the 'pddl' library if the domain is outside the subset it supports. Defaults to "pddl".
+        grammar_cache (Union[bool, str]): The cache of the grammar tables of the 'pddl' library (see 'get_pddl_parser').
+            Defaults to True.
+
+    Returns:
+        Domain: The domain, which can be shared by the parsers of several problems.
+
+    Raises:
+        ValueError: If 'reader' is neither "pddl" nor "builtin".
+    """
+    if reader not in ("pddl", "builtin"):
+        raise ValueError("unknown reader: " + str(reader))
+    domain = None
+    if reader == "builtin":
+        from .reader import read_domain
+        try:
+            domain = read_domain(domain_path)
+        except ValueError:
+            pass
+    if domain is None:
+        domain = Domain(parse_pddl_domain(domain_path, grammar_cache))
+    domain.source_digest = source_digest if source_digest is not None else file_digest(domain_path)
+    return domain
+
+class DomainRegistry:
+    """Represents a thread-safe, size-bounded cache of 'Domain' objects, keyed by the digest of their domain file.
+
+    A domain is built once per distinct file contents and handed out to every caller asking for it, so that the parsers
+    of many problems share it; a file that changes gets a new digest, hence a new domain. When the registry is full, the
+    least recently used domain is dropped.
+
+    Attributes:
+        max_size (int): The maximum number of domains kept.
+        domains (OrderedDict[str, Domain]): A map from file digests to domains, from the least to the most recently used.
+        hits (int): The number of requests served by a domain already in the registry.
+        misses (int): The number of requests that required building a domain.
+        lock (threading.Lock): The lock that guards 'domains' and the counters.
+
+    Note:
+        The domains handed out are shared, and must be treated as read-only; 'Parser' never modifies its domain.
+        Two threads missing the same domain at once may both build it, but only the first one stored is handed out.
+
+    Examples:
+        >>> registry = get_domain_registry()
+        >>> parser = Parser(registry.get("tests/examples/gripper3.pddl"), "tests/examples/gripper3_3_balls.pddl")
+        >>> registry.get_hits(), registry.get_misses()
+        (0, 1)
+    """
+
+    def __init__(self, max_size: int = 32) -> None:
+        """Initializes an empty 'DomainRegistry' object.
+
+        Args:
+            max_size (int): The maximum number of domains kept. Defaults to 32.
+
+        Raises:
+            ValueError: If 'max_size' is lower than 1.
+        """
+        if max_size < 1:
+            raise ValueError("the size of the registry must be positive: " + str(max_size))
+        self.max_size = max_size
+        self.domains = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Gets the number of domains kept."""
+        return len(self.domains)
+
+    def get(self, domain_path: str) -> Domain:
+        """Gets the domain of a file, building it if the registry does not hold a domain with the same file digest.
+
+        Args:
+            domain_path (str): The file path to the PDDL domain definition.
+
+        Returns:
+            Domain: The shared domain of the file.
+        """
+        digest = file_digest(domain_path)
+        with self.lock:
+            domain = self.domains.get(digest)
+            if domain is not None:
+                self.domains.move_to_end(digest)
+                self.hits += 1
+                return domain
+            self.misses += 1
+        domain = load_domain(domain_path, digest)
+        with self.lock:
+            stored_domain = self.domains.setdefault(digest, domain)
+            self.domains.move_to_end(digest)
+            while len(self.domains) > self.max_size:
+                self.domains.popitem(last=False)
+        return stored_domain
+
+    def clear(self) -> None:
+        """Drops every domain and resets the counters."""
+        with self.lock:
+            self.domains.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def get_hits(self) -> int:
+        """Gets the number of requests served by a domain already in the registry."""
+        return self.hits
+
+    def get_misses(self) -> int:
+        """Gets the number of requests that required building a domain."""
+        return self.misses
+
+_domain_registry = DomainRegistry()
+
+def get_domain_registry() -> DomainRegistry:
+    """Gets the registry of domains shared by the whole process."""
+    return _domain_registry
\ No newline at end of file
@@ -1,68 +1,158 @@
-from .custom_types import Proposition, Action, Predicate, Object
+from .custom_types import Action, Object
+from .proposition_space import PropositionSpace
+from .action_schema import ActionSchema, get_relation_id
+from array import array
 from collections import deque
-from typing import Union
+from collections.abc import Sequence
+from typing import Iterable, Iterator, Union
 import itertools
 
-def create_reached_list(initial_state: list[int]) -> list[int]:
+def get_literal_id(proposition_index: int, proposition_value: int, num_propositions: int) -> int:
+    """Gets the literal id of a (proposition, value) pair: the proposition index i for (P, True) and n + i for (P, False).
+
+    The literal id of a pair is also its position in the reached list (see 'create_reached_list').
+    """
+    return proposition_index if proposition_value else proposition_index + num_propositions
+
+def get_literal_pair(literal_id: int, num_propositions: int) -> tuple[int, int]:
+    """Gets the proposition index and the truth value (1 for true, 0 for false) of a literal id (see 'get_literal_id')."""
+    if literal_id < num_propositions:
+        return (literal_id, 1)
+    return (literal_id - num_propositions, 0)
+
+def create_reached_list(initial_state: list[int]) -> array:
     """Creates the list of reached propositions at the initial state.
 
     Args:
         initial_state (list[int]): The bitmask representing the initial truth values of propositions (1 for true, 0 for false).
 
     Returns:
-        list[int]: The list indicating whether a proposition is reached or not; for those reached, the value is 0; otherwise, value is -1.
+        array: An array of signed bytes indicating whether a proposition is reached or not; for those reached, the value is 0; otherwise, value is -1.
 
     Note:
         Each proposition P has an index i; the i-th entry of the returned list correspond to the tuple (P, True), and the (n + i)-th entry to the tuple (P, False).
+        Each entry takes a single byte, so the list can be shared with other processes or written to disk as it is.
     """
     n = len(initial_state)
-    reached = [-1 for _ in range(2 * n)]
-    for i in range(n):
-        if initial_state[i] == 0:
+    reached = array("b", [-1]) * (2 * n)
+    for i, value in enumerate(initial_state):
+        if value == 0:
             reached[i + n] = 0
-        elif initial_state[i] == 1:
+        elif value == 1:
             reached[i] = 0
     return reached
 
-def store_initial_queue(initial_state: list[int], propositions: list[Proposition]) -> deque[tuple[Proposition, int]]:
-    """Enqueue the pairs composed by the propositions and their respective truth values at the initial state.
+def extend_reached_list(reached: array, initial_state: list[int]) -> array:
+    """Builds the list of reached propositions of a space with propositions appended, keeping the entries of the others.
+
+    Args:
+        reached (array): The list of reached propositions of the first propositions (see 'create_reached_list').
+        initial_state (list[int]): The initial state of all propositions, the appended ones included.
+
+    Returns:
+        array: A new list, where the pairs of the appended propositions are reached (0) if they are initial, and not (-1)
+            otherwise; since the (P, False) pairs come after all the (P, True) pairs, the entries of the others are moved.
+    """
+    num_previous = len(reached) // 2
+    num_added = len(initial_state) - num_previous
+    added_true = array("b", [-1]) * num_added
+    added_false = array("b", [-1]) * num_added
+    for position, value in enumerate(itertools.islice(initial_state, num_previous, None)):
+        if value == 1:
+            added_true[position] = 0
+        elif value == 0:
+            added_false[position] = 0
+    return reached[:num_previous] + added_true + reached[num_previous:] + added_false
+
+class ReachedView(Sequence):
+    """Read-only view of a reached list (see 'create_reached_list'), which behaves as a list of ints.
+
+    Entries are 1 for the reachable (proposition, value) pairs and -1 for the others; the i-th entry corresponds to
+    (P, True) and the (n + i)-th entry to (P, False). The view compares equal to any sequence with the same entries.
+
+    Attributes:
+        reached (array): The array of signed bytes holding the entries.
+
+    Examples:
+        >>> parser.reachable_propositions.count(1)
+        42
+        >>> parser.reachable_propositions[:3]
+        [1, -1, 1]
+    """
+
+    def __init__(self, reached: array) -> None:
+        """Initializes a 'ReachedView' object.
+
+        Args:
+            reached (array): The array of signed bytes holding the entries.
+        """
+        self.reached = reached
+
+    def __len__(self) -> int:
+        """Gets the number of entries, i.e., twice the number of propositions."""
+        return len(self.reached)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[int, list[int]]:
+        """Gets an entry, or a list with the entries of a slice."""
+        if isinstance(index, slice):
+            return self.reached[index].tolist()
+        return self.reached[index]
+
+    def __iter__(self) -> Iterator[int]:
+        """Iterates over the entries."""
+        return iter(self.reached)
+
+    def __eq__(self, other: object) -> bool:
+        """Checks whether another sequence has the same entries."""
+        if isinstance(other, ReachedView):
+            return self.reached == other.reached
+        if isinstance(other, Sequence):
+            return len(self.reached) == len(other) and self.reached.tolist() == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        """Represents the view as the list of its entries."""
+        return repr(self.reached.tolist())
+
+    def count(self, value: int) -> int:
+        """Counts the entries equal to a value."""
+        return self.reached.count(value)
+
+    def get_array(self) -> array:
+        """Gets the array of signed bytes holding the entries, which must not be modified."""
+        return self.reached
+
+def store_initial_queue(initial_state: list[int]) -> deque[int]:
+    """Enqueue the literal ids (see 'get_literal_id') of the propositions and their respective truth values at the initial state.
 
     Args:
         initial_state (list[int]): The bitmask representing the initial truth values of propositions (1 for true, 0 for false).
-        propositions (list[Proposition]): The list of all possible propositions in the domain.
 
     Returns:
-        deque[tuple[Proposition, int]]: A queue with the tuples corresponding to the initial state.
+        deque[int]: A queue with the literal ids corresponding to the initial state, in proposition order.
     """
-    frontier_queue = deque([])
-    for i in range(len(initial_state)):
-        frontier_queue.appendleft((propositions[i], initial_state[i]))
-    return frontier_queue
+    num_propositions = len(initial_state)
+    return deque(get_literal_id(i, value, num_propositions) for i, value in enumerate(initial_state) if value != -1)
 
-def get_element_from_frontier(frontier_queue: deque[tuple[Proposition, int]]) -> tuple[Proposition, int, int]:
-    """Pops and returns the front element from the frontier queue along with its proposition's index.
+def get_element_from_frontier(frontier_queue: deque[int]) -> int:
+    """Pops and returns the front element from the frontier queue.
 
     Args:
-        frontier_queue (deque[tuple[Proposition, int]]): A queue of (proposition, truth value) pairs representing propositions at the frontier. A proposition reaches the frontier if it lies in the effects list of a reachable action (see definition elsewhere).
+        frontier_queue (deque[int]): A queue of the literal ids (see 'get_literal_id') of the (proposition, truth value)
+            pairs at the frontier. A proposition reaches the frontier if it lies in the effects list of a reachable action
+            (see definition elsewhere).
 
     Returns:
-        tuple[Proposition, int, int]: A tuple containing:
-            - The popped proposition
-            - Its corresponding truth value (1 for true, 0 for false)
-            - The index associated with the proposition
+        int: The literal id of the popped (proposition, truth value) pair.
     """
-    reached_tuple = frontier_queue.pop()
-    proposition = reached_tuple[0]
-    value = reached_tuple[1]
-    index = proposition.get_index()
-    return (proposition, value, index)
+    return frontier_queue.popleft()
 
-def add_proposition_to_reached(reached_list: list[int], proposition_value: int,
+def add_proposition_to_reached(reached_list: array, proposition_value: int,
                                 proposition_index: int, num_propositions: int) -> None:
     """Assigns value 1 to the entry of the list of reached (valued) propositions corresponding to the valued proposition.
 
     Args:
-        reached_list (list[int]): The list reached propositions.
+        reached_list (array): The list reached propositions.
         proposition_value (int): The truth value of the proposition (1 for true, 0 for false).
         proposition_index (int): The index corresponding to the proposition.
         num_propositions (int): The total number of propositions.
@@ -75,185 +165,779 @@ def add_proposition_to_reached(reached_list: list[int], proposition_value: int,
     else:
         reached_list[proposition_index] = 1
 
-def find_reached_predicate_in_preconditions(preconditions: list[tuple[Proposition, int]],
-                                            predicate: Predicate, value: int) -> Union[tuple[Proposition, int], None]:
-    """Among all the preconditions of an action, finds the one (if one exists) that has a proposition whose predicate is the desired one.
+class ReachedAtoms:
+    """Index of the reached (proposition, value) pairs, by relation and by argument position.
+
+    A relation is a (predicate, value) pair, identified by its relation id (see 'get_relation_id'), and a reached
+    proposition is stored as the tuple of the global ids of its objects, along with the layer in which it was reached.
+
+    Attributes:
+        atoms (dict[int, list[tuple[int, ...]]]): A map from relation ids to the objects of the reached propositions.
+        by_argument (dict[tuple[int, int, int], list[tuple[int, ...]]]): A map from (relation id, argument position, object id)
+            tuples to the objects of the reached propositions having that object at that position.
+        members (dict[tuple[int, tuple[int, ...]], int]): A map from the reached (relation id, objects) pairs to their layer.
+    """
+
+    def __init__(self) -> None:
+        """Initializes an empty 'ReachedAtoms' object."""
+        self.atoms = {}
+        self.by_argument = {}
+        self.members = {}
+
+    def add(self, relation_id: int, objects: tuple[int, ...], layer: int = 0) -> None:
+        """Indexes a reached (proposition, value) pair.
+
+        Args:
+            relation_id (int): The relation id of the predicate and value reached.
+            objects (tuple[int, ...]): The global ids of the objects of the proposition.
+            layer (int): The layer in which the pair was reached. Defaults to 0.
+        """
+        member = (relation_id, objects)
+        if member in self.members:
+            return
+        self.members[member] = layer
+        self.atoms.setdefault(relation_id, []).append(objects)
+        for position, object in enumerate(objects):
+            self.by_argument.setdefault((relation_id, position, object), []).append(objects)
+
+    def discard(self, members: Iterable[tuple[int, tuple[int, ...]]]) -> None:
+        """Removes some reached (relation id, objects) pairs from the index, filtering each list they are in once.
+
+        Args:
+            members (Iterable[tuple[int, tuple[int, ...]]]): The (relation id, objects) pairs to remove; those not in the
+                index are ignored.
+        """
+        relation_ids = set()
+        argument_keys = set()
+        for relation_id, objects in members:
+            if self.members.pop((relation_id, objects), None) is None:
+                continue
+            relation_ids.add(relation_id)
+            argument_keys.update((relation_id, position, object) for position, object in enumerate(objects))
+        for relation_id in relation_ids:
+            self.atoms[relation_id] = [objects for objects in self.atoms[relation_id]
+                                       if (relation_id, objects) in self.members]
+        for key in argument_keys:
+            self.by_argument[key] = [objects for objects in self.by_argument[key] if (key[0], objects) in self.members]
+
+    def contains(self, relation_id: int, objects: tuple[int, ...], before_layer: Union[int, None] = None) -> bool:
+        """Checks whether a (proposition, value) pair has been reached (before 'before_layer', if given)."""
+        layer = self.members.get((relation_id, objects))
+        if layer is None:
+            return False
+        return before_layer is None or layer < before_layer
+
+    def candidates(self, relation_id: int, bound_arguments: list[tuple[int, int]],
+                   before_layer: Union[int, None] = None) -> list[tuple[int, ...]]:
+        """Gets the reached propositions of a relation consistent with some bound arguments, using the most selective bound position.
+
+        Args:
+            relation_id (int): The relation id of the predicate and value.
+            bound_arguments (list[tuple[int, int]]): The (argument position, object id) pairs already fixed.
+            before_layer (Union[int, None]): If given, only the propositions reached in earlier layers are returned.
+
+        Returns:
+            list[tuple[int, ...]]: The objects of the reached propositions; they match at least one of the bound arguments.
+        """
+        best = self.atoms.get(relation_id, [])
+        for position, object in bound_arguments:
+            bucket = self.by_argument.get((relation_id, position, object), [])
+            if len(bucket) < len(best):
+                best = bucket
+        if before_layer is not None:
+            members = self.members
+            best = [objects for objects in best if members[(relation_id, objects)] < before_layer]
+        return best
+
+class GroundActionRegistry:
+    """Registry of instantiated actions, which keeps each instantiation once, in the order it was first added.
+
+    An instantiation is identified by the index of its action schema and the global ids of the objects assigned to its
+    parameters. Its ground preconditions and effects are resolved once, when it is registered, and kept for the output
+    stage and the analyses of the reachable actions.
+
+    Attributes:
+        entries (list[tuple[ActionSchema, tuple[int, ...]]]): The registered (schema, parameters) pairs, in insertion order.
+        preconditions (list[list[tuple[int, bool]]]): The ground preconditions of each registered instantiation (see
+            'ActionSchema.ground_preconditions').
+        effects (list[list[list[tuple[int, bool]]]]): The ground effects of each registered instantiation (see 'ActionSchema.ground_effects').
+        keys (set[tuple[int, tuple[int, ...]]]): The (schema index, parameters) keys of the registered instantiations.
+        duplicates (int): The number of attempts to add an instantiation already registered.
+        keep_actions (bool): Whether 'entries', 'preconditions' and 'effects' are kept; otherwise, only the keys are, which is enough to skip
+            duplicates when the actions are consumed as they are generated (see 'iter_ground').
+
+    Examples:
+        >>> registry = GroundActionRegistry()
+        >>> registry.add(schemas[0], (0, 1))
+        [[(4, True), (2, False)]]
+        >>> registry.add(schemas[0], (0, 1)) is None
+        True
+    """
+
+    def __init__(self, keep_actions: bool = True) -> None:
+        """Initializes an empty 'GroundActionRegistry' object.
+
+        Args:
+            keep_actions (bool): Whether the registered instantiations, their preconditions and their effects are kept.
+                Defaults to True.
+        """
+        self.entries = []
+        self.preconditions = []
+        self.effects = []
+        self.keys = set()
+        self.duplicates = 0
+        self.keep_actions = keep_actions
+
+    def __len__(self) -> int:
+        """Gets the number of registered instantiations."""
+        return len(self.keys)
+
+    def __contains__(self, key: tuple[int, tuple[int, ...]]) -> bool:
+        """Checks whether the instantiation with the given (schema index, parameters) key is registered."""
+        return key in self.keys
+
+    def __iter__(self) -> Iterator[tuple[ActionSchema, tuple[int, ...]]]:
+        """Iterates over the registered (schema, parameters) pairs, in insertion order."""
+        return iter(self.entries)
+
+    def add(self, schema: ActionSchema, parameters: tuple[int, ...]) -> Union[list[list[tuple[int, bool]]], None]:
+        """Registers an instantiation, unless it is already registered.
+
+        Args:
+            schema (ActionSchema): The compiled action.
+            parameters (tuple[int, ...]): The global ids of the objects assigned to the parameters.
+
+        Returns:
+            Union[list[list[tuple[int, bool]]], None]: The ground effects of the instantiation if it is new; None if it was
+                already registered, in which case the duplicate is counted.
+        """
+        key = (schema.get_index(), parameters)
+        if key in self.keys:
+            self.duplicates += 1
+            return None
+        self.keys.add(key)
+        effects = schema.ground_effects(parameters)
+        if self.keep_actions:
+            self.entries.append((schema, parameters))
+            self.preconditions.append(schema.ground_preconditions(parameters))
+            self.effects.append(effects)
+        return effects
+
+    def discard(self, keys: set[tuple[int, tuple[int, ...]]]) -> None:
+        """Unregisters some instantiations, keeping the others in their order.
+
+        Args:
+            keys (set[tuple[int, tuple[int, ...]]]): The (schema index, parameters) keys of the instantiations to remove;
+                those not registered are ignored.
+        """
+        if len(keys) == 0:
+            return
+        self.keys -= keys
+        kept = [position for position, (schema, parameters) in enumerate(self.entries)
+                if (schema.get_index(), parameters) not in keys]
+        self.entries = [self.entries[position] for position in kept]
+        self.preconditions = [self.preconditions[position] for position in kept]
+        self.effects = [self.effects[position] for position in kept]
+
+    def get_actions(self, object_list: list[Object], start: int = 0) -> list[tuple[Action, tuple[Object]]]:
+        """Gets the registered instantiations as (action, objects) pairs, in insertion order.
+
+        Args:
+            object_list (list[Object]): The objects, indexed by global id (see 'PropositionSpace.object_list').
+            start (int): The position of the first instantiation returned. Defaults to 0.
+        """
+        return [(schema.get_action(), tuple(object_list[object] for object in parameters))
+                for schema, parameters in itertools.islice(self.entries, start, None)]
+
+    def get_preconditions(self, position: int) -> list[tuple[int, bool]]:
+        """Gets the ground preconditions of the instantiation registered at the given position."""
+        return self.preconditions[position]
+
+    def get_effects(self, position: int) -> list[list[tuple[int, bool]]]:
+        """Gets the ground effects of the instantiation registered at the given position."""
+        return self.effects[position]
+
+    def get_duplicates(self) -> int:
+        """Gets the number of duplicate instantiations that were skipped."""
+        return self.duplicates
+
+class GroundingCounters:
+    """Counters of the work done by a grounding engine.
+
+    Attributes:
+        queue_pushes (int): The number of (proposition, value) pairs pushed to the frontier (or to the delta of a layer).
+        queue_pops (int): The number of (proposition, value) pairs popped from the frontier (or joined as part of a delta).
+        triggers (int): The number of partial bindings started, from a reached pair matching a precondition, or for an
+            action without preconditions over the proposition space.
+        candidates (int): The number of candidate bindings enumerated while joining preconditions and completing bindings.
+        rejected (int): The number of candidate bindings rejected as inconsistent, or for failing a negative static precondition.
+    """
+
+    def __init__(self) -> None:
+        """Initializes a 'GroundingCounters' object with every counter at zero."""
+        self.queue_pushes = 0
+        self.queue_pops = 0
+        self.triggers = 0
+        self.candidates = 0
+        self.rejected = 0
+
+    def merge(self, other: 'GroundingCounters') -> None:
+        """Adds the counters of another 'GroundingCounters' object to these."""
+        for name, value in vars(other).items():
+            setattr(self, name, getattr(self, name) + value)
+
+    def as_dict(self) -> dict[str, int]:
+        """Gets a map from the names of the counters to their values."""
+        return dict(vars(self))
+
+def bind_arguments(schema: ActionSchema, arguments: tuple[int, ...], objects: tuple[int, ...],
+                   binding: list[int]) -> Union[list[int], None]:
+    """Extends a partial binding so that a precondition matches the given objects.
 
     Args:
-        preconditions (list[tuple[Proposition, int]]): The list of preconditions of an action.
-        predicate (Predicate): The predicate we're looking for in the propositions of the preconditions.
-        value (int): The truth value of the proposition (1 for true, 0 for false).
+        schema (ActionSchema): The compiled action.
+        arguments (tuple[int, ...]): The argument positions of the precondition in the extended binding.
+        objects (tuple[int, ...]): The global ids of the objects of a reached proposition.
+        binding (list[int]): The extended binding, with -1 for the parameters not assigned yet.
 
     Returns:
-        Union[tuple[Proposition, int], None]: returns the matching precondition, or None if not found.
+        Union[list[int], None]: The extended binding, or None if it would be inconsistent, i.e., a parameter would get
+            two objects, an object would be assigned to two parameters, or its type would not match.
     """
-    for precondition in preconditions:
-        if predicate == precondition[0].get_predicate() and value == precondition[1]:
-            return precondition
-    return None
+    num_parameters = len(schema.parameter_types)
+    object_types = schema.propositions.object_types
+    new_binding = binding
+    for argument, object in zip(arguments, objects):
+        bound = new_binding[argument]
+        if bound == -1:
+            if object in new_binding[:num_parameters] or object_types[object] != schema.parameter_types[argument]:
+                return None
+            if new_binding is binding:
+                new_binding = binding[:]
+            new_binding[argument] = object
+        elif bound != object:
+            return None
+    return new_binding
+
+def get_bound_arguments(arguments: tuple[int, ...], binding: list[int]) -> list[tuple[int, int]]:
+    """Gets the (argument position, object id) pairs of a precondition that are fixed by a partial binding."""
+    return [(position, binding[argument]) for position, argument in enumerate(arguments) if binding[argument] != -1]
+
+def join_preconditions(schema: ActionSchema, binding: list[int], pending: list[int],
+                       reached_atoms: ReachedAtoms, static_relations: set[int],
+                       layer_bounds: Union[dict[int, int], None] = None,
+                       counters: Union[GroundingCounters, None] = None) -> Iterator[tuple[int, ...]]:
+    """Enumerates the bindings of an action consistent with a partial binding and the reached propositions.
+
+    The pending preconditions are joined one at a time, always picking the most selective one, i.e., the one with the
+    fewest reached propositions consistent with the current binding. Only consistent bindings are extended.
 
-def get_action_parameters_and_preconditions(action: Action) -> tuple[list[tuple[Proposition, bool]], list[Object]]:
-    """Retrieves the preconditions and parameters of an action.
+    Args:
+        schema (ActionSchema): The compiled action being instantiated.
+        binding (list[int]): The extended binding, with -1 for the parameters not assigned yet.
+        pending (list[int]): The positions of the preconditions still to be joined.
+        reached_atoms (ReachedAtoms): The index of reached propositions (including the static facts of the initial state).
+        static_relations (set[int]): The relation ids of the negative preconditions over static predicates not in the space.
+        layer_bounds (Union[dict[int, int], None]): A map from precondition positions to the layer before which their
+            propositions must have been reached; preconditions not in it may match any reached proposition.
+        counters (Union[GroundingCounters, None]): If given, the candidate and rejected bindings are counted in it.
+
+    Yields:
+        tuple[int, ...]: The global ids of the objects assigned to the parameters, for which every precondition is reached.
+    """
+    if layer_bounds is None:
+        layer_bounds = {}
+    best_position = None
+    best_candidates = None
+    for pending_position in pending:
+        relation_id, _, arguments, _ = schema.preconditions[pending_position]
+        if relation_id in static_relations:
+            continue
+        bound_arguments = get_bound_arguments(arguments, binding)
+        before_layer = layer_bounds.get(pending_position)
+        if len(bound_arguments) == len(arguments):
+            objects = tuple(object for _, object in bound_arguments)
+            candidates = [objects] if reached_atoms.contains(relation_id, objects, before_layer) else []
+        else:
+            candidates = reached_atoms.candidates(relation_id, bound_arguments, before_layer)
+        if best_candidates is None or len(candidates) < len(best_candidates):
+            best_position, best_candidates = pending_position, candidates
+            if len(candidates) == 0:
+                return
+
+    if best_position is None:
+        yield from complete_binding(schema, binding, pending, reached_atoms, counters)
+        return
+
+    remaining = [pending_position for pending_position in pending if pending_position != best_position]
+    arguments = schema.preconditions[best_position][2]
+    rejected = 0
+    for objects in best_candidates:
+        new_binding = bind_arguments(schema, arguments, objects, binding)
+        if new_binding is not None:
+            yield from join_preconditions(schema, new_binding, remaining, reached_atoms, static_relations, layer_bounds,
+                                          counters)
+        else:
+            rejected += 1
+    if counters is not None:
+        counters.candidates += len(best_candidates)
+        counters.rejected += rejected
+
+def complete_binding(schema: ActionSchema, binding: list[int], pending: list[int],
+                     reached_atoms: ReachedAtoms, counters: Union[GroundingCounters, None] = None) -> Iterator[tuple[int, ...]]:
+    """Assigns objects to the parameters not fixed by any joined precondition, and checks the negative static preconditions.
 
     Args:
-        action (Action): The action object.
+        schema (ActionSchema): The compiled action being instantiated.
+        binding (list[int]): The extended binding, with -1 for the parameters not assigned yet.
+        pending (list[int]): The positions of the (negative, static) preconditions not joined.
+        reached_atoms (ReachedAtoms): The index of reached propositions (including the static facts of the initial state).
+        counters (Union[GroundingCounters, None]): If given, the candidate and rejected bindings are counted in it.
+
+    Yields:
+        tuple[int, ...]: The global ids of the objects assigned to the parameters, for which every precondition holds.
+    """
+    num_parameters = len(schema.parameter_types)
+    type_domains = schema.propositions.type_domains
+    choices = []
+    for position, parameter_type in enumerate(schema.parameter_types):
+        if binding[position] != -1:
+            choices.append([binding[position]])
+        else:
+            choices.append(type_domains.get(parameter_type, []))
+
+    num_candidates = 0
+    rejected = 0
+    for parameters in itertools.product(*choices):
+        num_candidates += 1
+        if len(set(parameters)) != num_parameters:
+            rejected += 1
+            continue
+        extended_binding = parameters + tuple(binding[num_parameters:])
+        satisfied = True
+        for pending_position in pending:
+            relation_id, _, arguments, _ = schema.preconditions[pending_position]
+            objects = tuple(extended_binding[argument] for argument in arguments)
+            if reached_atoms.contains(relation_id ^ 1, objects):
+                satisfied = False
+                break
+        if satisfied:
+            yield parameters
+        else:
+            rejected += 1
+    if counters is not None:
+        counters.candidates += num_candidates
+        counters.rejected += rejected
 
-    Returns:
-        tuple[list[tuple[Proposition, bool]], list[Object]]: A tuple containing:
-            - A list of preconditions, where each precondition is a tuple of a Proposition and its truth value (True or False).
-            - A list of objects representing the parameters required for the action.
+def index_static_facts(reached_atoms: ReachedAtoms, static_facts: dict[str, set[tuple[str, ...]]],
+                       propositions: PropositionSpace, relation_bases: dict[str, int]) -> None:
+    """Adds the static facts of the initial state to the index of reached propositions, as true propositions.
+
+    Args:
+        reached_atoms (ReachedAtoms): The index of reached propositions.
+        static_facts (dict[str, set[tuple[str, ...]]]): A map from the names of the static predicates to the
+            object names of their facts that hold in the initial state.
+        propositions (PropositionSpace): The space of all propositions in the domain.
+        relation_bases (dict[str, int]): A map from predicate names to their predicate number (see 'get_relation_bases').
     """
-    preconditions = action.get_preconditions()
-    parameters = action.get_parameters()
-    return (preconditions, parameters)
+    global_ids = propositions.global_ids
+    for predicate_name, facts in static_facts.items():
+        relation_id = get_relation_id(relation_bases[predicate_name], True)
+        for object_names in facts:
+            if all(name in global_ids for name in object_names):
+                reached_atoms.add(relation_id, tuple(global_ids[name] for name in object_names))
 
-def get_parameters_combinations(parameters: list[Object], fixed_object: dict[Object, list[Object]],
-                                dict_objects: dict[str, list[Object]]) -> list[tuple[Object]]:
-    """Generates all unique combinations of objects that can be assigned to a set of parameters.
+def get_static_relations(static_facts: Union[dict[str, set[tuple[str, ...]]], None],
+                         relation_bases: dict[str, int]) -> set[int]:
+    """Gets the relation ids of the negated static predicates, which are never reached as propositions.
 
     Args:
-        parameters (list[Object]): A list of parameter objects for which combinations need to be generated.
-        fixed_object (dict[Object, list[Object]]): A dictionary mapping parameter objects to their fixed values. If a parameter is not in this dictionary, it is considered variable.
-        dict_objects (dict[str, list[Object]]): A dictionary mapping object types (as strings) to lists of objects of that type.
+        static_facts (Union[dict[str, set[tuple[str, ...]]], None]): A map from the names of the static predicates to the
+            object names of their facts, or None if static predicates are part of the proposition space.
+        relation_bases (dict[str, int]): A map from predicate names to their predicate number (see 'get_relation_bases').
 
     Returns:
-        list[tuple[Object]]: A list of tuples, where each tuple represents a unique combination of objects that can be assigned to the parameters.
+        set[int]: The relation ids of the negative preconditions to be checked against the static facts.
     """
-    parameters_list = []
-    for object in parameters:
-        if object in fixed_object:
-            parameters_list.append([fixed_object[object]])
-        else:
-            parameters_list.append(dict_objects[object.get_type()])
-
-    all_combinations = itertools.product(*parameters_list)
-    unique_combinations = [tup for tup in all_combinations if len(tup) == len(set(tup))]
-    return unique_combinations
+    if static_facts is None:
+        return set()
+    return {get_relation_id(relation_bases[predicate_name], False) for predicate_name in static_facts}
 
-def find_proposition(generic_proposition: Proposition, object_combination: tuple[Object],
-                     propositions: dict[str, Proposition], parameters: list[Object]) -> Proposition:
-    """Finds a specific proposition within a dictionary given a generic proposition and an object combination.
+def map_triggers(schemas: list[ActionSchema], static_relations: set[int]) -> dict[int, list[tuple[ActionSchema, int]]]:
+    """Builds a map from relation ids to the preconditions they may trigger.
 
     Args:
-        generic_proposition (Proposition): The generic proposition (template) to match.
-        object_combination (tuple[Object]): The objects to substitute into the generic proposition.
-        propositions (dict[str, Proposition]): A dictionary mapping proposition names to Proposition objects.
-        parameters (list[Object]): The list of parameters (objects) used in the propositions.
+        schemas (list[ActionSchema]): The compiled actions of the domain.
+        static_relations (set[int]): The relation ids of the predicates that are not part of the proposition space.
 
     Returns:
-        Proposition: The matching proposition from the dictionary, or None if not found.
+        dict[int, list[tuple[ActionSchema, int]]]: A map from relation ids to the list of (schema, precondition position)
+            pairs whose precondition has that relation.
     """
-    proposition_objects = []
-    for object in generic_proposition.get_objects():
-        for index, parameter in enumerate(parameters):
-            if object == parameter:
-                proposition_objects.append(object_combination[index])
-
-    predicate = generic_proposition.get_predicate()
-    name = predicate.get_name()
-    for object in proposition_objects:
-        name += "_" + object.get_name()
-    proposition = propositions[name]
-    return proposition
-
-def enqueue_effects(frontier_queue: deque[tuple[Proposition, int]], action: Action,
-                    object_combination: tuple[Object], propositions: dict[str, Proposition],
-                    parameters: list[Object], reached: list[int]) -> None:
+    triggers = {}
+    for schema in schemas:
+        for position, (relation_id, predicate_id, _, _) in enumerate(schema.preconditions):
+            if predicate_id != -1:
+                triggers.setdefault(relation_id, []).append((schema, position))
+    return triggers
+
+def enqueue_effects(frontier_queue: deque[int], effects: list[list[tuple[int, bool]]], reached: array) -> int:
     """Enqueues propositions and their respective truth values onto a frontier queue based on an action's effects.
 
     Args:
-        frontier_queue (deque[tuple[Proposition, int]]): A queue of (proposition, truth value) pairs representing propositions at the frontier.
-        action (Action): The action whose effects are being processed.
-        object_combination (tuple[Object]): The combination of objects for which the action's effects are being evaluated.
-        propositions (dict[str, Proposition]): A dictionary mapping proposition names to Proposition objects.
-        parameters (list[Object]): The list of parameters (objects) of the action.
-        reached (list[int]): A list indicating which propositions have already been reached.
+        frontier_queue (deque[int]): A queue of the literal ids of the (proposition, truth value) pairs at the frontier.
+        effects (list[list[tuple[int, bool]]]): The ground effects of an instantiated action (see 'ActionSchema.ground_effects').
+        reached (array): The list indicating which propositions have already been reached (see 'create_reached_list').
+
+    Returns:
+        int: The number of literal ids enqueued.
+
+    Note:
+        The function updates the 'reached' list to mark new propositions as reached, and appends the corresponding literal ids to the 'frontier_queue'.
+    """
+    num_propositions = len(reached) // 2
+    num_pushes = 0
+    for effect_scenario in effects:
+        for index, effect_value in effect_scenario:
+            if index == -1:
+                continue
+            literal_id = index if effect_value else index + num_propositions
+            if reached[literal_id] == -1:
+                reached[literal_id] = 0
+                frontier_queue.append(literal_id)
+                num_pushes += 1
+    return num_pushes
+
+def iter_ground(initial_state: list[int], propositions: PropositionSpace, schemas: list[ActionSchema],
+                relation_bases: dict[str, int],
+                static_facts: Union[dict[str, set[tuple[str, ...]]], None] = None,
+                registry: Union[GroundActionRegistry, None] = None,
+                counters: Union[GroundingCounters, None] = None,
+                reached: Union[array, None] = None
+                ) -> Iterator[tuple[ActionSchema, tuple[int, ...], list[list[tuple[int, bool]]]]]:
+    """Generates the reachable instantiated actions as they are discovered, each with its ground effects.
+
+    Args:
+        initial_state (list[int]): The initial state represented as a bitmask (1 for true, 0 for false) for each proposition.
+        propositions (PropositionSpace): The space of all propositions in the domain.
+        schemas (list[ActionSchema]): The actions of the domain, compiled against 'propositions'.
+        relation_bases (dict[str, int]): A map from predicate names to their predicate number (see 'get_relation_bases').
+        static_facts (Union[dict[str, set[tuple[str, ...]]], None]): A map from the names of the static predicates to the
+            object names of their facts that hold in the initial state, or None if static predicates are part of 'propositions'.
+        registry (Union[GroundActionRegistry, None]): The registry that keeps each instantiation from being generated twice;
+            a new one is used if None.
+        counters (Union[GroundingCounters, None]): If given, the work done is counted in it, up to the point where the
+            generator is exhausted or closed.
+        reached (Union[array, None]): The list of reached propositions, as created by 'create_reached_list' for
+            'initial_state', which is updated in place; a new one is used if None.
+
+    Yields:
+        tuple[ActionSchema, tuple[int, ...], list[list[tuple[int, bool]]]]: The schema, the global ids of the objects assigned
+            to its parameters and the ground effects (see 'ActionSchema.ground_effects') of each new instantiation.
 
     Note:
-        The function updates the 'reached' list to mark new propositions as reached, and appends the corresponding (proposition, truth value) pairs to the 'frontier_queue'.
+        See 'run_ground' for the algorithm. The actions are generated in the same order as 'run_ground' registers them,
+        and nothing is kept for them besides what 'registry' keeps; 'reached' is complete once the generator is exhausted.
     """
-    for effect_scenario in action.get_effects():
-        for effect_generic_proposition, effect_value in effect_scenario:
-            proposition = find_proposition(effect_generic_proposition, object_combination, propositions, parameters)
-            index = proposition.get_index()
-
-            num_propositions = len(reached) // 2
-            if not effect_value:
-                index += num_propositions
-
-            if reached[index] == -1:
-                reached[index] = 0
-                frontier_queue.appendleft((proposition, effect_value))
-
-def run_ground(initial_state: list[int], list_propositions: list[Proposition],
-                dict_propositions: dict[str, Proposition],
-                pred_to_actions: dict[Predicate, list[Action]],
-                dict_objects: dict[str, list[Object]]) -> tuple[list[tuple[Action, tuple[Object]]], list[int]]:
+    frontier_queue = store_initial_queue(initial_state)
+    if reached is None:
+        reached = create_reached_list(initial_state)
+    if registry is None:
+        registry = GroundActionRegistry()
+    num_propositions = len(initial_state)
+    static_relations = get_static_relations(static_facts, relation_bases)
+    reached_atoms = ReachedAtoms()
+    if static_facts is not None:
+        index_static_facts(reached_atoms, static_facts, propositions, relation_bases)
+    triggers = map_triggers(schemas, static_relations)
+    if counters is not None:
+        counters.queue_pushes += len(frontier_queue)
+
+    def instantiate(schema: ActionSchema, binding: list[int], pending: list[int]
+                    ) -> Iterator[tuple[ActionSchema, tuple[int, ...], list[list[tuple[int, bool]]]]]:
+        for parameters in join_preconditions(schema, binding, pending, reached_atoms, static_relations, None, counters):
+            effects = registry.add(schema, parameters)
+            if effects is not None:
+                num_pushes = enqueue_effects(frontier_queue, effects, reached)
+                if counters is not None:
+                    counters.queue_pushes += num_pushes
+                yield (schema, parameters, effects)
+
+    num_pops = 0
+    num_triggers = 0
+    try:
+        for schema in schemas:
+            if any(predicate_id != -1 for _, predicate_id, _, _ in schema.preconditions):
+                continue
+            num_triggers += 1
+            yield from instantiate(schema, [-1] * len(schema.parameter_types) + list(schema.constants),
+                                   list(range(len(schema.preconditions))))
+
+        while(len(frontier_queue) > 0):
+            literal_id = get_element_from_frontier(frontier_queue)
+            num_pops += 1
+            reached[literal_id] = 1
+            index, value = get_literal_pair(literal_id, num_propositions)
+            predicate_id, objects = propositions.decode_ids(index)
+            relation_id = get_relation_id(predicate_id, value)
+            reached_atoms.add(relation_id, objects)
+
+            for schema, trigger_position in triggers.get(relation_id, []):
+                arguments = schema.preconditions[trigger_position][2]
+                binding = [-1] * len(schema.parameter_types) + list(schema.constants)
+                binding = bind_arguments(schema, arguments, objects, binding)
+                if binding is None:
+                    continue
+                pending = [position for position in range(len(schema.preconditions)) if position != trigger_position]
+                num_triggers += 1
+                yield from instantiate(schema, binding, pending)
+    finally:
+        if counters is not None:
+            counters.queue_pops += num_pops
+            counters.triggers += num_triggers
+
+def run_ground(initial_state: list[int], propositions: PropositionSpace, schemas: list[ActionSchema],
+               relation_bases: dict[str, int],
+               static_facts: Union[dict[str, set[tuple[str, ...]]], None] = None,
+               registry: Union[GroundActionRegistry, None] = None,
+               counters: Union[GroundingCounters, None] = None) -> tuple[list[tuple[Action, tuple[Object]]], ReachedView]:
     """Given an initial state, computes the list of reachable actions, along with the list of reachable propositions.
 
     Args:
         initial_state (list[int]): The initial state represented as a bitmask (1 for true, 0 for false) for each proposition.
-        list_propositions (list[Proposition]): The list of all propositions in the domain.
-        dict_propositions (dict[str, Proposition]): A dictionary mapping proposition names to Proposition objects.
-        pred_to_actions (dict[Predicate, list[Action]]): A dictionary mapping predicates to lists of actions that have those predicates in their preconditions.
-        dict_objects (dict[str, list[Object]]): A dictionary mapping object types (as strings) to lists of objects of that type.
+        propositions (PropositionSpace): The space of all propositions in the domain.
+        schemas (list[ActionSchema]): The actions of the domain, compiled against 'propositions'.
+        relation_bases (dict[str, int]): A map from predicate names to their predicate number (see 'get_relation_bases').
+        static_facts (Union[dict[str, set[tuple[str, ...]]], None]): A map from the names of the static predicates to the
+            object names of their facts that hold in the initial state, or None if static predicates are part of 'propositions'.
+        registry (Union[GroundActionRegistry, None]): The registry where the reachable actions are stored; a new one is
+            used if None.
+        counters (Union[GroundingCounters, None]): If given, the work done is counted in it.
 
     Returns:
-        tuple[list[tuple[Action, tuple[Object]]], list[int]]: A tuple containing:
-            - A list of tuples where each tuple represents a reachable action and its corresponding object combination.
-            - A list indicating whether each proposition (and its negation) is reachable (1) or not (-1).
+        tuple[list[tuple[Action, tuple[Object]]], ReachedView]: A tuple containing:
+            - A list of tuples where each tuple represents a reachable action and its corresponding object combination,
+              each listed once.
+            - A view indicating whether each proposition (and its negation) is reachable (1) or not (-1).
 
     Note:
         The algorithm iteratively explores the state space by adding reached propositions to a frontier queue.
-        It checks if actions' preconditions are satisfied by the reached propositions and their combinations.
+        When a proposition is popped, it is joined, for every precondition it matches, with the propositions already
+        reached, in order to build only the bindings whose preconditions are all reached.
         If so, the action's effects are enqueued, expanding the frontier.
         The process continues until all reachable propositions and actions are found.
+        Preconditions over static predicates are never enqueued; they are evaluated directly against 'static_facts'.
+        An instantiation is found again when a proposition matches several of its preconditions; 'registry' skips it.
+        'iter_ground' generates the same actions one at a time, without building the list.
     """
-    frontier_queue = store_initial_queue(initial_state, list_propositions)
     reached = create_reached_list(initial_state)
-    actions = []
-    num_propositions = len(initial_state)
+    if registry is None:
+        registry = GroundActionRegistry()
+    for _ in iter_ground(initial_state, propositions, schemas, relation_bases, static_facts, registry, counters, reached):
+        pass
+    return (registry.get_actions(propositions.object_list), ReachedView(reached))
+
+class GroundingLayers:
+    """Per-layer statistics of a layered grounding (see 'run_ground_layered').
+
+    Layer 0 holds the (proposition, value) pairs of the initial state; the actions of layer k are those whose preconditions
+    hold in layers up to k, and the pairs of layer k + 1 are the new effects of the actions of layer k.
+
+    Attributes:
+        atom_layers (list[int]): The layer in which each (proposition, value) pair is first reached, or -1 if it is not
+            reachable; the i-th entry corresponds to (P, True) and the (n + i)-th entry to (P, False), as in the reached list.
+        new_atoms (list[int]): The number of (proposition, value) pairs first reached in each layer.
+        new_actions (list[int]): The number of instantiated actions first applicable in each layer.
+    """
+
+    def __init__(self, num_propositions: int) -> None:
+        """Initializes a 'GroundingLayers' object with no layers.
+
+        Args:
+            num_propositions (int): The total number of propositions.
+        """
+        self.atom_layers = [-1] * (2 * num_propositions)
+        self.new_atoms = []
+        self.new_actions = []
+
+    def get_num_layers(self) -> int:
+        """Gets the number of layers."""
+        return len(self.new_atoms)
+
+    def get_atom_layer(self, index: int, value: int) -> int:
+        """Gets the layer in which a (proposition, value) pair is first reached, or -1 if it is not reachable."""
+        num_propositions = len(self.atom_layers) // 2
+        return self.atom_layers[index if value else index + num_propositions]
 
-    while(len(frontier_queue) > 0):
-        reached_proposition, value, index = get_element_from_frontier(frontier_queue)
-        add_proposition_to_reached(reached, value, index, num_propositions)
-        reached_predicate = reached_proposition.get_predicate()
-        
-        if reached_predicate not in pred_to_actions:
+    def get_new_atoms(self) -> list[int]:
+        """Gets the number of (proposition, value) pairs first reached in each layer."""
+        return self.new_atoms
+
+    def get_new_actions(self) -> list[int]:
+        """Gets the number of instantiated actions first applicable in each layer."""
+        return self.new_actions
+
+def ground_unconditioned(schemas: list[ActionSchema], reached_atoms: ReachedAtoms, static_relations: set[int],
+                         counters: Union[GroundingCounters, None] = None) -> Iterator[tuple[ActionSchema, tuple[int, ...]]]:
+    """Enumerates the instantiations of the actions without preconditions over the proposition space.
+
+    Args:
+        schemas (list[ActionSchema]): The compiled actions of the domain.
+        reached_atoms (ReachedAtoms): The index of reached propositions (including the static facts of the initial state).
+        static_relations (set[int]): The relation ids of the negative preconditions over static predicates not in the space.
+        counters (Union[GroundingCounters, None]): If given, the work done is counted in it.
+
+    Yields:
+        tuple[ActionSchema, tuple[int, ...]]: The schema and the global ids of the objects assigned to its parameters.
+    """
+    for schema in schemas:
+        if any(predicate_id != -1 for _, predicate_id, _, _ in schema.preconditions):
             continue
+        if counters is not None:
+            counters.triggers += 1
+        binding = [-1] * len(schema.parameter_types) + list(schema.constants)
+        for parameters in join_preconditions(schema, binding, list(range(len(schema.preconditions))),
+                                             reached_atoms, static_relations, None, counters):
+            yield (schema, parameters)
+
+def ground_delta(delta_atoms: list[tuple[int, tuple[int, ...]]], layer: int,
+                 triggers: dict[int, list[tuple[ActionSchema, int]]], reached_atoms: ReachedAtoms,
+                 static_relations: set[int],
+                 counters: Union[GroundingCounters, None] = None) -> Iterator[tuple[ActionSchema, tuple[int, ...]]]:
+    """Enumerates the instantiations triggered by the (proposition, value) pairs first reached in a layer.
 
-        for action in pred_to_actions[reached_predicate]:
-            preconditions, parameters = get_action_parameters_and_preconditions(action)
+    Args:
+        delta_atoms (list[tuple[int, tuple[int, ...]]]): The (relation id, objects) pairs first reached in 'layer'.
+        layer (int): The current layer; 'reached_atoms' must already hold its pairs.
+        triggers (dict[int, list[tuple[ActionSchema, int]]]): A map from relation ids to the preconditions they may trigger
+            (see 'map_triggers').
+        reached_atoms (ReachedAtoms): The index of reached propositions (including the static facts of the initial state).
+        static_relations (set[int]): The relation ids of the negative preconditions over static predicates not in the space.
+        counters (Union[GroundingCounters, None]): If given, the work done is counted in it.
 
-            reached_precondition = find_reached_predicate_in_preconditions(preconditions,
-                                                                           reached_predicate,
-                                                                           value)
-            if reached_precondition is None:
-                continue
-            reached_precondition_proposition, _ = reached_precondition
+    Yields:
+        tuple[ActionSchema, tuple[int, ...]]: The schema and the global ids of the objects assigned to its parameters.
 
-            fixed = {}
-            for i, object in enumerate(reached_precondition_proposition.get_objects()):
-                fixed[object] = reached_proposition.get_objects()[i]
+    Note:
+        A precondition matched by a pair of the delta only combines with earlier fluent preconditions matched by pairs of
+        older layers, so an instantiation is found once, however many of its preconditions the delta matches.
+        The instantiations are yielded in the order of 'delta_atoms', so any split of it into consecutive parts yields
+        the same sequence once the parts are concatenated.
+    """
+    num_triggers = 0
+    for relation_id, objects in delta_atoms:
+        for schema, trigger_position in triggers.get(relation_id, []):
+            arguments = schema.preconditions[trigger_position][2]
+            binding = [-1] * len(schema.parameter_types) + list(schema.constants)
+            binding = bind_arguments(schema, arguments, objects, binding)
+            if binding is None:
+                continue
+            pending = [position for position in range(len(schema.preconditions)) if position != trigger_position]
+            layer_bounds = {position: layer for position in pending
+                            if position < trigger_position and schema.preconditions[position][1] != -1}
+            num_triggers += 1
+            for parameters in join_preconditions(schema, binding, pending, reached_atoms, static_relations, layer_bounds,
+                                                 counters):
+                yield (schema, parameters)
+    if counters is not None:
+        counters.triggers += num_triggers
+
+def collect_new_atoms(new_actions: list[list[list[tuple[int, bool]]]], reached: array) -> list[tuple[int, int]]:
+    """Collects the (proposition index, truth value) pairs first reached by the effects of some actions.
 
-            parameters_combinations = get_parameters_combinations(parameters, fixed, dict_objects)
+    Args:
+        new_actions (list[list[list[tuple[int, bool]]]]): The ground effects of the actions (see 'ActionSchema.ground_effects').
+        reached (array): The list indicating which propositions have already been reached (see 'create_reached_list');
+            the new pairs are marked in it.
 
-            for object_combination in parameters_combinations:
-                all_propositions_reachable = True
-                for precondition in preconditions:
-                    generic_precondition_proposition, precondition_value = precondition
-                    builded_precondition_proposition = find_proposition(generic_precondition_proposition, object_combination,
-                                                                    dict_propositions, parameters)
-                    builded_precondition_proposition_index = builded_precondition_proposition.get_index()
-                    if not precondition_value:
-                        builded_precondition_proposition_index += num_propositions
+    Returns:
+        list[tuple[int, int]]: The new pairs, sorted by proposition index and value.
+    """
+    num_propositions = len(reached) // 2
+    new_atoms = []
+    for effects in new_actions:
+        for effect_scenario in effects:
+            for index, effect_value in effect_scenario:
+                if index == -1:
+                    continue
+                reached_index = index if effect_value else index + num_propositions
+                if reached[reached_index] == -1:
+                    reached[reached_index] = 0
+                    new_atoms.append((index, int(effect_value)))
+    return sorted(new_atoms)
+
+def run_ground_layered(initial_state: list[int], propositions: PropositionSpace, schemas: list[ActionSchema],
+                       relation_bases: dict[str, int],
+                       static_facts: Union[dict[str, set[tuple[str, ...]]], None] = None,
+                       registry: Union[GroundActionRegistry, None] = None,
+                       counters: Union[GroundingCounters, None] = None
+                       ) -> tuple[list[tuple[Action, tuple[Object]]], ReachedView, GroundingLayers]:
+    """Computes the reachable actions and propositions layer by layer, in semi-naive style.
 
-                    if reached[builded_precondition_proposition_index] != 1:
-                        all_propositions_reachable = False
-                        break
+    Args:
+        initial_state (list[int]): The initial state represented as a bitmask (1 for true, 0 for false) for each proposition.
+        propositions (PropositionSpace): The space of all propositions in the domain.
+        schemas (list[ActionSchema]): The actions of the domain, compiled against 'propositions'.
+        relation_bases (dict[str, int]): A map from predicate names to their predicate number (see 'get_relation_bases').
+        static_facts (Union[dict[str, set[tuple[str, ...]]], None]): A map from the names of the static predicates to the
+            object names of their facts that hold in the initial state, or None if static predicates are part of 'propositions'.
+        registry (Union[GroundActionRegistry, None]): The registry where the reachable actions are stored; a new one is
+            used if None.
+        counters (Union[GroundingCounters, None]): If given, the work done is counted in it.
 
-                if all_propositions_reachable == True:
-                    enqueue_effects(frontier_queue, action, object_combination, dict_propositions, parameters, reached)
-                    actions.append((action, object_combination))
+    Returns:
+        tuple[list[tuple[Action, tuple[Object]]], ReachedView, GroundingLayers]: A tuple containing:
+            - The list of reachable actions and their object combinations, ordered by layer.
+            - A view indicating whether each proposition (and its negation) is reachable (1) or not (-1).
+            - The per-layer statistics of the grounding.
 
-    return (actions, reached)
\ No newline at end of file
+    Note:
+        Each round joins only the delta, i.e., the pairs first reached in the previous layer, against the pairs already
+        reached: a precondition matched by a pair of the delta only combines with earlier preconditions matched by
+        older pairs. Thus every instantiation is found exactly once, in the first layer where it is applicable, and
+        the output order depends only on the proposition indices.
+    """
+    reached = create_reached_list(initial_state)
+    num_propositions = len(initial_state)
+    layers = GroundingLayers(num_propositions)
+    if registry is None:
+        registry = GroundActionRegistry()
+    static_relations = get_static_relations(static_facts, relation_bases)
+    reached_atoms = ReachedAtoms()
+    if static_facts is not None:
+        index_static_facts(reached_atoms, static_facts, propositions, relation_bases)
+    triggers = map_triggers(schemas, static_relations)
+
+    delta = [(index, value) for index, value in enumerate(initial_state) if value != -1]
+    layer = 0
+    while len(delta) > 0:
+        delta_atoms = []
+        for index, value in delta:
+            add_proposition_to_reached(reached, value, index, num_propositions)
+            layers.atom_layers[index if value else index + num_propositions] = layer
+            predicate_id, objects = propositions.decode_ids(index)
+            relation_id = get_relation_id(predicate_id, value)
+            reached_atoms.add(relation_id, objects, layer)
+            delta_atoms.append((relation_id, objects))
+
+        new_actions = []
+        if layer == 0:
+            for schema, parameters in ground_unconditioned(schemas, reached_atoms, static_relations, counters):
+                effects = registry.add(schema, parameters)
+                if effects is not None:
+                    new_actions.append(effects)
+        for schema, parameters in ground_delta(delta_atoms, layer, triggers, reached_atoms, static_relations, counters):
+            effects = registry.add(schema, parameters)
+            if effects is not None:
+                new_actions.append(effects)
+        next_delta = collect_new_atoms(new_actions, reached)
+
+        layers.new_atoms.append(len(delta))
+        layers.new_actions.append(len(new_actions))
+        if counters is not None:
+            counters.queue_pushes += len(delta)
+            counters.queue_pops += len(delta)
+        delta = next_delta
+        layer += 1
+
+    return (registry.get_actions(propositions.object_list), ReachedView(reached), layers)
@@ -0,0 +1,279 @@
+from .proposition_space import PropositionSpace
+from .action_schema import ActionSchema, get_relation_id
+from .ground import (GroundActionRegistry, GroundingCounters, ReachedAtoms, bind_arguments, enqueue_effects,
+                     extend_reached_list, get_literal_id, get_literal_pair, get_static_relations, index_static_facts,
+                     join_preconditions, map_triggers)
+from array import array
+from collections import deque
+from typing import Iterator, Union
+
+class IncrementalGrounding:
+    """Forward reachability kept between problems that differ from the grounded one, so that they are grounded from its fixpoint.
+
+    Every ground action is indexed by the (proposition, value) pairs of its preconditions, and every reached pair by the
+    actions producing it. A new initial state (see 'update') is then handled in the manner of the delete-and-rederive
+    algorithm:
+
+    1. the pairs that are no longer initial are deleted, along with every action with a deleted precondition and every
+       effect of such an action that is not initial (an over-approximation of what lost its support);
+    2. the deleted pairs still produced by an action left are restored, and so are the new initial pairs, which are
+       pushed to the frontier;
+    3. the frontier is propagated as in 'iter_ground', joining each popped pair with the reached pairs left.
+
+    Only the actions and pairs depending on a retracted pair are visited, and the joins only start from pairs reached
+    again or anew. New objects (see 'add_objects') only add to the fixpoint: the bindings with a new object are joined
+    with the reached pairs, and the initial pairs of the new propositions are propagated. The propositions keep their
+    indices, so the pairs are identified by keys that do not depend on their number: 2 * i + v for the pair (P, v) of the
+    proposition with index i.
+
+    Attributes:
+        propositions (PropositionSpace): The space of all propositions in the domain.
+        schemas (list[ActionSchema]): The actions of the domain, compiled against 'propositions'.
+        relation_bases (dict[str, int]): A map from predicate names to their predicate number (see 'get_relation_bases').
+        initial_state (list[int]): The current initial state (1 for true, 0 for false) for each proposition.
+        registry (GroundActionRegistry): The reachable actions, updated in place; those left keep their order, and new
+            ones are appended.
+        reached (array): The list of reached propositions (see 'create_reached_list'), updated in place, unless
+            propositions are added, in which case it is replaced.
+        reached_atoms (ReachedAtoms): The index of the reached pairs, including the static facts of the initial state.
+        static_relations (set[int]): The relation ids of the negative preconditions over static predicates not in the space.
+        triggers (dict[int, list[tuple[ActionSchema, int]]]): A map from relation ids to the preconditions they may trigger.
+        consumers (dict[int, set[tuple[int, tuple[int, ...]]]]): A map from pair keys to the keys (schema index,
+            parameters) of the reachable actions having them as preconditions.
+        producers (dict[int, set[tuple[int, tuple[int, ...]]]]): A map from pair keys to the keys of the reachable actions
+            having them as effects.
+
+    Examples:
+        >>> grounding = IncrementalGrounding(propositions, schemas, relation_bases, static_facts, initial_state, registry, reached)
+        >>> new_actions, removed_actions = grounding.update(new_initial_state)
+    """
+
+    def __init__(self, propositions: PropositionSpace, schemas: list[ActionSchema], relation_bases: dict[str, int],
+                 static_facts: Union[dict[str, set[tuple[str, ...]]], None], initial_state: list[int],
+                 registry: GroundActionRegistry, reached: array) -> None:
+        """Initializes an 'IncrementalGrounding' object from the fixpoint of a complete grounding.
+
+        Args:
+            propositions (PropositionSpace): The space of all propositions in the domain.
+            schemas (list[ActionSchema]): The actions of the domain, compiled against 'propositions'.
+            relation_bases (dict[str, int]): A map from predicate names to their predicate number (see 'get_relation_bases').
+            static_facts (Union[dict[str, set[tuple[str, ...]]], None]): A map from the names of the static predicates to
+                the object names of their facts that hold in the initial state, or None if they are part of 'propositions'.
+            initial_state (list[int]): The initial state that was grounded.
+            registry (GroundActionRegistry): The reachable actions of 'initial_state', which must keep its actions.
+            reached (array): The list of reached propositions of 'initial_state'.
+
+        Raises:
+            ValueError: If 'registry' does not keep its actions (see 'GroundActionRegistry.keep_actions').
+        """
+        if not registry.keep_actions:
+            raise ValueError("incremental grounding needs a registry that keeps its actions")
+        self.propositions = propositions
+        self.schemas = schemas
+        self.relation_bases = relation_bases
+        self.initial_state = list(initial_state)
+        self.registry = registry
+        self.reached = reached
+        self.static_relations = get_static_relations(static_facts, relation_bases)
+        self.triggers = map_triggers(schemas, self.static_relations)
+        self.reached_atoms = ReachedAtoms()
+        if static_facts is not None:
+            index_static_facts(self.reached_atoms, static_facts, propositions, relation_bases)
+        num_propositions = len(self.initial_state)
+        for literal_id, value in enumerate(reached):
+            if value != -1:
+                self.reached_atoms.add(*self.__get_atom(*get_literal_pair(literal_id, num_propositions)))
+        self.consumers = {}
+        self.producers = {}
+        for position, (schema, parameters) in enumerate(registry):
+            self.__index_action(schema, parameters, registry.get_preconditions(position), registry.get_effects(position))
+
+    def __get_atom(self, index: int, value: int) -> tuple[int, tuple[int, ...]]:
+        """Gets the relation id and the global ids of the objects of a (proposition, value) pair."""
+        predicate_id, objects = self.propositions.decode_ids(index)
+        return (get_relation_id(predicate_id, value), objects)
+
+    def __get_literal_id(self, key: int) -> int:
+        """Gets the literal id (see 'get_literal_id') of the pair with the given key."""
+        return get_literal_id(key >> 1, key & 1, len(self.initial_state))
+
+    def __get_keys(self, pairs: list[tuple[int, bool]]) -> set[int]:
+        """Gets the keys of some (proposition index, value) pairs, leaving out those outside the space."""
+        return {2 * index + int(value) for index, value in pairs if index != -1}
+
+    def __get_effect_keys(self, effects: list[list[tuple[int, bool]]]) -> set[int]:
+        """Gets the keys of the effects of every scenario of an action."""
+        return self.__get_keys([pair for scenario in effects for pair in scenario])
+
+    def __index_action(self, schema: ActionSchema, parameters: tuple[int, ...], preconditions: list[tuple[int, bool]],
+                       effects: list[list[tuple[int, bool]]]) -> None:
+        """Records a reachable action as a consumer of its preconditions and a producer of its effects."""
+        action_key = (schema.get_index(), parameters)
+        for key in self.__get_keys(preconditions):
+            self.consumers.setdefault(key, set()).add(action_key)
+        for key in self.__get_effect_keys(effects):
+            self.producers.setdefault(key, set()).add(action_key)
+
+    def __is_initial(self, key: int) -> bool:
+        """Checks whether the pair with the given key holds in the current initial state."""
+        return self.initial_state[key >> 1] == key & 1
+
+    def __retract(self, removed: list[int], frontier_queue: deque[int]) -> int:
+        """Deletes the pairs no longer initial and whatever may depend on them, restoring those still produced.
+
+        Args:
+            removed (list[int]): The keys of the pairs of the previous initial state not in the current one.
+            frontier_queue (deque[int]): The frontier, where the literal ids of the restored pairs are pushed.
+
+        Returns:
+            int: The number of actions deleted.
+        """
+        deleted = set()
+        deleted_actions = set()
+        stack = removed[:]
+        while len(stack) > 0:
+            key = stack.pop()
+            if key in deleted:
+                continue
+            deleted.add(key)
+            for action_key in self.consumers.get(key, ()):
+                if action_key in deleted_actions:
+                    continue
+                deleted_actions.add(action_key)
+                effects = self.schemas[action_key[0]].ground_effects(action_key[1])
+                stack.extend(effect_key for effect_key in self.__get_effect_keys(effects)
+                             if effect_key not in deleted and not self.__is_initial(effect_key))
+
+        for schema_index, parameters in deleted_actions:
+            schema = self.schemas[schema_index]
+            for key in self.__get_keys(schema.ground_preconditions(parameters)):
+                self.consumers[key].discard((schema_index, parameters))
+            for key in self.__get_effect_keys(schema.ground_effects(parameters)):
+                self.producers[key].discard((schema_index, parameters))
+        self.registry.discard(deleted_actions)
+        self.reached_atoms.discard(self.__get_atom(key >> 1, key & 1) for key in deleted)
+        for key in deleted:
+            self.reached[self.__get_literal_id(key)] = -1
+        for key in sorted(deleted, key=self.__get_literal_id):
+            if len(self.producers.get(key, ())) > 0:
+                literal_id = self.__get_literal_id(key)
+                self.reached[literal_id] = 0
+                frontier_queue.append(literal_id)
+        return len(deleted_actions)
+
+    def __instantiate(self, schema: ActionSchema, binding: list[int], pending: list[int], frontier_queue: deque[int],
+                      counters: Union[GroundingCounters, None]
+                      ) -> Iterator[tuple[ActionSchema, tuple[int, ...], list[list[tuple[int, bool]]]]]:
+        """Registers the new bindings of a partial binding joined with the reached pairs, enqueueing their effects."""
+        for parameters in join_preconditions(schema, binding, pending, self.reached_atoms, self.static_relations, None,
+                                             counters):
+            effects = self.registry.add(schema, parameters)
+            if effects is not None:
+                self.__index_action(schema, parameters, self.registry.preconditions[-1], effects)
+                num_pushes = enqueue_effects(frontier_queue, effects, self.reached)
+                if counters is not None:
+                    counters.queue_pushes += num_pushes
+                yield (schema, parameters, effects)
+
+    def __propagate(self, frontier_queue: deque[int], counters: Union[GroundingCounters, None]
+                    ) -> Iterator[tuple[ActionSchema, tuple[int, ...], list[list[tuple[int, bool]]]]]:
+        """Pops the frontier until it is empty, joining each pair with the reached ones, as 'iter_ground' does."""
+        num_propositions = len(self.initial_state)
+        num_pops = 0
+        num_triggers = 0
+        while len(frontier_queue) > 0:
+            literal_id = frontier_queue.popleft()
+            num_pops += 1
+            self.reached[literal_id] = 1
+            relation_id, objects = self.__get_atom(*get_literal_pair(literal_id, num_propositions))
+            self.reached_atoms.add(relation_id, objects)
+            for schema, trigger_position in self.triggers.get(relation_id, []):
+                binding = [-1] * len(schema.parameter_types) + list(schema.constants)
+                binding = bind_arguments(schema, schema.preconditions[trigger_position][2], objects, binding)
+                if binding is None:
+                    continue
+                pending = [position for position in range(len(schema.preconditions)) if position != trigger_position]
+                num_triggers += 1
+                yield from self.__instantiate(schema, binding, pending, frontier_queue, counters)
+        if counters is not None:
+            counters.queue_pops += num_pops
+            counters.triggers += num_triggers
+
+    def update(self, initial_state: list[int], counters: Union[GroundingCounters, None] = None) -> tuple[int, int]:
+        """Grounds a new initial state from the fixpoint of the current one, updating 'registry' and 'reached' in place.
+
+        Args:
+            initial_state (list[int]): The new initial state (1 for true, 0 for false) for each proposition.
+            counters (Union[GroundingCounters, None]): If given, the work done is counted in it.
+
+        Returns:
+            tuple[int, int]: The number of actions added and the number of actions removed.
+        """
+        removed = []
+        added = []
+        for index, (old_value, new_value) in enumerate(zip(self.initial_state, initial_state)):
+            if old_value != new_value:
+                removed.append(2 * index + old_value)
+                added.append(2 * index + new_value)
+        self.initial_state = list(initial_state)
+        frontier_queue = deque()
+        num_removed = self.__retract(removed, frontier_queue) if len(removed) > 0 else 0
+        for key in added:
+            literal_id = self.__get_literal_id(key)
+            if self.reached[literal_id] == -1:
+                self.reached[literal_id] = 0
+                frontier_queue.append(literal_id)
+        if counters is not None:
+            counters.queue_pushes += len(frontier_queue)
+        num_added = sum(1 for _ in self.__propagate(frontier_queue, counters))
+        return (num_added, num_removed)
+
+    def add_objects(self, global_ids: list[int], initial_state: list[int],
+                    static_facts: Union[dict[str, set[tuple[str, ...]]], None] = None,
+                    counters: Union[GroundingCounters, None] = None) -> int:
+        """Grounds the bindings with objects just added to the space (see 'PropositionSpace.add_objects'), replacing 'reached'.
+
+        For each parameter that a new object can take, the binding assigning it is joined with the reached pairs, which
+        finds the new actions whose preconditions were all reached; the others are found when the last of their
+        preconditions is reached, once the initial pairs of the new propositions are propagated.
+
+        Args:
+            global_ids (list[int]): The global ids of the objects added.
+            initial_state (list[int]): The initial state, extended with the values (1 for true, 0 for false) of the
+                propositions added; the other propositions must keep their values.
+            static_facts (Union[dict[str, set[tuple[str, ...]]], None]): A map from the names of static predicates to the
+                object names of their new facts that hold in the initial state, each with a new object, or None if there
+                are none.
+            counters (Union[GroundingCounters, None]): If given, the work done is counted in it.
+
+        Returns:
+            int: The number of actions added.
+        """
+        num_previous = len(self.initial_state)
+        self.initial_state.extend(initial_state[num_previous:])
+        self.reached = extend_reached_list(self.reached, self.initial_state)
+        if static_facts is not None:
+            index_static_facts(self.reached_atoms, static_facts, self.propositions, self.relation_bases)
+        num_propositions = len(self.initial_state)
+        frontier_queue = deque(get_literal_id(index, self.initial_state[index], num_propositions)
+                               for index in range(num_previous, num_propositions))
+        if counters is not None:
+            counters.queue_pushes += len(frontier_queue)
+
+        new_objects = {}
+        for global_id in global_ids:
+            new_objects.setdefault(self.propositions.object_types[global_id], []).append(global_id)
+        num_added = 0
+        num_triggers = 0
+        for schema in self.schemas:
+            pending = list(range(len(schema.preconditions)))
+            for position, parameter_type in enumerate(schema.parameter_types):
+                for global_id in new_objects.get(parameter_type, []):
+                    binding = [-1] * len(schema.parameter_types) + list(schema.constants)
+                    binding[position] = global_id
+                    num_triggers += 1
+                    num_added += sum(1 for _ in self.__instantiate(schema, binding, pending, frontier_queue, counters))
+        if counters is not None:
+            counters.triggers += num_triggers
+        num_added += sum(1 for _ in self.__propagate(frontier_queue, counters))
+        return num_added
\ No newline at end of file
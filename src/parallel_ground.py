@@ -0,0 +1,250 @@
+from .custom_types import Action, Object
+from .proposition_space import PropositionSpace
+from .action_schema import ActionSchema, get_relation_id
+from .ground import (GroundActionRegistry, GroundingCounters, GroundingLayers, ReachedAtoms, ReachedView,
+                     add_proposition_to_reached, collect_new_atoms, create_reached_list, get_literal_id, get_literal_pair,
+                     get_static_relations, ground_delta, ground_unconditioned, index_static_facts, map_triggers,
+                     run_ground_layered)
+from array import array
+from typing import Union
+import os
+
+class SharedAtomLog:
+    """Append-only log of reached (proposition, value) pairs, kept in shared memory so that worker processes read it without pickling.
+
+    Each pair is stored as an int32 code, its literal id: the proposition index i for (P, True) and n + i for
+    (P, False), as in the reached list (see 'get_literal_id'). Since every pair is reached at most once, the log never holds more than
+    2 * n codes.
+
+    Attributes:
+        memory (shared_memory.SharedMemory): The shared memory block holding the codes.
+        num_propositions (int): The total number of propositions.
+    """
+
+    def __init__(self, num_propositions: int, name: Union[str, None] = None) -> None:
+        """Initializes a 'SharedAtomLog' object, creating a new shared memory block or attaching to an existing one.
+
+        Args:
+            num_propositions (int): The total number of propositions.
+            name (Union[str, None]): The name of the shared memory block to attach to; a new block is created if None.
+        """
+        from multiprocessing import shared_memory
+        self.num_propositions = num_propositions
+        if name is None:
+            self.memory = shared_memory.SharedMemory(create=True, size=4 * max(1, 2 * num_propositions))
+        else:
+            self.memory = shared_memory.SharedMemory(name=name)
+
+    def write(self, start: int, delta: list[tuple[int, int]]) -> None:
+        """Stores the codes of some (proposition index, truth value) pairs from position 'start' on."""
+        codes = array("i", [get_literal_id(index, value, self.num_propositions) for index, value in delta])
+        self.memory.buf[4 * start:4 * (start + len(codes))] = codes.tobytes()
+
+    def read(self, start: int, end: int) -> list[int]:
+        """Gets the codes stored between positions 'start' (inclusive) and 'end' (exclusive)."""
+        with self.memory.buf[4 * start:4 * end] as view, view.cast("i") as codes:
+            return codes.tolist()
+
+    def get_name(self) -> str:
+        """Gets the name of the shared memory block."""
+        return self.memory.name
+
+    def close(self, unlink: bool = False) -> None:
+        """Detaches from the shared memory block, also freeing it if 'unlink' is set."""
+        self.memory.close()
+        if unlink:
+            self.memory.unlink()
+
+class GroundingWorker:
+    """State of a worker process of the parallel grounding (see 'run_ground_parallel').
+
+    The worker keeps its own index of the reached propositions, which it brings up to date from the shared log before
+    each task, so that only the layer boundaries and the range of the delta to be joined are sent to it.
+
+    Attributes:
+        log (SharedAtomLog): The shared log of reached (proposition, value) pairs.
+        propositions (PropositionSpace): The space of all propositions in the domain.
+        schemas (list[ActionSchema]): The actions of the domain, compiled against 'propositions'.
+        static_relations (set[int]): The relation ids of the negative preconditions over static predicates not in the space.
+        triggers (dict[int, list[tuple[ActionSchema, int]]]): A map from relation ids to the preconditions they may trigger.
+        reached_atoms (ReachedAtoms): The index of the reached propositions read from the log so far.
+        num_synced (int): The number of codes of the log already indexed in 'reached_atoms'.
+    """
+
+    def __init__(self, log_name: str, propositions: PropositionSpace, schemas: list[ActionSchema],
+                 relation_bases: dict[str, int], static_facts: Union[dict[str, set[tuple[str, ...]]], None]) -> None:
+        """Initializes a 'GroundingWorker' object.
+
+        Args:
+            log_name (str): The name of the shared memory block of the log.
+            propositions (PropositionSpace): The space of all propositions in the domain.
+            schemas (list[ActionSchema]): The actions of the domain, compiled against 'propositions'.
+            relation_bases (dict[str, int]): A map from predicate names to their predicate number (see 'get_relation_bases').
+            static_facts (Union[dict[str, set[tuple[str, ...]]], None]): A map from the names of the static predicates to
+                the object names of their facts that hold in the initial state, or None if they are part of 'propositions'.
+        """
+        self.log = SharedAtomLog(len(propositions), log_name)
+        self.propositions = propositions
+        self.schemas = schemas
+        self.static_relations = get_static_relations(static_facts, relation_bases)
+        self.triggers = map_triggers(schemas, self.static_relations)
+        self.reached_atoms = ReachedAtoms()
+        if static_facts is not None:
+            index_static_facts(self.reached_atoms, static_facts, propositions, relation_bases)
+        self.num_synced = 0
+
+    def decode(self, code: int) -> tuple[int, tuple[int, ...]]:
+        """Converts a code of the log into the relation id and the objects of the pair."""
+        index, value = get_literal_pair(code, self.log.num_propositions)
+        predicate_id, objects = self.propositions.decode_ids(index)
+        return (get_relation_id(predicate_id, value), objects)
+
+    def sync(self, layer_ends: tuple[int, ...]) -> None:
+        """Indexes the codes of the log not read yet.
+
+        Args:
+            layer_ends (tuple[int, ...]): The position in the log where each layer ends, up to the current one.
+        """
+        layer = 0
+        for position, code in enumerate(self.log.read(self.num_synced, layer_ends[-1]), self.num_synced):
+            while position >= layer_ends[layer]:
+                layer += 1
+            relation_id, objects = self.decode(code)
+            self.reached_atoms.add(relation_id, objects, layer)
+        self.num_synced = layer_ends[-1]
+
+    def ground(self, layer_ends: tuple[int, ...], start: int,
+               end: int) -> tuple[list[tuple[int, tuple[int, ...]]], GroundingCounters]:
+        """Joins a part of the delta of the current layer against the reached propositions.
+
+        Args:
+            layer_ends (tuple[int, ...]): The position in the log where each layer ends, up to the current one.
+            start (int): The position in the log of the first pair to be joined.
+            end (int): The position in the log after the last pair to be joined.
+
+        Returns:
+            tuple[list[tuple[int, tuple[int, ...]]], GroundingCounters]: The (schema index, parameters) pairs of the
+                triggered instantiations, in the order of 'ground_delta', and the work done to find them.
+        """
+        self.sync(layer_ends)
+        delta_atoms = [self.decode(code) for code in self.log.read(start, end)]
+        counters = GroundingCounters()
+        instantiations = [(schema.get_index(), parameters)
+                          for schema, parameters in ground_delta(delta_atoms, len(layer_ends) - 1, self.triggers,
+                                                                 self.reached_atoms, self.static_relations, counters)]
+        return (instantiations, counters)
+
+_worker = None
+
+def _init_worker(*arguments) -> None:
+    """Builds the 'GroundingWorker' object of a worker process."""
+    global _worker
+    _worker = GroundingWorker(*arguments)
+
+def _ground_part(task: tuple[tuple[int, ...], int, int]) -> tuple[list[tuple[int, tuple[int, ...]]], GroundingCounters]:
+    """Runs a task of the parallel grounding in a worker process (see 'GroundingWorker.ground')."""
+    return _worker.ground(*task)
+
+def split_range(start: int, end: int, num_parts: int) -> list[tuple[int, int]]:
+    """Splits a range into at most 'num_parts' consecutive, non-empty parts of similar size."""
+    size = max(1, -(-(end - start) // num_parts))
+    return [(part_start, min(part_start + size, end)) for part_start in range(start, end, size)]
+
+def run_ground_parallel(initial_state: list[int], propositions: PropositionSpace, schemas: list[ActionSchema],
+                        relation_bases: dict[str, int],
+                        static_facts: Union[dict[str, set[tuple[str, ...]]], None] = None,
+                        registry: Union[GroundActionRegistry, None] = None,
+                        workers: Union[int, None] = None, tasks_per_worker: int = 4,
+                        counters: Union[GroundingCounters, None] = None) -> tuple[list[tuple[Action, tuple[Object]]], ReachedView, GroundingLayers]:
+    """Computes the reachable actions and propositions layer by layer, joining each layer in a pool of worker processes.
+
+    Args:
+        initial_state (list[int]): The initial state represented as a bitmask (1 for true, 0 for false) for each proposition.
+        propositions (PropositionSpace): The space of all propositions in the domain.
+        schemas (list[ActionSchema]): The actions of the domain, compiled against 'propositions'.
+        relation_bases (dict[str, int]): A map from predicate names to their predicate number (see 'get_relation_bases').
+        static_facts (Union[dict[str, set[tuple[str, ...]]], None]): A map from the names of the static predicates to the
+            object names of their facts that hold in the initial state, or None if static predicates are part of 'propositions'.
+        registry (Union[GroundActionRegistry, None]): The registry where the reachable actions are stored; a new one is
+            used if None.
+        workers (Union[int, None]): The number of worker processes; the number of CPUs if None. With a single worker,
+            'run_ground_layered' is called instead.
+        tasks_per_worker (int): The number of parts each layer is split into, per worker. Defaults to 4.
+        counters (Union[GroundingCounters, None]): If given, the work done, including that of the workers, is counted in it.
+
+    Returns:
+        tuple[list[tuple[Action, tuple[Object]]], ReachedView, GroundingLayers]: The same result as 'run_ground_layered'.
+
+    Raises:
+        ValueError: If 'workers' is lower than 1.
+
+    Note:
+        The reached pairs are appended, layer by layer, to a log in shared memory (see 'SharedAtomLog'). The delta of each
+        layer is split into consecutive parts, which the workers join (see 'ground_delta') after indexing the new part of
+        the log; the instantiations found are then registered in the order of the parts. Hence the reachable actions,
+        their order and the layers are identical to those of 'run_ground_layered'.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError("the number of workers must be positive: " + str(workers))
+    if workers == 1:
+        return run_ground_layered(initial_state, propositions, schemas, relation_bases, static_facts, registry, counters)
+
+    reached = create_reached_list(initial_state)
+    num_propositions = len(initial_state)
+    layers = GroundingLayers(num_propositions)
+    if registry is None:
+        registry = GroundActionRegistry()
+    static_relations = get_static_relations(static_facts, relation_bases)
+    initial_atoms = ReachedAtoms()
+    if static_facts is not None:
+        index_static_facts(initial_atoms, static_facts, propositions, relation_bases)
+
+    from concurrent.futures import ProcessPoolExecutor
+    log = SharedAtomLog(num_propositions)
+    try:
+        with ProcessPoolExecutor(workers, initializer=_init_worker,
+                                 initargs=(log.get_name(), propositions, schemas, relation_bases, static_facts)) as executor:
+            delta = [(index, value) for index, value in enumerate(initial_state) if value != -1]
+            layer_ends = []
+            layer = 0
+            while len(delta) > 0:
+                start = layer_ends[-1] if len(layer_ends) > 0 else 0
+                log.write(start, delta)
+                layer_ends.append(start + len(delta))
+                for index, value in delta:
+                    add_proposition_to_reached(reached, value, index, num_propositions)
+                    layers.atom_layers[index if value else index + num_propositions] = layer
+
+                new_actions = []
+                if layer == 0:
+                    for index, value in delta:
+                        predicate_id, objects = propositions.decode_ids(index)
+                        initial_atoms.add(get_relation_id(predicate_id, value), objects)
+                    for schema, parameters in ground_unconditioned(schemas, initial_atoms, static_relations, counters):
+                        effects = registry.add(schema, parameters)
+                        if effects is not None:
+                            new_actions.append(effects)
+                tasks = [(tuple(layer_ends), part_start, part_end)
+                         for part_start, part_end in split_range(start, layer_ends[-1], workers * tasks_per_worker)]
+                for instantiations, part_counters in executor.map(_ground_part, tasks):
+                    if counters is not None:
+                        counters.merge(part_counters)
+                    for schema_index, parameters in instantiations:
+                        effects = registry.add(schemas[schema_index], parameters)
+                        if effects is not None:
+                            new_actions.append(effects)
+                next_delta = collect_new_atoms(new_actions, reached)
+
+                layers.new_atoms.append(len(delta))
+                layers.new_actions.append(len(new_actions))
+                if counters is not None:
+                    counters.queue_pushes += len(delta)
+                    counters.queue_pops += len(delta)
+                delta = next_delta
+                layer += 1
+    finally:
+        log.close(unlink=True)
+
+    return (registry.get_actions(propositions.object_list), ReachedView(reached), layers)
\ No newline at end of file
@@ -1,10 +1,23 @@
-from pddl import parse_domain, parse_problem
-from .custom_types import Action, Object, Proposition, Predicate
-from .domain import Domain
-from .problem import Problem
-from .ground import run_ground, find_proposition
-from typing import TextIO
-import itertools
+from .custom_types import Action, Object
+from .domain import Domain, load_domain
+from .problem import Problem, get_state_literals
+from .reader import read_domain, read_problem
+from .pddl_grammar import parse_pddl_domain, parse_pddl_problem
+from .proposition_space import PropositionSpace, PropositionNames
+from .action_schema import ActionSchema, get_relation_bases, compile_actions
+from .incremental_ground import IncrementalGrounding
+from .relevance import GoalRelevance
+from .ground import (run_ground, run_ground_layered, iter_ground, create_reached_list, GroundingCounters, GroundingLayers,
+                     GroundActionRegistry, ReachedView)
+from .parallel_ground import run_ground_parallel
+from .writer import BddsWriter, describe_ground_action
+from .cache import ParseCache, file_digest
+from .stats import ParserStats
+from .vectors import StateVectors
+from contextlib import nullcontext
+from array import array
+from typing import BinaryIO, Iterator, TextIO, Union
+import os
 
 class Parser:
     """Represents the Parser, the central unit for domain and problem analysis.
@@ -14,93 +27,261 @@ class Parser:
         problem (Problem): The parsed representation of the specific planning problem.
         actions (list[Action]): The list of actions defined in the domain.
         objects (dict[str, list[Object]]): A dictionary mapping object types (str) to lists of corresponding objects.
-        propositions (list[Proposition]): The list of all possible propositions in the domain.
-        dict_propositions (dict[str, Proposition]): A dictionary mapping proposition names (str) to Proposition objects.
+        propositions (PropositionSpace): The space of all possible propositions in the domain, indexed arithmetically.
+        dict_propositions (PropositionNames): A read-only mapping from proposition names (str) to Proposition objects.
         initial_state (list[int]): The bitmask representing the initial truth values of propositions (1 for true, 0 for false).
         goal_state (list[int]): The bitmask representing the goal truth values of propositions (1 for true, 0 for false, -1 for don't care).
+        prune_static (bool): Whether propositions of static predicates are left out of 'propositions'.
+        static_facts (Union[dict[str, set[tuple[str, ...]]], None]): If 'prune_static' is set, a map from the names of the static
+            predicates to the object names of their facts in the initial state; None otherwise.
+        relation_bases (dict[str, int]): A map from predicate names to their predicate number (see 'get_relation_bases').
+        schemas (list[ActionSchema]): The actions of the domain, compiled against 'propositions', in the same order as 'actions'.
+        reader (str): The reader of the PDDL files, either "pddl" or "builtin".
+        grammar_cache (Union[bool, str]): The cache of the grammar tables of the 'pddl' library (see 'get_pddl_parser').
+        grounding (str): The grounding engine, either "queue", "layered" or "parallel".
+        workers (Union[int, None]): The number of worker processes of the "parallel" engine (None for the number of CPUs).
+        layers (Union[GroundingLayers, None]): The per-layer statistics of the grounding, if 'grounding' is "layered" or
+            "parallel" and the problem was grounded rather than loaded from a cache; None otherwise.
+        streaming (bool): Whether the reachable actions are grounded each time they are consumed, without being kept.
+        reachable_actions (Union[list[tuple[Action, tuple[Object]]], None]): The reachable actions and their objects, or None
+            if 'streaming' is set.
+        reachable_propositions (Union[ReachedView, None]): The entries indicating whether each proposition (and its negation)
+            is reachable; if 'streaming' is set, None until the actions are first consumed in full.
+        registry (GroundActionRegistry): The reachable instantiated actions, each registered once, by schema and object ids;
+            if 'streaming' is set, only their keys, from the latest grounding.
+        cache_key (Union[str, None]): The key of the problem in the cache given at initialization, or None if no cache was used.
+        stats (Union[ParserStats, None]): The time, memory and work counters of each phase, if instrumentation was requested;
+            None otherwise.
+        state_vectors (Union[StateVectors, None]): The NumPy arrays of the states, once built by 'get_state_vectors'.
+        incremental (Union[IncrementalGrounding, None]): The grounding kept between updates of the problem, once created by
+            'update_initial_state' or 'add_objects'.
+        relevant_only (bool): Whether the output only has the actions and propositions relevant to the goal.
+        relevance (Union[GoalRelevance, None]): The actions and propositions relevant to the goal, once computed by
+            'get_relevance'.
 
     Examples:
         >>> parser1 = Parser("tests/examples/gripper3.pddl", "tests/examples/gripper3_3_balls.pddl")
         >>> parser2 = Parser("tests/examples/triangle-tire.pddl", "tests/examples/triangle-tire-1.pddl")
+        >>> domain = load_domain("tests/examples/gripper3.pddl")
+        >>> problem_paths = ["tests/examples/gripper3_1_ball.pddl", "tests/examples/gripper3_3_balls.pddl"]
+        >>> parsers = [Parser(domain, problem_path) for problem_path in problem_paths]
     """
 
-    def __init__(self, domain_path: str, problem_path: str) -> None:
+    def __init__(self, domain_path: Union[str, Domain], problem_path: str, prune_static: bool = True,
+                 grounding: str = "queue", workers: Union[int, None] = None,
+                 cache: Union[ParseCache, str, None] = None, stats: Union[ParserStats, bool, None] = None,
+                 streaming: bool = False, reader: str = "pddl", relevant_only: bool = False,
+                 grammar_cache: Union[bool, str] = True) -> None:
         """Initializes the 'Parser' object by parsing PDDL domain and problem files.
 
         Args:
-            domain_path (str): The file path to the PDDL domain definition.
+            domain_path (Union[str, Domain]): The file path to the PDDL domain definition, or a 'Domain' object already built
+                from it (see 'load_domain'), which is then shared instead of parsed again.
             problem_path (str): The file path to the PDDL problem definition.
+            prune_static (bool): Whether to leave propositions of static predicates (those that no action modifies) out of
+                the propositions, evaluating them against the initial state instead. The goal facts over them are then
+                checked once: those that hold in the initial state are dropped, and the others raise an error, since no
+                plan can reach them. Defaults to True.
+            grounding (str): The grounding engine. "queue" processes one reached proposition at a time; "layered" computes
+                the reachable actions layer by layer, in deterministic order, and stores per-layer statistics in 'layers';
+                "parallel" gives the same result as "layered", splitting each layer across worker processes
+                (see 'run_ground_parallel'). Defaults to "queue".
+            workers (Union[int, None]): The number of worker processes of the "parallel" engine. Defaults to None, i.e.,
+                the number of CPUs.
+            cache (Union[ParseCache, str, None]): A cache of parsed and grounded problems, or the path of its directory. If
+                the problem is found in it, with the same domain and options, its state is loaded and nothing is parsed or
+                grounded; otherwise, the state is stored in it once computed. The grounding engine does not take part in the
+                key, since every engine gives the same problem, and the arguments that do not change the result ('reader',
+                'grammar_cache', 'grounding', 'workers', and the domain if given as a 'Domain' object) are not stored, but
+                taken from this call. The cache is not used if the domain is given as a 'Domain' object not built by
+                'load_domain'. Defaults to None.
+            stats (Union[ParserStats, bool, None]): The object where the time (and optionally the peak memory) of each phase
+                and the work counters are recorded, including those of later calls to 'print_bdds' and 'print_binary'; True
+                creates one without memory tracking. Defaults to None, i.e., no instrumentation.
+            streaming (bool): Whether to defer the grounding until the reachable actions are consumed, by
+                'iter_reachable_actions', 'print_bdds' or 'print_binary', which then ground them as they write them, so that
+                they are never all in memory at once. Only the "queue" engine can stream. Defaults to False.
+            reader (str): The reader of the PDDL files. "pddl" uses the 'pddl' library; "builtin" uses the faster reader of
+                'read_domain' and 'read_problem', and falls back to the 'pddl' library for a file outside the subset they
+                support (the fallbacks are counted in 'stats' as "reader_fallbacks"). Objects and actions are then kept in
+                the order of the files. Defaults to "pddl".
+            relevant_only (bool): Whether 'print_bdds' and 'print_binary' only write the actions and propositions relevant
+                to the goal (see 'get_relevance'), leaving out the reachable actions that no plan needs; the number of
+                actions left out is counted in 'stats' as "irrelevant_actions". It does not take part in the cache key.
+                Defaults to False.
+            grammar_cache (Union[bool, str]): The cache of the grammar tables of the 'pddl' library, when it reads a file
+                (see 'get_pddl_parser'): True for a file in the private cache directory of the user, a string for the path
+                of the file, or False for no cache. It does not take part in the cache key. Defaults to True.
+
+        Raises:
+            ValueError: If 'grounding' is not a known engine, if 'streaming' is set with another engine than "queue", if
+                'reader' is not a known reader, if both 'streaming' and 'relevant_only' are set, or if 'prune_static' is set
+                and the goal asks for a fact over a static predicate that the initial state does not give.
 
         Note:
             The initialization process assumes a valid and coherent relationship between the problem and domain definitions.
         """
-        parsed_problem = parse_problem(problem_path)
-        parsed_domain = parse_domain(domain_path)
-        self.problem = Problem(parsed_problem)
-        self.domain = Domain(parsed_domain)
-        self.__store_basic_elements(parsed_problem)
-        self.actions = self.domain.get_actions()
-        self.reachable_actions, self.reachable_propositions = self.__instantiate_reachable_actions()
-
-    def __print_problem_name(self, output_file: TextIO) -> None:
-        """Writes the problem name, enclosed in 'begin_problem_name' and 'end_problem_name' tags, to the specified output stream.
-
-        Args:
-            output_file (TextIO): The text stream where the formatted problem name should be written.
-        """
-        output_file.write("begin_problem_name\n")
-        output_file.write(self.problem.get_name() + "\n")
-        output_file.write("end_problem_name\n")
-
-    def __print_propositions(self, output_file: TextIO) -> None:
-        """Writes propositions and their indices, enclosed in 'begin_propositions' and 'end_propositions' tags, to the specified output stream.
-
-        Args:
-            output_file (TextIO): The text stream where the formatted propositions should be written.
-        """
-        output_file.write("begin_propositions\n")
-        output_file.write(str(len(self.propositions)) + "\n")
-        for i, proposition in enumerate(self.propositions):
-            output_file.write(str(proposition) + " " + str(i) + "\n")
-        output_file.write("end_propositions\n")
-
-    def __print_initial_state(self, output_file: TextIO) -> None:
-        """Writes the initial state, enclosed in 'begin_initial_state' and 'end_initial_state' tags, to the specified output stream.
-
-        Args:
-            output_file (TextIO): The text stream where the formatted initial state should be written.
-        """
-        output_file.write("begin_initial_state\n")
-        output_file.write(str(len(self.initial_state)) + "\n")
-        for i, proposition in enumerate(self.initial_state):
-            output_file.write(str(i) + " " + str(proposition) + "\n")
-        output_file.write("end_initial_state\n")
-
-    def __print_goal_state(self, output_file: TextIO) -> None:
-        """Writes the goal state, enclosed in 'begin_goal_state' and 'end_goal_state' tags, to the specified output stream.
+        if grounding not in ("queue", "layered", "parallel"):
+            raise ValueError("unknown grounding engine: " + str(grounding))
+        if streaming and grounding != "queue":
+            raise ValueError("streaming requires the queue grounding engine, not " + str(grounding))
+        if reader not in ("pddl", "builtin"):
+            raise ValueError("unknown reader: " + str(reader))
+        if streaming and relevant_only:
+            raise ValueError("the relevance analysis needs the reachable actions, which streaming does not keep")
+        self.stats = ParserStats() if stats is True else (stats or None)
+        self.state_vectors = None
+        self.incremental = None
+        self.relevant_only = relevant_only
+        self.relevance = None
+        self.cache_key = None
+        caller_attributes = {"reader": reader, "grammar_cache": grammar_cache, "grounding": grounding, "workers": workers}
+        if isinstance(domain_path, Domain):
+            caller_attributes["domain"] = domain_path
+        if cache is not None:
+            with self.__phase("cache_load"):
+                if not isinstance(cache, ParseCache):
+                    cache = ParseCache(cache)
+                domain_digest = domain_path.source_digest if isinstance(domain_path, Domain) else file_digest(domain_path)
+                state = None
+                if domain_digest is not None:
+                    self.cache_key = cache.get_key(domain_digest, file_digest(problem_path), prune_static=prune_static,
+                                                   streaming=streaming)
+                    state = cache.load(self.cache_key)
+            if state is not None:
+                self.__restore_state(state, caller_attributes)
+                self.__count_results()
+                return
+        self.reader = reader
+        self.grammar_cache = grammar_cache
+        self.problem, initial_literals, goal_literals = self.__load_problem(problem_path)
+        if isinstance(domain_path, Domain):
+            self.domain = domain_path
+        else:
+            self.domain = self.__load_domain(domain_path)
+            self.domain.source_digest = file_digest(domain_path)
+        self.prune_static = prune_static
+        self.grounding = grounding
+        self.workers = workers
+        self.streaming = streaming
+        self.layers = None
+        self.registry = GroundActionRegistry(keep_actions=not streaming)
+        self.__store_basic_elements(initial_literals, goal_literals)
+        with self.__phase("compile_schemas"):
+            self.actions = self.domain.get_actions()
+            self.relation_bases = get_relation_bases(self.propositions, self.domain.get_predicates())
+            self.schemas = compile_actions(self.actions, self.propositions, self.relation_bases)
+        if streaming:
+            self.reachable_actions, self.reachable_propositions = None, None
+        else:
+            with self.__phase("ground"):
+                self.reachable_actions, self.reachable_propositions = self.__instantiate_reachable_actions()
+        self.__count_results()
+        if self.cache_key is not None:
+            with self.__phase("cache_store"):
+                cache.store(self.cache_key, {name: value for name, value in self.__dict__.items()
+                                             if name not in caller_attributes and
+                                             name not in ("stats", "state_vectors", "incremental", "relevant_only",
+                                                          "relevance", "layers")})
+
+    def __phase(self, name: str):
+        """Returns a context manager that measures a phase in 'stats', or does nothing if 'stats' is None."""
+        return self.stats.phase(name) if self.stats is not None else nullcontext()
+
+    def __restore_state(self, state: dict, caller_attributes: dict) -> None:
+        """Restores the state loaded from a cache, along with the attributes given by the caller, which are not stored.
 
         Args:
-            output_file (TextIO): The text stream (file or similar) where the formatted goal state should be written.
+            state (dict): The stored state (see 'ParseCache.load').
+            caller_attributes (dict): The attributes taken from the arguments of the initialization, including the domain if
+                it was given as a 'Domain' object.
 
         Note:
-            Propositions with an indeterminate goal value (-1) are omitted from the output.
+            If the domain was given as a 'Domain' object, the compiled schemas and the reachable actions are bound to its
+            actions, instead of to the copies loaded with the state.
         """
-        output_file.write("begin_goal_state\n")
-        for i, proposition in enumerate(self.goal_state):
-            if(self.goal_state[i] != -1):
-                output_file.write(str(i) + " " + str(self.goal_state[i]) +  "\n")
-        output_file.write("end_goal_state\n")
+        self.__dict__.update(state)
+        self.__dict__.update(caller_attributes)
+        self.layers = None
+        if "domain" in caller_attributes:
+            self.actions = self.domain.get_actions()
+            for schema, action in zip(self.schemas, self.actions):
+                schema.action = action
+            if self.reachable_actions is not None:
+                self.reachable_actions = self.registry.get_actions(self.propositions.object_list)
+
+    def __count_results(self) -> None:
+        """Records the sizes of the propositions, the states and the reachable actions in 'stats', if set."""
+        if self.stats is None:
+            return
+        self.stats.count("propositions", len(self.propositions))
+        self.stats.count("initial_true", self.initial_state.count(1))
+        self.stats.count("goal_entries", len(self.goal_state) - self.goal_state.count(-1))
+        if self.reachable_propositions is None:
+            return
+        self.stats.count("reachable_pairs", self.reachable_propositions.count(1))
+        self.stats.count("actions", len(self.registry))
+        self.stats.count("duplicate_actions", self.registry.get_duplicates())
+
+    def __load_problem(self, problem_path: str) -> tuple[Problem, list[tuple[str, tuple[str, ...], bool]],
+                                                         list[tuple[str, tuple[str, ...], bool]]]:
+        """Reads the problem file with the reader selected by 'reader', falling back to the 'pddl' library if needed.
 
-    def __store_basic_elements(self, parsed_problem) -> None:
+        Returns:
+            Problem: The problem.
+            list[tuple[str, tuple[str, ...], bool]]: The literals of the initial state (see 'get_state_literals').
+            list[tuple[str, tuple[str, ...], bool]]: The literals of the goal.
+        """
+        if self.reader == "builtin":
+            try:
+                with self.__phase("parse_problem"):
+                    return read_problem(problem_path)
+            except ValueError:
+                self.__count_fallback()
+        with self.__phase("parse_problem"):
+            parsed_problem = parse_pddl_problem(problem_path, self.grammar_cache)
+        with self.__phase("build_problem"):
+            problem = Problem(parsed_problem)
+            initial_literals = get_state_literals(parsed_problem.init)
+            goal_literals = get_state_literals(parsed_problem.goal)
+        return (problem, initial_literals, goal_literals)
+
+    def __load_domain(self, domain_path: str) -> Domain:
+        """Reads the domain file with the reader selected by 'reader', falling back to the 'pddl' library if needed."""
+        if self.reader == "builtin":
+            try:
+                with self.__phase("parse_domain"):
+                    return read_domain(domain_path)
+            except ValueError:
+                self.__count_fallback()
+        with self.__phase("parse_domain"):
+            parsed_domain = parse_pddl_domain(domain_path, self.grammar_cache)
+        with self.__phase("build_domain"):
+            return Domain(parsed_domain)
+
+    def __count_fallback(self) -> None:
+        """Counts, in 'stats' if set, a file that the built-in reader left to the 'pddl' library."""
+        if self.stats is not None:
+            self.stats.count("reader_fallbacks", 1)
+
+    def __store_basic_elements(self, initial_literals: list[tuple[str, tuple[str, ...], bool]],
+                               goal_literals: list[tuple[str, tuple[str, ...], bool]]) -> None:
         """Pre-proccess and store some complementary attributes.
 
         Args:
-            parsed_problem: The parsed problem description.
+            initial_literals (list[tuple[str, tuple[str, ...], bool]]): The literals of the initial state.
+            goal_literals (list[tuple[str, tuple[str, ...], bool]]): The literals of the goal.
         """
-        self.objects = self.__merge_obj_const()
-        self.propositions, self.dict_propositions = self.__store_propositions()
-        self.initial_state = self.__process_state(parsed_problem.init, 0)
-        self.goal_state = self.__process_state(parsed_problem.goal, -1)
+        with self.__phase("propositions"):
+            self.objects = self.__merge_obj_const()
+            self.propositions, self.dict_propositions = self.__store_propositions()
+        with self.__phase("static_facts"):
+            self.static_facts = self.__store_static_facts(initial_literals) if self.prune_static else None
+            if self.static_facts is not None:
+                self.__check_static_goal(goal_literals, self.static_facts)
+        with self.__phase("states"):
+            self.initial_state = self.__process_state(initial_literals, 0)
+            self.goal_state = self.__process_state(goal_literals, -1)
 
     def __merge_obj_const(self) -> dict[str, list[Object]]:
         """Combines domain constants and problem objects into a unified object dictionary.
@@ -110,210 +291,323 @@ class Parser:
 
         Note:
             This method assumes that object types are consistent between the domain and problem definitions.
+            Constants are appended to the problem objects of the same type, unless an object with the same name is declared.
         """
-        objects = self.problem.get_objects()
-        constants = self.domain.get_constants()
-        objects.update(constants)
+        objects = {object_type: type_objects[:] for object_type, type_objects in self.problem.get_objects().items()}
+        for constant_type, constants in self.domain.get_constants().items():
+            type_objects = objects.setdefault(constant_type, [])
+            for constant in constants:
+                if constant not in type_objects:
+                    type_objects.append(constant)
         return objects
 
-    def __store_propositions(self) -> tuple[list[Proposition], dict[str, Proposition]]:
-        """Builds a list of propositions, along with a map from the names to the 'Proposition' objects.
+    def __store_propositions(self) -> tuple[PropositionSpace, PropositionNames]:
+        """Builds the space of propositions, along with a map from the names to the 'Proposition' objects.
 
         Returns:
-            list[Proposition]: The list of propositions of the corresponding PDDL domain.
-            dict[str, Proposition]): A map from the proposition names to the 'Proposition' objects.
-        """
-        propositions = []
-        dict_propositions = {}
-        predicates = self.domain.get_predicates()
-
-        for _, predicate in predicates.items():
-            object_combinations = self.__get_object_combinations(predicate)
-            for obj_combination in object_combinations:
-                proposition = Proposition(predicate, list(obj_combination), len(propositions))
-                propositions.append(proposition)
-                dict_propositions[str(proposition)] = proposition
+            PropositionSpace: The space of propositions of the corresponding PDDL domain.
+            PropositionNames: A map from the proposition names to the 'Proposition' objects.
 
+        Note:
+            No proposition is stored; they are materialized on demand from their indices.
+            If 'prune_static' is set, only the fluent predicates take part in the space.
+        """
+        if self.prune_static:
+            predicates = self.domain.get_fluent_predicates()
+        else:
+            predicates = self.domain.get_predicates()
+        propositions = PropositionSpace(predicates, self.objects)
+        dict_propositions = PropositionNames(propositions)
         return propositions, dict_propositions
 
-    def __is_proposition_negated(self, parsed_prop) -> bool:
-        """Determines whether a parsed proposition is negated.
+    def __store_static_facts(self, initial_literals: list[tuple[str, tuple[str, ...], bool]]) -> dict[str, set[tuple[str, ...]]]:
+        """Builds the lookup tables of the static predicates from the initial state.
 
         Args:
-            parsed_prop: The parsed proposition description.
+            initial_literals (list[tuple[str, tuple[str, ...], bool]]): The literals of the initial state of the PDDL problem.
 
         Returns:
-            bool: True if the proposition is negated; False otherwise.
+            dict[str, set[tuple[str, ...]]]: A map from the names of the static predicates to the set of tuples of object names
+                for which the predicate holds in the initial state.
         """
-        return (str(type(parsed_prop)) == "<class 'pddl.logic.base.Not'>")
+        static_facts = {name: set() for name in self.domain.get_static_predicates()}
+        for predicate_name, object_names, value in initial_literals:
+            if value and predicate_name in static_facts:
+                static_facts[predicate_name].add(object_names)
+        return static_facts
 
-    def __build_proposition_names(self, parsed_prop, is_negated: bool) -> str:
-        """Constructs a standardized proposition name string from a parsed proposition.
+    def __check_static_goal(self, goal_literals: list[tuple[str, tuple[str, ...], bool]],
+                            static_facts: dict[str, set[tuple[str, ...]]]) -> None:
+        """Checks the goal facts over static predicates, which are left out of the propositions, against the initial state.
 
         Args:
-            parsed_prop: The parsed proposition description.
-            is_negated (bool): Indicates whether the proposition is negated.
+            goal_literals (list[tuple[str, tuple[str, ...], bool]]): The literals of the goal.
+            static_facts (dict[str, set[tuple[str, ...]]]): The lookup tables of the static predicates (see
+                '__store_static_facts').
 
-        Returns:
-            str: The standardized proposition name
+        Raises:
+            ValueError: If a goal fact over a static predicate does not hold in the initial state, and hence in any state.
         """
-        low = 1
-        high = -1
-        if is_negated:
-            low = 6
-            high = -2
-
-        return '_'.join(str(parsed_prop)[low:high].split())
+        for predicate_name, object_names, value in goal_literals:
+            facts = static_facts.get(predicate_name)
+            if facts is not None and (tuple(object_names) in facts) != value:
+                raise ValueError("the goal fact " + ("" if value else "not ") + predicate_name + str(tuple(object_names)) +
+                                 " is over a static predicate and does not hold in the initial state")
 
-    def __process_state(self, parsed_state, default_value: int) -> list[int]:
-        """Converts a parsed PDDL state into the list of truth values for propositions.
+    def __process_state(self, literals: list[tuple[str, tuple[str, ...], bool]], default_value: int) -> list[int]:
+        """Converts the literals of a PDDL state into the list of truth values for propositions.
 
         Args:
-            parsed_state: The parsed state object from the PDDL problem.
+            literals (list[tuple[str, tuple[str, ...], bool]]): The name of the predicate, the names of the objects and the
+                value of each fact of the state (see 'get_state_literals').
             default_value (int, optional): The default value to use for propositions not explicitly mentioned in the state. Defaults to 'default_value'.
 
         Returns:
             list[int]: The list of truth values (1 for true, 0 for false, 'default_value' for don't care) corresponding to the propositions defined in the domain. The list's length matches the number of propositions.
+
+        Note:
+            Each fact is resolved to its proposition index arithmetically, from the names of its predicate and objects,
+            so the cost is linear in the size of the state. Facts that do not correspond to any proposition are ignored;
+            those over pruned static predicates are checked against the initial state beforehand (see
+            '__check_static_goal').
         """
-        if (str(type(parsed_state)) == "<class 'pddl.logic.base.And'>" ):
-            parsed_state = parsed_state.operands
-        elif (str(type(parsed_state)) == "<class 'pddl.logic.predicates.Predicate'>"):
-            parsed_state = (parsed_state,)
-        state = [default_value for i in range(len(self.propositions))]
-        for parsed_prop in parsed_state:
-            prop_is_negated = self.__is_proposition_negated(parsed_prop)
-            prop_names = self.__build_proposition_names(parsed_prop, prop_is_negated)
-            for i, proposition in enumerate(self.propositions):
-                if proposition.compare_names(prop_names):
-                    state[i] = 0 if prop_is_negated else 1
+        state = [default_value] * len(self.propositions)
+        for predicate_name, object_names, value in literals:
+            index = self.propositions.index_of(predicate_name, object_names)
+            if index != -1:
+                state[index] = 1 if value else 0
         return state
 
-    def __get_object_combinations(self, predicate: Predicate) -> tuple[Object]:
-        """Generates unique combinations of objects that satisfy a given predicate's variable types.
+    def __instantiate_reachable_actions(self) -> tuple[list[tuple[Action, tuple[Object]]], ReachedView]:
+        """Calls the grounding engine selected by 'grounding' and returns the reachable actions and propositions."""
+        counters = GroundingCounters() if self.stats is not None else None
+        if self.grounding == "layered":
+            reachable_actions, reachable_propositions, self.layers = run_ground_layered(self.initial_state, self.propositions,
+                                                                                        self.schemas,
+                                                                                        self.relation_bases,
+                                                                                        self.static_facts,
+                                                                                        self.registry,
+                                                                                        counters)
+        elif self.grounding == "parallel":
+            reachable_actions, reachable_propositions, self.layers = run_ground_parallel(self.initial_state, self.propositions,
+                                                                                         self.schemas,
+                                                                                         self.relation_bases,
+                                                                                         self.static_facts,
+                                                                                         self.registry,
+                                                                                         self.workers,
+                                                                                         counters=counters)
+        else:
+            reachable_actions, reachable_propositions = run_ground(self.initial_state, self.propositions,
+                                           self.schemas,
+                                           self.relation_bases,
+                                           self.static_facts,
+                                           self.registry,
+                                           counters)
+        if counters is not None:
+            for name, value in counters.as_dict().items():
+                self.stats.count(name, value)
+        return (reachable_actions, reachable_propositions)
 
-        This method takes a predicate and identifies the types of variables it expects. It then retrieves all objects of those types and creates unique combinations where each object in a combination is of the required type.
+    def __stream_reachable_actions(self, reached: array) -> Iterator[tuple[ActionSchema, tuple[int, ...], list[list[tuple[int, bool]]]]]:
+        """Grounds the reachable actions with 'iter_ground', generating each one as it is found (see 'streaming').
 
         Args:
-            predicate (Predicate): The predicate for which object combinations are to be generated.
+            reached (array): The list of reached propositions, created by 'create_reached_list', which is filled in place.
 
-        Returns:
-            list[tuple[Object, ...]]: The list of tuples, where each tuple represents a unique combination of objects that can satisfy the predicate's variable types.
+        Note:
+            'registry' is replaced with the one of this grounding, so that the keys of an earlier one are released. Once all
+            actions are generated, 'reachable_propositions' is set, and the work counters, as well as the sizes of the results
+            the first time, are recorded in 'stats'.
         """
-        variable_types = predicate.get_variable_types()
-
-        object_combinations = []
-        for variable_type in variable_types:
-            objects_of_type = self.objects.get(variable_type, [])
-            object_combinations.append(objects_of_type)
-
-        all_products = itertools.product(*object_combinations)
+        counters = GroundingCounters() if self.stats is not None else None
+        registry = self.registry = GroundActionRegistry(keep_actions=False)
+        yield from iter_ground(self.initial_state, self.propositions, self.schemas, self.relation_bases, self.static_facts,
+                               registry, counters, reached)
+        first_time = self.reachable_propositions is None
+        self.reachable_propositions = ReachedView(reached)
+        if counters is not None:
+            for name, value in counters.as_dict().items():
+                self.stats.count(name, value)
+            if first_time:
+                self.stats.count("reachable_pairs", self.reachable_propositions.count(1))
+                self.stats.count("actions", len(registry))
+                self.stats.count("duplicate_actions", registry.get_duplicates())
+
+    def update_initial_state(self, initial_state: list[int]) -> tuple[int, int]:
+        """Replaces the initial state, updating the reachable actions and propositions from those of the current one.
+
+        Only the actions and propositions depending on the (proposition, value) pairs that changed are grounded again (see
+        'IncrementalGrounding'), instead of the whole problem; the propositions keep their indices, and the actions left
+        keep their order, with the new ones after them. The static facts are those of the problem file.
 
-        unique_products = [tup for tup in all_products if len(tup) == len(set(tup))]
-
-        return unique_products
+        Args:
+            initial_state (list[int]): The new initial state, with the value (1 for true, 0 for false) of each proposition,
+                as returned by 'get_initial_state'.
 
-    def __instantiate_reachable_actions(self) -> tuple[list[tuple[Action, tuple[Object]]], list[int]]:
-        """Calls the function run_ground and returns the tuple returned by the call."""
-        reachable_actions, reachable_propositions = run_ground(self.initial_state, self.propositions,
-                                       self.dict_propositions,
-                                       self.domain.get_pred_to_actions(),
-                                       self.problem.get_objects())
-        return (reachable_actions, reachable_propositions)
+        Returns:
+            tuple[int, int]: The number of reachable actions added and the number of those removed.
 
-    def __build_instantiated_action_name(self, action: Action, parameters: tuple[Object]) -> str:
-        """Builds an instantiated action name by combining the action name and the parameters names."""
-        name = str(action)
-        for parameter in parameters:
-            name += "_" + str(parameter)
-        return name
+        Raises:
+            ValueError: If 'streaming' is set, or if 'initial_state' does not give a value of 0 or 1 to each proposition.
 
-    def __print_preconditions_reachable_action(self, action: Action, parameters: tuple[Object], output_file: TextIO) -> None:
-        """Writes the preconditions of a reachable action to the specified output stream.
+        Note:
+            The layers of a layered or parallel grounding (see 'get_layers') no longer apply, and are dropped.
 
-        Args:
-            action (Action): The instantiated action.
-            parameters (tuple[Object]): The parameters of the instantiated action.
-            output_file (TextIO): The text stream where the formatted effects of the reachable action should be written.
+        Examples:
+            >>> initial_state = parser.get_initial_state()[:]
+            >>> initial_state[parser.get_propositions().index_of("at-robby", ["roomb"])] = 1
+            >>> initial_state[parser.get_propositions().index_of("at-robby", ["rooma"])] = 0
+            >>> num_added, num_removed = parser.update_initial_state(initial_state)
         """
-        preconditions = action.get_preconditions()
+        if self.streaming:
+            raise ValueError("the initial state of a streaming parser cannot be updated")
+        if len(initial_state) != len(self.propositions) or any(value not in (0, 1) for value in initial_state):
+            raise ValueError("the initial state must give a value of 0 or 1 to each of the " + str(len(self.propositions))
+                             + " propositions")
+        with self.__phase("update_ground"):
+            counters = GroundingCounters() if self.stats is not None else None
+            num_added, num_removed = self.__get_incremental().update(initial_state, counters)
+            self.initial_state = list(initial_state)
+            self.reachable_actions = self.registry.get_actions(self.propositions.object_list)
+            self.layers = None
+            self.state_vectors = None
+            self.relevance = None
+        if counters is not None:
+            for name, value in counters.as_dict().items():
+                self.stats.count(name, value)
+            self.stats.count("updated_actions_added", num_added)
+            self.stats.count("updated_actions_removed", num_removed)
+        return (num_added, num_removed)
+
+    def add_objects(self, objects: dict[str, list[str]],
+                    initial_literals: list[tuple[str, tuple[str, ...], bool]] = (),
+                    goal_literals: list[tuple[str, tuple[str, ...], bool]] = ()) -> tuple[int, int]:
+        """Adds objects to the problem, grounding only the propositions and actions they take part in.
+
+        The new propositions get the indices after the current ones (see 'PropositionSpace.add_objects'), with a false
+        initial value and no goal value unless the literals give them one, and the actions with a new object are appended to
+        the reachable ones (see 'IncrementalGrounding.add_objects'); nothing else is grounded again. The literals can only
+        concern the new objects, so that the rest of the problem is left as it is.
 
-        output_file.write(str(len(preconditions)) + "\n")
-        for precondition in preconditions:
-            generic_proposition, value = precondition
-            proposition = find_proposition(generic_proposition, parameters,
-                                            self.dict_propositions, action.get_parameters())
-            proposition_index = proposition.get_index()
-            output_file.write(str(proposition_index) + " " + str(int(value))  + "\n")
+        Args:
+            objects (dict[str, list[str]]): A map from types to the names of the objects to add.
+            initial_literals (list[tuple[str, tuple[str, ...], bool]]): The literals of the initial state with a new object,
+                as (predicate name, object names, value) tuples (see 'get_state_literals'), including the static facts.
+                Defaults to none.
+            goal_literals (list[tuple[str, tuple[str, ...], bool]]): The literals of the goal with a new object. Defaults
+                to none.
 
-    def __print_effects_reachable_action(self, action: Action, parameters: tuple[Object], output_file: TextIO) -> None:
-        """Writes the effects of a reachable action, enclosed in 'begin_nd_effects' and 'end_nd_effects' tags, to the specified output stream.
+        Returns:
+            tuple[int, int]: The number of propositions added and the number of reachable actions added.
 
-        Args:
-            output_file (TextIO): The text stream where the formatted effects of the reachable action should be written.
-        """
-        effects = action.get_effects()
-        output_file.write("begin_nd_effects\n")
+        Raises:
+            ValueError: If 'streaming' is set, if an object has the name of an object of the problem, if a literal has no
+                new object, or if a goal literal over a pruned static predicate does not hold in the initial state.
 
-        if len(effects) == 0:
-            output_file.write("1\n")
-            output_file.write("effects\n")
-            self.__print_preconditions_reachable_action(action, parameters, output_file)
-        else:
-            output_file.write(str(len(effects)) + "\n")
-            for effect_scenario in effects:
-                output_file.write("effects\n")
-                if len(effect_scenario) == 0:
-                    self.__print_preconditions_reachable_action(action, parameters, output_file)
-                else:
-                    output_file.write(str(len(effect_scenario)) + "\n")
-                    for effect_tuple in effect_scenario:
-                        generic_proposition, value = effect_tuple
-                        proposition = find_proposition(generic_proposition, parameters,
-                                                        self.dict_propositions, action.get_parameters())
-                        output_file.write(str(proposition.get_index()) + " " + str(int(value)) + "\n")
-        output_file.write("end_nd_effects\n")
-
-    def __print_reachable_actions(self, output_file: TextIO) -> None:
-        """Writes the reachable actions, enclosed in 'begin_actions' and 'end_actions' tags, to the specified output stream.
+        Note:
+            The layers of a layered or parallel grounding (see 'get_layers') no longer apply, and are dropped; the view
+            in 'reachable_propositions' is replaced.
 
-        Args:
-            output_file (TextIO): The text stream where the formatted reachable actions should be written.
+        Examples:
+            >>> parser.add_objects({"ball": ["ball4"]}, [("at-ball", ("ball4", "rooma"), True)],
+            ...                    [("at-ball", ("ball4", "roomb"), True)])
         """
-        output_file.write("begin_actions\n")
-        output_file.write(str(len(self.reachable_actions)) + "\n")
-        for action_tup in self.reachable_actions:
-            action, parameters = action_tup
-            output_file.write("begin_action\n")
-            action_name = self.__build_instantiated_action_name(action, parameters)
-            output_file.write(action_name + "\n")
-            output_file.write("preconditions\n")
-            self.__print_preconditions_reachable_action(action, parameters, output_file)
-            self.__print_effects_reachable_action(action, parameters, output_file)
-            output_file.write("end_action\n")
-        output_file.write("end_actions\n")
-        return
-
-    def __print_reachable_propositions(self, output_file: TextIO) -> None:
-        """Writes the reachable propositions, enclosed in 'begin_reachable_propositions' and 'end_reachable_propositions' tags, to the specified output stream.
-
-        Args:
-            output_file (TextIO): The text stream where the formatted reachable proposition should be written.
+        if self.streaming:
+            raise ValueError("objects cannot be added to a streaming parser")
+        names = {name for object_names in objects.values() for name in object_names}
+        for _, object_names, _ in list(initial_literals) + list(goal_literals):
+            if not any(name in names for name in object_names):
+                raise ValueError("the literals must have a new object, not only " + str(object_names))
+        if self.static_facts is not None:
+            static_facts = {name: set(facts) for name, facts in self.static_facts.items()}
+            for predicate_name, object_names, value in initial_literals:
+                if value and predicate_name in static_facts:
+                    static_facts[predicate_name].add(tuple(object_names))
+            self.__check_static_goal(goal_literals, static_facts)
+        with self.__phase("add_objects"):
+            incremental = self.__get_incremental()
+            num_objects = len(self.propositions.object_list)
+            num_actions = len(self.registry)
+            num_added = self.propositions.add_objects({object_type: [Object(name, object_type) for name in object_names]
+                                                       for object_type, object_names in objects.items()})
+            self.initial_state.extend([0] * num_added)
+            self.goal_state.extend([-1] * num_added)
+            static_facts = {}
+            for predicate_name, object_names, value in initial_literals:
+                index = self.propositions.index_of(predicate_name, object_names)
+                if index != -1:
+                    self.initial_state[index] = 1 if value else 0
+                elif value and self.static_facts is not None and predicate_name in self.static_facts:
+                    self.static_facts[predicate_name].add(tuple(object_names))
+                    static_facts.setdefault(predicate_name, set()).add(tuple(object_names))
+            for predicate_name, object_names, value in goal_literals:
+                index = self.propositions.index_of(predicate_name, object_names)
+                if index != -1:
+                    self.goal_state[index] = 1 if value else 0
+            counters = GroundingCounters() if self.stats is not None else None
+            num_new_actions = incremental.add_objects(list(range(num_objects, len(self.propositions.object_list))),
+                                                      self.initial_state, static_facts, counters)
+            self.reachable_propositions = ReachedView(incremental.reached)
+            self.reachable_actions.extend(self.registry.get_actions(self.propositions.object_list, num_actions))
+            self.layers = None
+            self.state_vectors = None
+            self.relevance = None
+        if counters is not None:
+            for name, value in counters.as_dict().items():
+                self.stats.count(name, value)
+            self.stats.count("added_propositions", num_added)
+            self.stats.count("added_actions", num_new_actions)
+        return (num_added, num_new_actions)
+
+    def get_relevance(self) -> GoalRelevance:
+        """Gets the actions and propositions relevant to the goal, found by a backward pass over the reachable actions.
+
+        The analysis (see 'GoalRelevance') runs on the first call, as the "relevance" phase, and its sizes are counted in
+        'stats' as "relevant_actions", "irrelevant_actions" and "relevant_propositions".
+
+        Raises:
+            ValueError: If 'streaming' is set.
+        """
+        if self.relevance is None:
+            if self.streaming:
+                raise ValueError("the relevance analysis needs the reachable actions, which streaming does not keep")
+            with self.__phase("relevance"):
+                self.relevance = GoalRelevance(self.goal_state, self.registry)
+            if self.stats is not None:
+                self.stats.count("relevant_actions", len(self.relevance.get_actions()))
+                self.stats.count("irrelevant_actions", self.relevance.get_num_removed())
+                self.stats.count("relevant_propositions", len(self.relevance.get_propositions()))
+        return self.relevance
+
+    def __get_incremental(self) -> IncrementalGrounding:
+        """Gets the grounding kept between the updates of the problem, creating it from the current one on the first call."""
+        if self.incremental is None:
+            self.incremental = IncrementalGrounding(self.propositions, self.schemas, self.relation_bases,
+                                                    self.static_facts, self.initial_state, self.registry,
+                                                    self.reachable_propositions.get_array())
+        return self.incremental
+
+    def iter_reachable_actions(self) -> Iterator[tuple[str, list[tuple[int, bool]], list[list[tuple[int, bool]]]]]:
+        """Generates the name, the ground preconditions and the ground effect scenarios of each reachable action.
+
+        The preconditions and effects are (proposition index, value) pairs, as in the output (see 'describe_ground_action').
+        If 'streaming' is set, the actions are grounded anew, and each one is generated as soon as it is found, without
+        keeping it; otherwise, they are generated from 'registry'.
         """
-        output_file.write("begin_reachable_propositions\n")
-        reachable_propositions = []
-        for i in range(len(self.reachable_propositions) // 2):
-            if self.reachable_propositions[i] == 1:
-                reachable_propositions.append(i)
-        output_file.write(str(len(reachable_propositions)) + "\n")
-        for i in reachable_propositions:
-            output_file.write(str(i) + "\n")
-        output_file.write("end_reachable_propositions")
-
-    def get_propositions(self) -> list[Proposition]:
-        """Gets domain propositions list."""
+        object_list = self.propositions.object_list
+        if not self.streaming:
+            for position, (schema, parameters) in enumerate(self.registry):
+                yield describe_ground_action(schema, parameters, self.registry.get_effects(position), object_list,
+                                             self.registry.get_preconditions(position))
+            return
+        for schema, parameters, effects in self.__stream_reachable_actions(create_reached_list(self.initial_state)):
+            yield describe_ground_action(schema, parameters, effects, object_list)
+
+    def get_propositions(self) -> PropositionSpace:
+        """Gets domain propositions space."""
         return self.propositions
 
-    def get_dict_propositions(self) -> dict[str, Proposition]:
+    def get_dict_propositions(self) -> PropositionNames:
         """Gets name-to-Proposition mapping."""
         return self.dict_propositions
 
@@ -325,15 +619,46 @@ class Parser:
         """Gets problem goal state mapping."""
         return self.goal_state
 
+    def get_state_vectors(self) -> StateVectors:
+        """Gets NumPy int8 arrays of the initial state, the goal state and the reached pairs, built on the first call.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+        """
+        if self.state_vectors is None:
+            self.state_vectors = StateVectors(self.initial_state, self.goal_state, self.reachable_propositions)
+        return self.state_vectors
+
     def get_actions(self) -> list[Action]:
         """Gets domain action list."""
         return self.actions
 
     def get_reachable_actions(self):
-        """Gets the list of reachable actions, which is a list of pairs composed by the action and its respective parameters."""
+        """Gets the list of reachable actions, which is a list of pairs composed by the action and its respective parameters.
+
+        Note:
+            If 'streaming' is set, the list is built by grounding the actions again on each call; prefer
+            'iter_reachable_actions' to avoid holding it in memory.
+        """
+        if self.reachable_actions is None:
+            object_list = self.propositions.object_list
+            return [(schema.get_action(), tuple(object_list[object] for object in parameters))
+                    for schema, parameters, _ in self.__stream_reachable_actions(create_reached_list(self.initial_state))]
         return self.reachable_actions
 
-    def print_bdds(self, output_file: TextIO) -> None:
+    def get_registry(self) -> GroundActionRegistry:
+        """Gets the registry of reachable instantiated actions."""
+        return self.registry
+
+    def get_stats(self) -> Union[ParserStats, None]:
+        """Gets the instrumentation of the parser, or None if it was not requested."""
+        return self.stats
+
+    def get_layers(self) -> Union[GroundingLayers, None]:
+        """Gets the per-layer statistics of the grounding, or None if the "queue" engine was used."""
+        return self.layers
+
+    def print_bdds(self, output_file: Union[str, os.PathLike, TextIO], spill: bool = True) -> None:
         """Writes the problem definition, propositions, initial state, and goal state in a structured format to a file.
 
         This method generates a file containing a structured representation of the planning problem, including:
@@ -346,12 +671,46 @@ class Parser:
         - Reachable Propositions: Enclosed in 'begin_reachable_propositions' and 'end_reachable_propositions' tags, with the indices of the reachable propositions.
 
         Args:
-            output_file (TextIO): The text stream where the output should be written.
+            output_file (Union[str, os.PathLike, TextIO]): The path of the output file, or a text stream where the output
+                should be written (see 'BddsWriter.write').
+            spill (bool): If 'streaming' is set, whether the actions, which are grounded while they are written, are
+                spilled to a temporary file until their number, written before them, is known; otherwise, they are grounded
+                twice, first only to count them. Ignored if 'streaming' is not set. Defaults to True.
+
+        Note:
+            If 'streaming' is set, the time of the grounding is part of the "write" phase. If 'relevant_only' is set, only
+            the actions and propositions relevant to the goal are written, the propositions being renumbered in index order.
+        """
+        with self.__phase("write"):
+            self.__get_writer(spill).write(output_file)
+
+    def print_binary(self, output_file: Union[str, os.PathLike, BinaryIO]) -> None:
+        """Writes the same content as 'print_bdds' in the binary format, which can be read without parsing (see 'BinaryBdds').
+
+        Args:
+            output_file (Union[str, os.PathLike, BinaryIO]): The path of the output file, or a binary stream where the
+                output should be written.
         """
-        with open(output_file, 'w') as output_file:
-            self.__print_problem_name(output_file)
-            self.__print_propositions(output_file)
-            self.__print_initial_state(output_file)
-            self.__print_goal_state(output_file)
-            self.__print_reachable_actions(output_file)
-            self.__print_reachable_propositions(output_file)
\ No newline at end of file
+        with self.__phase("write_binary"):
+            self.__get_writer(True).write_binary(output_file)
+
+    def __get_writer(self, spill: bool) -> BddsWriter:
+        """Builds the writer of the output; if 'streaming' is set, its actions are grounded while they are written."""
+        if self.relevant_only:
+            relevance = self.get_relevance()
+            return BddsWriter(self.problem.get_name(), relevance.project_propositions(self.propositions),
+                              relevance.project_state(self.initial_state), relevance.project_state(self.goal_state), None,
+                              relevance.project_reached(self.reachable_propositions),
+                              actions=relevance.iter_actions(self.registry, self.propositions.object_list),
+                              num_actions=len(relevance.get_actions()))
+        if not self.streaming:
+            return BddsWriter.from_parser(self)
+        num_actions = None
+        if not spill:
+            num_actions = sum(1 for _ in self.__stream_reachable_actions(create_reached_list(self.initial_state)))
+        reached = create_reached_list(self.initial_state)
+        object_list = self.propositions.object_list
+        actions = (describe_ground_action(schema, parameters, effects, object_list)
+                   for schema, parameters, effects in self.__stream_reachable_actions(reached))
+        return BddsWriter(self.problem.get_name(), self.propositions, self.initial_state, self.goal_state, None,
+                          ReachedView(reached), actions=actions, num_actions=num_actions)
\ No newline at end of file
@@ -0,0 +1,110 @@
+from typing import Union
+import os
+import stat
+import sys
+
+def get_grammar_cache_dir() -> Union[str, None]:
+    """Gets the private directory of the user where the grammar tables are cached, creating it if needed.
+
+    The directory is 'parser-pddl' in the cache directory of the user ('$XDG_CACHE_HOME', or '~/.cache'), created with
+    mode 0700. Since 'lark' loads the cache files with 'pickle', they are only used from a directory that no other user
+    can write to.
+
+    Returns:
+        Union[str, None]: The path of the directory, or None if it cannot be created, is not a directory, or (on POSIX
+            systems) is not owned by the user or is accessible to other users.
+    """
+    base_dir = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    cache_dir = os.path.join(base_dir, "parser-pddl")
+    try:
+        os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+        status = os.lstat(cache_dir)
+    except OSError:
+        return None
+    if not stat.S_ISDIR(status.st_mode):
+        return None
+    if hasattr(os, "getuid") and (status.st_uid != os.getuid() or status.st_mode & 0o077):
+        return None
+    return cache_dir
+
+def get_pddl_parser(kind: str, grammar_cache: Union[bool, str] = True):
+    """Builds a parser of the 'pddl' library, loading the tables of its grammar from a cache file when possible.
+
+    The 'pddl' library builds its 'lark' grammar from scratch on every call of 'parse_domain' or 'parse_problem', which
+    takes most of the time of reading a small file. Here, the analysed grammar is stored in a cache file by 'lark' the
+    first time, and loaded from it afterwards, about ten times faster. The 'pddl' library is only imported by this
+    function, so that programs that never fall back to it (such as those reading a cached parser state, or using the
+    built-in reader) do not pay for its import either.
+
+    Args:
+        kind (str): The kind of definition parsed, "domain" or "problem".
+        grammar_cache (Union[bool, str]): The cache file of the grammar tables. True stores them in a file of the private
+            cache directory of the user (see 'get_grammar_cache_dir'), named after the grammar and the Python version, or
+            builds the grammar without a cache if that directory is not usable; a string is the path of the file, which
+            must not be writable by other users; False builds the grammar without a cache. Defaults to True.
+
+    Returns:
+        A callable that parses the text of a PDDL definition, as returned by the 'pddl' library. A new parser is built by
+        each call, since the transformers of the 'pddl' library keep state while they parse.
+
+    Raises:
+        ValueError: If 'kind' is neither "domain" nor "problem".
+    """
+    if kind == "domain":
+        from pddl.parser.domain import DomainParser as parser_class
+    elif kind == "problem":
+        from pddl.parser.problem import ProblemParser as parser_class
+    else:
+        raise ValueError("unknown kind of PDDL definition: " + str(kind))
+    try:
+        from lark import Lark
+        from pddl.parser import GRAMMAR_FILE, PARSERS_DIRECTORY
+        start_symbol = parser_class.start_symbol
+        transformer = parser_class.transformer_cls()
+        call_parser = parser_class._call_parser
+    except (ImportError, AttributeError):
+        return parser_class()
+    if grammar_cache is True:
+        cache_dir = get_grammar_cache_dir()
+        grammar_cache = False
+        if cache_dir is not None:
+            grammar_cache = os.path.join(cache_dir, "%s-%d.%d.lark" % (kind, *sys.version_info[:2]))
+    grammar = Lark(GRAMMAR_FILE.read_text(), parser="lalr", import_paths=[PARSERS_DIRECTORY], start=start_symbol,
+                   transformer=transformer, cache=grammar_cache)
+    return lambda text: call_parser(text, grammar)
+
+def parse_pddl_domain(domain_path: str, grammar_cache: Union[bool, str] = True):
+    """Parses a PDDL domain file with the 'pddl' library, as 'pddl.parse_domain' does, but with a cached grammar.
+
+    Args:
+        domain_path (str): The file path to the PDDL domain definition.
+        grammar_cache (Union[bool, str]): The cache of the grammar tables (see 'get_pddl_parser'). Defaults to True.
+    """
+    with open(domain_path) as domain_file:
+        return get_pddl_parser("domain", grammar_cache)(domain_file.read())
+
+def parse_pddl_problem(problem_path: str, grammar_cache: Union[bool, str] = True):
+    """Parses a PDDL problem file with the 'pddl' library, as 'pddl.parse_problem' does, but with a cached grammar.
+
+    Args:
+        problem_path (str): The file path to the PDDL problem definition.
+        grammar_cache (Union[bool, str]): The cache of the grammar tables (see 'get_pddl_parser'). Defaults to True.
+    """
+    with open(problem_path) as problem_file:
+        return get_pddl_parser("problem", grammar_cache)(problem_file.read())
+
+def get_plain_name(parsed_name) -> str:
+    """Converts a name returned by the 'pddl' library into a plain string, if that keeps its meaning.
+
+    The names of the 'pddl' library are case-insensitive strings, which compare equal to (and hash as) the plain strings of
+    their lowercase spelling. A lowercase name is thus converted, so that the objects built from it (and the cached
+    parser states holding them) do not depend on the library; any other name is kept, along with its case-insensitivity.
+
+    Args:
+        parsed_name: The name, as returned by the 'pddl' library.
+
+    Returns:
+        str: A plain string with the name if it is lowercase; the name itself otherwise.
+    """
+    plain_name = str.__str__(parsed_name)
+    return plain_name if plain_name == plain_name.lower() else parsed_name
\ No newline at end of file
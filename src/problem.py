@@ -1,4 +1,5 @@
 from .custom_types import Object
+from .pddl_grammar import get_plain_name
 
 class Problem:
     """Represents a PDDL problem.
@@ -10,6 +11,7 @@ class Problem:
     Examples:
         >>> parsed_problem = pddl.parse_problem("tests/examples/gripper3_3_balls.pddl")
         >>> problem = Problem(parsed_problem)
+        >>> problem, initial_state, goal_state = read_problem("tests/examples/gripper3_3_balls.pddl")
     """
 
     def __init__(self, parsed_problem) -> None:
@@ -23,9 +25,22 @@ class Problem:
                 - 'name': The AI planning problem name.
                 - 'objects': a list of objects valid for the problem domain.
         """
-        self.name = parsed_problem.name
+        self.name = get_plain_name(parsed_problem.name)
         self.objects = self.__store_objects(parsed_problem)
 
+    @classmethod
+    def from_elements(cls, name: str, objects: dict[str, list[Object]]) -> 'Problem':
+        """Builds a 'Problem' object from its name and its objects, already built (see 'read_problem').
+
+        Args:
+            name (str): The name of the problem.
+            objects (dict[str, list[Object]]): A map from object types to lists of 'Object' objects.
+        """
+        problem = cls.__new__(cls)
+        problem.name = name
+        problem.objects = objects
+        return problem
+
     def __store_objects(self, parsed_problem) -> dict[str, list[Object]]:
         """Stores objects corresponding to the instantiated problem.
 
@@ -40,7 +55,7 @@ class Problem:
             object_type = str(next(iter(parsed_object.type_tags)))
             if object_type not in dict_obj:
                 dict_obj[object_type] = []
-            object_name = parsed_object.name
+            object_name = get_plain_name(parsed_object.name)
             object = Object(object_name, object_type)
             dict_obj[object_type].append(object)
         return dict_obj
@@ -51,4 +66,30 @@ class Problem:
 
     def get_objects(self) -> dict[str, list[Object]]:
         """Gets type-to-Object mapping for problem objects."""
-        return self.objects
\ No newline at end of file
+        return self.objects
+
+def get_state_literals(parsed_state) -> list[tuple[str, tuple[str, ...], bool]]:
+    """Converts a parsed PDDL state (a conjunction, a set of facts or a single fact) into a list of literals.
+
+    Args:
+        parsed_state: The parsed state, such as the 'init' or the 'goal' of a problem returned by 'pddl.parse_problem'.
+
+    Returns:
+        list[tuple[str, tuple[str, ...], bool]]: The name of the predicate, the names of the objects and the value (False
+            if the fact is negated) of each fact.
+    """
+    if (str(type(parsed_state)) == "<class 'pddl.logic.base.And'>" ):
+        facts = parsed_state.operands
+    elif (str(type(parsed_state)) == "<class 'pddl.logic.predicates.Predicate'>"):
+        facts = (parsed_state,)
+    else:
+        facts = parsed_state
+    literals = []
+    for parsed_prop in facts:
+        value = True
+        if (str(type(parsed_prop)) == "<class 'pddl.logic.base.Not'>"):
+            parsed_prop = parsed_prop.argument
+            value = False
+        object_names = tuple(get_plain_name(term.name) for term in parsed_prop.terms)
+        literals.append((get_plain_name(parsed_prop.name), object_names, value))
+    return literals
\ No newline at end of file
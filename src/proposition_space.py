@@ -0,0 +1,515 @@
+from .custom_types import Object, Predicate, Proposition
+from collections.abc import Mapping
+from typing import Iterator, Sequence, Union
+import bisect
+
+class PropositionSpace:
+    """Represents the set of all possible propositions of a problem, without storing them.
+
+    Each predicate owns a contiguous block of indices. Inside a block, a proposition is identified by
+    a mixed-radix number whose digits are computed from the positions of its objects in the lists of
+    objects of each type. Tuples with repeated objects are not part of the space, so the digit of an
+    argument only counts the objects not already used by previous arguments of the same type. This
+    yields dense indices, in the same order as the (filtered) Cartesian product of the objects, and
+    'Proposition' objects are only materialized on demand.
+
+    Objects can be added afterwards (see 'add_objects'); the propositions they take part in get the indices after the
+    current ones, in extension blocks, so that the indices of the other propositions do not change. Each addition is a
+    generation, and the new propositions of a predicate are split by the first argument holding an object of that
+    generation: the arguments before it range over the older objects, and those after it over all objects. Each of these
+    blocks is numbered as a predicate block is, with the digit of every argument counted from the first object it ranges
+    over.
+
+    Attributes:
+        predicates (list[Predicate]): The predicates of the domain, in the order of their blocks.
+        objects (dict[str, list[Object]]): A map from types to a list of 'Object' objects.
+        predicate_ids (dict[str, int]): A map from predicate names to their position in 'predicates'.
+        object_ids (dict[str, dict[str, int]]): A map from types to a map from object names to their position in 'objects'.
+        object_list (list[Object]): All objects, in type order, followed by those added later; the position of an object in
+            this list is its global id.
+        global_ids (dict[str, int]): A map from object names to their global ids.
+        local_ids (list[int]): For each global id, the position of the object in the list of objects of its type.
+        object_types (list[str]): For each global id, the type of the object.
+        type_domains (dict[str, list[int]]): A map from types to the global ids of the objects of that type.
+        offsets (list[int]): The first index of the block of each predicate.
+        radices (list[list[int]]): For each predicate, the radix of each argument.
+        weights (list[list[int]]): For each predicate, the weight of each argument digit.
+        same_type_args (list[list[list[int]]]): For each predicate and argument, the previous arguments of the same type.
+        base_size (int): The number of propositions of the predicate blocks, which come before the extension blocks.
+        generations (int): The number of times objects were added.
+        type_counts (dict[str, list[int]]): A map from types to the number of their objects at the end of each generation,
+            the first one being the initial objects.
+        extension_offsets (list[int]): The first index of each extension block.
+        extension_blocks (list[tuple[int, list[int], list[int], list[int], list[list[int]]]]): For each extension block, its
+            predicate id, and for each argument, the position (within its type) of the first object it ranges over, its
+            radix, the weight of its digit and the previous arguments of the same type it cannot repeat.
+        extension_ids (dict[tuple[int, int, int], int]): A map from (predicate id, generation, position of the first
+            argument of that generation) tuples to the position of their extension block.
+
+    Examples:
+        >>> propositions = PropositionSpace(domain.get_predicates(), objects)
+        >>> index = propositions.index_of("at-ball", [ "ball1", "rooma" ])
+        >>> str(propositions[index])
+        'at-ball_ball1_rooma'
+    """
+
+    def __init__(self, predicates: dict[str, Predicate], objects: dict[str, list[Object]]) -> None:
+        """Initializes a 'PropositionSpace' object.
+
+        Args:
+            predicates (dict[str, Predicate]): A map from the names of the predicates to the 'Predicate' objects.
+            objects (dict[str, list[Object]]): A map from types to a list of 'Object' objects.
+        """
+        self.predicates = list(predicates.values())
+        self.objects = objects
+        self.predicate_ids = {predicate.get_name(): i for i, predicate in enumerate(self.predicates)}
+        self.object_ids = self.__store_object_ids(objects)
+        self.object_list = []
+        self.global_ids = {}
+        self.local_ids = []
+        self.object_types = []
+        self.type_domains = {}
+        for object_type, objects_of_type in objects.items():
+            self.type_domains[object_type] = []
+            for local_id, object in enumerate(objects_of_type):
+                self.type_domains[object_type].append(len(self.object_list))
+                self.global_ids[object.get_name()] = len(self.object_list)
+                self.object_list.append(object)
+                self.local_ids.append(local_id)
+                self.object_types.append(object_type)
+        self.offsets = []
+        self.radices = []
+        self.weights = []
+        self.same_type_args = []
+        self.size = 0
+        for predicate in self.predicates:
+            self.__store_predicate_block(predicate)
+        self.base_size = self.size
+        self.generations = 0
+        self.type_counts = {object_type: [len(objects_of_type)] for object_type, objects_of_type in objects.items()}
+        self.extension_offsets = []
+        self.extension_blocks = []
+        self.extension_ids = {}
+
+    def __store_object_ids(self, objects: dict[str, list[Object]]) -> dict[str, dict[str, int]]:
+        """Builds, for each type, a map from object names to their position in the list of objects of that type.
+
+        Args:
+            objects (dict[str, list[Object]]): A map from types to a list of 'Object' objects.
+
+        Returns:
+            dict[str, dict[str, int]]: A map from types to a map from object names to positions.
+        """
+        object_ids = {}
+        for object_type, objects_of_type in objects.items():
+            object_ids[object_type] = {object.get_name(): i for i, object in enumerate(objects_of_type)}
+        return object_ids
+
+    def __store_predicate_block(self, predicate: Predicate) -> None:
+        """Computes the offset, radices and weights of the block of a predicate, and appends them to the attributes.
+
+        Args:
+            predicate (Predicate): The predicate whose block is being computed.
+        """
+        variable_types = predicate.get_variable_types()
+        radices = []
+        same_type_args = []
+        for position, variable_type in enumerate(variable_types):
+            previous = [i for i in range(position) if variable_types[i] == variable_type]
+            num_objects = len(self.objects.get(variable_type, []))
+            radices.append(max(num_objects - len(previous), 0))
+            same_type_args.append(previous)
+
+        weights = [1] * len(radices)
+        block_size = 1
+        for position in range(len(radices) - 1, -1, -1):
+            weights[position] = block_size
+            block_size *= radices[position]
+
+        self.offsets.append(self.size)
+        self.radices.append(radices)
+        self.weights.append(weights)
+        self.same_type_args.append(same_type_args)
+        self.size += block_size
+
+    def add_objects(self, objects: dict[str, list[Object]]) -> int:
+        """Adds objects to the space, along with the propositions they take part in, after the current ones.
+
+        The new objects get the global ids after the current ones, and are appended to the lists of objects of their types
+        (in place, so that 'objects' reflects them). Only the extension blocks of the new generation are computed, so the
+        cost is proportional to the number of predicates and arguments, not to the number of propositions.
+
+        Args:
+            objects (dict[str, list[Object]]): A map from types to a list of the 'Object' objects to add.
+
+        Returns:
+            int: The number of propositions added.
+
+        Raises:
+            ValueError: If an object has the name of an object of the space, or two objects have the same name.
+        """
+        names = [object.get_name() for objects_of_type in objects.values() for object in objects_of_type]
+        for name in names:
+            if name in self.global_ids:
+                raise ValueError("the space already has an object named " + str(name))
+        if len(set(names)) != len(names):
+            raise ValueError("the objects to add must have different names")
+        previous_counts = {object_type: len(objects_of_type) for object_type, objects_of_type in self.objects.items()}
+        for object_type, objects_of_type in objects.items():
+            type_objects = self.objects.setdefault(object_type, [])
+            type_ids = self.object_ids.setdefault(object_type, {})
+            type_domain = self.type_domains.setdefault(object_type, [])
+            for object in objects_of_type:
+                type_ids[object.get_name()] = len(type_objects)
+                type_domain.append(len(self.object_list))
+                self.global_ids[object.get_name()] = len(self.object_list)
+                self.object_list.append(object)
+                self.local_ids.append(len(type_objects))
+                self.object_types.append(object_type)
+                type_objects.append(object)
+        self.generations += 1
+        for object_type, objects_of_type in self.objects.items():
+            self.type_counts.setdefault(object_type, [0] * self.generations).append(len(objects_of_type))
+
+        previous_size = self.size
+        for predicate_id, predicate in enumerate(self.predicates):
+            for first_new in range(len(predicate.get_variable_types())):
+                self.__store_extension_block(predicate_id, first_new, previous_counts)
+        return self.size - previous_size
+
+    def __store_extension_block(self, predicate_id: int, first_new: int, previous_counts: dict[str, int]) -> None:
+        """Computes the extension block of the propositions of a predicate whose first new object is at a given argument.
+
+        Args:
+            predicate_id (int): The position of the predicate in 'predicates'.
+            first_new (int): The position of the first argument holding an object of the latest generation.
+            previous_counts (dict[str, int]): A map from types to the number of their objects before the latest generation.
+        """
+        variable_types = self.predicates[predicate_id].get_variable_types()
+        starts = []
+        radices = []
+        same_type_args = []
+        for position, variable_type in enumerate(variable_types):
+            previous = self.same_type_args[predicate_id][position]
+            num_objects = len(self.objects.get(variable_type, []))
+            num_previous_objects = previous_counts.get(variable_type, 0)
+            if position < first_new:
+                starts.append(0)
+                radices.append(max(num_previous_objects - len(previous), 0))
+                same_type_args.append(previous)
+            elif position == first_new:
+                starts.append(num_previous_objects)
+                radices.append(num_objects - num_previous_objects)
+                same_type_args.append([])
+            else:
+                starts.append(0)
+                radices.append(max(num_objects - len(previous), 0))
+                same_type_args.append(previous)
+
+        weights = [1] * len(radices)
+        block_size = 1
+        for position in range(len(radices) - 1, -1, -1):
+            weights[position] = block_size
+            block_size *= radices[position]
+        if block_size == 0:
+            return
+
+        self.extension_ids[(predicate_id, self.generations, first_new)] = len(self.extension_blocks)
+        self.extension_offsets.append(self.size)
+        self.extension_blocks.append((predicate_id, starts, radices, weights, same_type_args))
+        self.size += block_size
+
+    def __len__(self) -> int:
+        """Gets the number of propositions in the space."""
+        return self.size
+
+    def __getitem__(self, index: int) -> Proposition:
+        """Materializes the proposition with the given index.
+
+        Args:
+            index (int): The index of the proposition.
+
+        Returns:
+            Proposition: The proposition associated with 'index'.
+
+        Raises:
+            IndexError: If 'index' is out of range.
+        """
+        if index < 0:
+            index += self.size
+        if index < 0 or index >= self.size:
+            raise IndexError("proposition index out of range")
+        predicate, objects = self.decode(index)
+        return Proposition(predicate, objects, index)
+
+    def __iter__(self) -> Iterator[Proposition]:
+        """Iterates over all propositions, in index order."""
+        for index in range(self.size):
+            yield self[index]
+
+    def encode(self, predicate_id: int, object_ids: Sequence[int]) -> int:
+        """Computes the index of a proposition from the positions of its objects.
+
+        Args:
+            predicate_id (int): The position of the predicate in 'predicates'.
+            object_ids (Sequence[int]): For each argument, the position of the object in the list of objects of its type.
+
+        Returns:
+            int: The index of the proposition, or -1 if the objects are repeated (and thus not part of the space).
+        """
+        if self.generations > 0:
+            generations = [bisect.bisect_right(self.type_counts[variable_type], object_id)
+                           for variable_type, object_id in zip(self.predicates[predicate_id].get_variable_types(), object_ids)]
+            if len(generations) > 0 and max(generations) > 0:
+                return self.__encode_extension(predicate_id, object_ids, generations)
+        index = self.offsets[predicate_id]
+        weights = self.weights[predicate_id]
+        same_type_args = self.same_type_args[predicate_id]
+        for position, object_id in enumerate(object_ids):
+            digit = object_id
+            for previous in same_type_args[position]:
+                previous_id = object_ids[previous]
+                if previous_id == object_id:
+                    return -1
+                if previous_id < object_id:
+                    digit -= 1
+            index += digit * weights[position]
+        return index
+
+    def __encode_extension(self, predicate_id: int, object_ids: Sequence[int], generations: list[int]) -> int:
+        """Computes the index of a proposition with objects added after the initial ones, in its extension block.
+
+        Args:
+            predicate_id (int): The position of the predicate in 'predicates'.
+            object_ids (Sequence[int]): For each argument, the position of the object in the list of objects of its type.
+            generations (list[int]): For each argument, the generation of its object.
+
+        Returns:
+            int: The index of the proposition, or -1 if the objects are repeated.
+        """
+        generation = max(generations)
+        block_id = self.extension_ids.get((predicate_id, generation, generations.index(generation)))
+        if block_id is None:
+            return -1
+        _, starts, _, weights, same_type_args = self.extension_blocks[block_id]
+        index = self.extension_offsets[block_id]
+        for position, object_id in enumerate(object_ids):
+            digit = object_id - starts[position]
+            for previous in same_type_args[position]:
+                previous_id = object_ids[previous]
+                if previous_id == object_id:
+                    return -1
+                if previous_id < object_id:
+                    digit -= 1
+            index += digit * weights[position]
+        return index
+
+    def encode_objects(self, predicate_id: int, global_ids: Sequence[int]) -> int:
+        """Computes the index of a proposition from the global ids of its objects.
+
+        Args:
+            predicate_id (int): The position of the predicate in 'predicates'.
+            global_ids (Sequence[int]): The global ids of the objects.
+
+        Returns:
+            int: The index of the proposition, or -1 if the objects are repeated or of the wrong types.
+        """
+        object_ids = []
+        for variable_type, global_id in zip(self.predicates[predicate_id].get_variable_types(), global_ids):
+            if self.object_types[global_id] != variable_type:
+                return -1
+            object_ids.append(self.local_ids[global_id])
+        return self.encode(predicate_id, object_ids)
+
+    def __decode_object_ids(self, index: int) -> tuple[int, list[int]]:
+        """Computes the predicate id and the positions (within their types) of the objects of the proposition with the given index."""
+        if index < self.base_size:
+            predicate_id = self.__find_predicate_id(index)
+            relative_index = index - self.offsets[predicate_id]
+            starts = None
+            radices = self.radices[predicate_id]
+            weights = self.weights[predicate_id]
+            same_type_args = self.same_type_args[predicate_id]
+        else:
+            block_id = bisect.bisect_right(self.extension_offsets, index) - 1
+            relative_index = index - self.extension_offsets[block_id]
+            predicate_id, starts, radices, weights, same_type_args = self.extension_blocks[block_id]
+
+        object_ids = []
+        for position in range(len(radices)):
+            object_id = (relative_index // weights[position]) % radices[position]
+            if starts is not None:
+                object_id += starts[position]
+            for used_id in sorted(object_ids[previous] for previous in same_type_args[position]):
+                if used_id <= object_id:
+                    object_id += 1
+            object_ids.append(object_id)
+        return predicate_id, object_ids
+
+    def decode(self, index: int) -> tuple[Predicate, tuple[Object, ...]]:
+        """Computes the predicate and objects of the proposition with the given index.
+
+        Args:
+            index (int): The index of the proposition.
+
+        Returns:
+            Predicate: The predicate of the proposition.
+            tuple[Object, ...]: The objects of the proposition.
+        """
+        predicate_id, object_ids = self.__decode_object_ids(index)
+        predicate = self.predicates[predicate_id]
+        objects = tuple(self.objects[variable_type][object_id]
+                        for variable_type, object_id in zip(predicate.get_variable_types(), object_ids))
+        return predicate, objects
+
+    def decode_ids(self, index: int) -> tuple[int, tuple[int, ...]]:
+        """Computes the predicate id and the global ids of the objects of the proposition with the given index.
+
+        Args:
+            index (int): The index of the proposition.
+
+        Returns:
+            int: The position of the predicate in 'predicates'.
+            tuple[int, ...]: The global ids of the objects of the proposition.
+        """
+        predicate_id, object_ids = self.__decode_object_ids(index)
+        variable_types = self.predicates[predicate_id].get_variable_types()
+        global_ids = tuple(self.type_domains[variable_type][object_id]
+                           for variable_type, object_id in zip(variable_types, object_ids))
+        return predicate_id, global_ids
+
+    def __find_predicate_id(self, index: int) -> int:
+        """Finds the predicate whose block contains the given index, by binary search over the offsets."""
+        return bisect.bisect_right(self.offsets, index) - 1
+
+    def index_of(self, predicate_name: str, object_names: Sequence[str]) -> int:
+        """Computes the index of a proposition from the names of its predicate and objects.
+
+        Args:
+            predicate_name (str): The name of the predicate.
+            object_names (Sequence[str]): The names of the objects.
+
+        Returns:
+            int: The index of the proposition, or -1 if it is not part of the space.
+        """
+        predicate_id = self.predicate_ids.get(predicate_name)
+        if predicate_id is None:
+            return -1
+        variable_types = self.predicates[predicate_id].get_variable_types()
+        if len(variable_types) != len(object_names):
+            return -1
+        object_ids = []
+        for variable_type, object_name in zip(variable_types, object_names):
+            object_id = self.object_ids.get(variable_type, {}).get(object_name)
+            if object_id is None:
+                return -1
+            object_ids.append(object_id)
+        return self.encode(predicate_id, object_ids)
+
+    def get_proposition(self, predicate: Predicate, objects: Sequence[Object]) -> Union[Proposition, None]:
+        """Gets the proposition built from a predicate and a sequence of objects.
+
+        Args:
+            predicate (Predicate): The predicate of the proposition.
+            objects (Sequence[Object]): The objects of the proposition.
+
+        Returns:
+            Union[Proposition, None]: The proposition, or None if it is not part of the space.
+        """
+        index = self.index_of(predicate.get_name(), [object.get_name() for object in objects])
+        if index == -1:
+            return None
+        return Proposition(self.predicates[self.predicate_ids[predicate.get_name()]], objects, index)
+
+    def index_of_name(self, name: str) -> int:
+        """Computes the index of a proposition from its name (e.g., 'at-ball_ball1_rooma').
+
+        Args:
+            name (str): The name of the proposition.
+
+        Returns:
+            int: The index of the proposition, or -1 if no proposition has that name.
+
+        Note:
+            Since '_' may also appear inside predicate and object names, every split of the name is tried.
+        """
+        for predicate_id, predicate in enumerate(self.predicates):
+            predicate_name = predicate.get_name()
+            variable_types = predicate.get_variable_types()
+            if name == predicate_name and len(variable_types) == 0:
+                return self.offsets[predicate_id]
+            if len(variable_types) == 0 or not name.startswith(predicate_name + "_"):
+                continue
+            parts = name[len(predicate_name) + 1:].split("_")
+            object_ids = self.__match_object_names(parts, variable_types)
+            if object_ids is not None:
+                index = self.encode(predicate_id, object_ids)
+                if index != -1:
+                    return index
+        return -1
+
+    def __match_object_names(self, parts: list[str], variable_types: list[str]) -> Union[list[int], None]:
+        """Splits a list of name fragments into object names of the given types.
+
+        Args:
+            parts (list[str]): The fragments of the name, split at '_'.
+            variable_types (list[str]): The types of the remaining arguments.
+
+        Returns:
+            Union[list[int], None]: The positions of the matched objects, or None if there is no valid split.
+        """
+        if len(variable_types) == 0:
+            return [] if len(parts) == 0 else None
+        names_of_type = self.object_ids.get(variable_types[0], {})
+        for end in range(1, len(parts) - len(variable_types) + 2):
+            object_id = names_of_type.get("_".join(parts[:end]))
+            if object_id is None:
+                continue
+            remaining = self.__match_object_names(parts[end:], variable_types[1:])
+            if remaining is not None:
+                return [object_id] + remaining
+        return None
+
+    def get_predicates(self) -> list[Predicate]:
+        """Gets the predicates, in the order of their blocks."""
+        return self.predicates
+
+    def get_objects(self) -> dict[str, list[Object]]:
+        """Gets type-to-Object mapping."""
+        return self.objects
+
+class PropositionNames(Mapping):
+    """Read-only map from proposition names to 'Proposition' objects, backed by a 'PropositionSpace'.
+
+    Attributes:
+        propositions (PropositionSpace): The proposition space being viewed.
+
+    Examples:
+        >>> dict_propositions = PropositionNames(propositions)
+        >>> dict_propositions["at-ball_ball1_rooma"].get_index()
+        0
+    """
+
+    def __init__(self, propositions: PropositionSpace) -> None:
+        """Initializes a 'PropositionNames' object.
+
+        Args:
+            propositions (PropositionSpace): The proposition space to be viewed.
+        """
+        self.propositions = propositions
+
+    def __getitem__(self, name: str) -> Proposition:
+        """Gets the proposition with the given name, raising KeyError if it does not exist."""
+        index = self.propositions.index_of_name(name)
+        if index == -1:
+            raise KeyError(name)
+        return self.propositions[index]
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterates over the proposition names, in index order."""
+        for proposition in self.propositions:
+            yield str(proposition)
+
+    def __len__(self) -> int:
+        """Gets the number of propositions."""
+        return len(self.propositions)
@@ -0,0 +1,316 @@
+from .custom_types import Object, Predicate, Action, Proposition
+from .domain import Domain, merge_effects
+from .problem import Problem
+from typing import Union
+import json
+import re
+
+COMMENT_PATTERN = re.compile(r";[^\n]*")
+ACTION_KEYS = (":parameters", ":precondition", ":effect")
+
+def tokenize(text: str) -> list[str]:
+    """Splits a PDDL text into parentheses and names, leaving comments out.
+
+    Raises:
+        ValueError: If the text has uppercase letters, quotes or backslashes. Names are case-insensitive in PDDL, which this
+            reader does not handle, so such files are left to the 'pddl' library.
+    """
+    text = COMMENT_PATTERN.sub("", text)
+    if text != text.lower() or '"' in text or "\\" in text:
+        raise ValueError("the built-in reader only supports lowercase PDDL names")
+    return text.replace("(", " ( ").replace(")", " ) ").split()
+
+def build_tree(tokens: list[str]) -> list:
+    """Builds the nested lists of a single parenthesized expression from its tokens.
+
+    Note:
+        The tokens are joined into a JSON array, with the parentheses turned into brackets and the names into strings,
+        which 'json.loads' reads in one pass, much faster than a loop over the tokens.
+
+    Raises:
+        ValueError: If the parentheses are unbalanced, or if the tokens hold more or less than one expression.
+    """
+    if len(tokens) == 0:
+        raise ValueError("expected a single parenthesized expression")
+    array_text = '"' + '","'.join(tokens) + '"'
+    array_text = array_text.replace('"(",', "[").replace(',")"', "]").replace('[")"', "[]")
+    try:
+        tree = json.loads(array_text)
+    except json.JSONDecodeError:
+        raise ValueError("unbalanced parentheses") from None
+    if not isinstance(tree, list):
+        raise ValueError("expected a single parenthesized expression")
+    return tree
+
+def read_tree(text: str, kind: str) -> tuple[str, list[list]]:
+    """Reads a 'define' expression, returning its name and its sections.
+
+    Args:
+        text (str): The contents of a PDDL file.
+        kind (str): The kind of definition expected, "domain" or "problem".
+
+    Raises:
+        ValueError: If the text is not a definition of the expected kind.
+    """
+    tree = build_tree(tokenize(text))
+    if len(tree) < 2 or tree[0] != "define" or not is_list(tree[1]) or len(tree[1]) != 2 or tree[1][0] != kind:
+        raise ValueError("expected a " + kind + " definition")
+    sections = tree[2:]
+    if not all(is_list(section) and len(section) > 0 for section in sections):
+        raise ValueError("unexpected element in the " + kind + " definition")
+    return (tree[1][1], sections)
+
+def is_list(expression) -> bool:
+    """Checks whether an expression is parenthesized."""
+    return isinstance(expression, list)
+
+def read_typed_list(elements: list, allow_untyped: bool = False) -> list[tuple[str, Union[str, None]]]:
+    """Reads a list of names, each group of them followed by '-' and their type.
+
+    Args:
+        elements (list): The elements of the list.
+        allow_untyped (bool): Whether names may be left without a type at the end of the list. Defaults to False.
+
+    Returns:
+        list[tuple[str, Union[str, None]]]: The (name, type) pairs, in order; the type of untyped names is None.
+
+    Raises:
+        ValueError: If a type is missing or is not a single name (such as an 'either' type).
+    """
+    pairs = []
+    pending = []
+    position = 0
+    while position < len(elements):
+        element = elements[position]
+        if is_list(element):
+            raise ValueError("unexpected expression in a typed list")
+        if element == "-":
+            if position + 1 == len(elements) or is_list(elements[position + 1]) or len(pending) == 0:
+                raise ValueError("only single types are supported in a typed list")
+            pairs.extend((name, elements[position + 1]) for name in pending)
+            pending = []
+            position += 2
+            continue
+        pending.append(element)
+        position += 1
+    if len(pending) > 0:
+        if not allow_untyped:
+            raise ValueError("untyped names are not supported: " + " ".join(pending))
+        pairs.extend((name, None) for name in pending)
+    return pairs
+
+def read_objects(elements: list) -> dict[str, list[Object]]:
+    """Reads a typed list of objects or constants into a map from types to lists of 'Object' objects, in order."""
+    objects = {}
+    seen = set()
+    for name, object_type in read_typed_list(elements):
+        if name not in seen:
+            seen.add(name)
+            objects.setdefault(object_type, []).append(Object(name, object_type))
+    return objects
+
+def read_predicates(elements: list) -> dict[str, Predicate]:
+    """Reads the predicate declarations of a domain into a map from the names of the predicates to 'Predicate' objects."""
+    predicates = {}
+    for declaration in elements:
+        if not is_list(declaration) or len(declaration) == 0 or is_list(declaration[0]):
+            raise ValueError("unexpected predicate declaration")
+        variables = read_typed_list(declaration[1:])
+        predicates[declaration[0]] = Predicate(declaration[0], [variable_type for _, variable_type in variables])
+    return predicates
+
+def read_atom(expression: list, predicates: dict[str, Predicate], terms: dict[str, Object]) -> Proposition:
+    """Reads an atom of an action, whose terms are parameters or constants.
+
+    Args:
+        expression (list): The atom, i.e., the name of its predicate followed by its terms.
+        predicates (dict[str, Predicate]): A map from the names of the predicates to the 'Predicate' objects.
+        terms (dict[str, Object]): A map from the names of the parameters (with their '?') and of the constants to the
+            'Object' objects that stand for them.
+
+    Raises:
+        ValueError: If the predicate or a term is unknown, or if the number of terms does not match the predicate.
+    """
+    if len(expression) == 0 or any(is_list(element) for element in expression):
+        raise ValueError("unexpected atom")
+    predicate = predicates.get(expression[0])
+    if predicate is None or len(expression) - 1 != len(predicate.get_variable_types()):
+        raise ValueError("unsupported atom: (" + " ".join(expression) + ")")
+    objects = []
+    for name in expression[1:]:
+        if name not in terms:
+            raise ValueError("unknown term: " + name)
+        objects.append(terms[name])
+    return Proposition(predicate, objects)
+
+def read_action_literal(expression, predicates: dict[str, Predicate], terms: dict[str, Object]) -> tuple[Proposition, bool]:
+    """Reads an atom or a negated atom of an action (see 'read_atom'), returning the proposition and its value."""
+    if not is_list(expression):
+        raise ValueError("unexpected name in an action: " + expression)
+    if len(expression) == 2 and expression[0] == "not" and is_list(expression[1]):
+        return (read_atom(expression[1], predicates, terms), False)
+    return (read_atom(expression, predicates, terms), True)
+
+def read_preconditions(expression, predicates: dict[str, Predicate],
+                       terms: dict[str, Object]) -> list[tuple[Proposition, bool]]:
+    """Reads the precondition of an action, a literal or a conjunction of literals, into a list of literals."""
+    if expression is None or expression == []:
+        return []
+    if expression[0] != "and":
+        return [read_action_literal(expression, predicates, terms)]
+    preconditions = []
+    for operand in expression[1:]:
+        preconditions.extend(read_preconditions(operand, predicates, terms))
+    return preconditions
+
+def collect_effects(expression, predicates: dict[str, Predicate], terms: dict[str, Object],
+                    all_possible_effects: list, in_oneof: bool = False) -> None:
+    """Recursively collects the effects of an action, as 'Domain' does before merging them (see 'merge_effects').
+
+    Literals are appended to 'all_possible_effects', and a 'oneof' effect appends the list of its scenarios.
+
+    Raises:
+        ValueError: If the effect is not built from literals with 'and' and 'oneof', or if 'oneof' effects are nested.
+    """
+    if not is_list(expression):
+        raise ValueError("unexpected name in an effect: " + expression)
+    if len(expression) == 0:
+        return
+    if expression[0] == "and":
+        for operand in expression[1:]:
+            collect_effects(operand, predicates, terms, all_possible_effects, in_oneof)
+    elif expression[0] == "oneof":
+        if in_oneof:
+            raise ValueError("nested oneof effects are not supported")
+        non_deterministic_effect = []
+        for operand in expression[1:]:
+            scenario = []
+            collect_effects(operand, predicates, terms, scenario, True)
+            non_deterministic_effect.append(scenario)
+        all_possible_effects.append(non_deterministic_effect)
+    else:
+        all_possible_effects.append(read_action_literal(expression, predicates, terms))
+
+def read_action(elements: list, predicates: dict[str, Predicate], constants: dict[str, Object]) -> Action:
+    """Reads the name, the parameters, the precondition and the effect of an action into an 'Action' object.
+
+    Args:
+        elements (list): The elements of the ':action' section, after the keyword.
+        predicates (dict[str, Predicate]): A map from the names of the predicates to the 'Predicate' objects.
+        constants (dict[str, Object]): A map from the names of the constants to the 'Object' objects.
+
+    Raises:
+        ValueError: If the action has other parts than ':parameters', ':precondition' and ':effect', or if they are
+            outside the supported subset.
+    """
+    if len(elements) % 2 != 1 or is_list(elements[0]):
+        raise ValueError("unexpected action definition")
+    parts = dict(zip(elements[1::2], elements[2::2]))
+    if len(parts) != len(elements) // 2 or any(key not in ACTION_KEYS for key in parts):
+        raise ValueError("unsupported action definition: " + elements[0])
+    parsed_parameters = parts.get(":parameters", [])
+    if not is_list(parsed_parameters):
+        raise ValueError("unexpected parameters of action " + elements[0])
+    parameters = []
+    for name, parameter_type in read_typed_list(parsed_parameters):
+        if not name.startswith("?"):
+            raise ValueError("unexpected parameter of action " + elements[0] + ": " + name)
+        parameters.append(Object(name[1:], parameter_type))
+    terms = dict(constants)
+    terms.update(("?" + parameter.get_name(), parameter) for parameter in parameters)
+    preconditions = read_preconditions(parts.get(":precondition"), predicates, terms)
+    all_possible_effects = []
+    collect_effects(parts.get(":effect", []), predicates, terms, all_possible_effects)
+    return Action(elements[0], parameters, preconditions, merge_effects(all_possible_effects))
+
+def read_domain(domain_path: str) -> Domain:
+    """Reads a PDDL domain file with the built-in reader, building the corresponding 'Domain' object.
+
+    Args:
+        domain_path (str): The file path to the PDDL domain definition.
+
+    Returns:
+        Domain: The domain, with its actions in the order of the file.
+
+    Raises:
+        ValueError: If the domain is outside the subset supported by the reader: typed STRIPS actions whose preconditions
+            are conjunctions of literals, and whose effects are built from literals with 'and' and 'oneof'.
+    """
+    with open(domain_path) as domain_file:
+        _, sections = read_tree(domain_file.read(), "domain")
+    constants = {}
+    predicates = {}
+    action_sections = []
+    for section in sections:
+        if section[0] in (":requirements", ":types"):
+            read_typed_list(section[1:], allow_untyped=True)
+        elif section[0] == ":constants":
+            constants = read_objects(section[1:])
+        elif section[0] == ":predicates":
+            predicates = read_predicates(section[1:])
+        elif section[0] == ":action":
+            action_sections.append(section[1:])
+        else:
+            raise ValueError("unsupported domain section: " + str(section[0]))
+    constant_terms = {constant.get_name(): constant for type_constants in constants.values() for constant in type_constants}
+    actions = [read_action(elements, predicates, constant_terms) for elements in action_sections]
+    return Domain.from_elements(constants, predicates, actions)
+
+def read_state(expressions: list) -> list[tuple[str, tuple[str, ...], bool]]:
+    """Reads a list of ground literals, expanding conjunctions, into (predicate name, object names, value) tuples.
+
+    Raises:
+        ValueError: If an element is not a ground atom, a negated ground atom or a conjunction of them.
+    """
+    literals = []
+    for expression in expressions:
+        if not is_list(expression) or len(expression) == 0:
+            raise ValueError("unsupported state literal")
+        if expression[0] == "and":
+            literals.extend(read_state(expression[1:]))
+            continue
+        value = expression[0] != "not"
+        if not value:
+            if len(expression) != 2 or not is_list(expression[1]) or len(expression[1]) == 0:
+                raise ValueError("unsupported state literal")
+            expression = expression[1]
+        if list in map(type, expression):
+            raise ValueError("unsupported state literal: " + str(expression[0]))
+        literals.append((expression[0], tuple(expression[1:]), value))
+    return literals
+
+def read_problem(problem_path: str) -> tuple[Problem, list[tuple[str, tuple[str, ...], bool]], list[tuple[str, tuple[str, ...], bool]]]:
+    """Reads a PDDL problem file with the built-in reader.
+
+    Args:
+        problem_path (str): The file path to the PDDL problem definition.
+
+    Returns:
+        Problem: The problem, with its objects in the order of the file.
+        list[tuple[str, tuple[str, ...], bool]]: The literals of the initial state (see 'get_state_literals').
+        list[tuple[str, tuple[str, ...], bool]]: The literals of the goal.
+
+    Raises:
+        ValueError: If the problem is outside the subset supported by the reader: typed objects, and initial states and
+            goals that are conjunctions of ground literals.
+    """
+    with open(problem_path) as problem_file:
+        text = problem_file.read()
+    if "?" in text:
+        raise ValueError("the built-in reader does not support variables in problems")
+    name, sections = read_tree(text, "problem")
+    objects = {}
+    initial_state = []
+    goal_state = []
+    for section in sections:
+        if section[0] in (":domain", ":requirements"):
+            continue
+        elif section[0] == ":objects":
+            objects = read_objects(section[1:])
+        elif section[0] == ":init":
+            initial_state = read_state(section[1:])
+        elif section[0] == ":goal" and len(section) == 2:
+            goal_state = read_state(section[1:])
+        else:
+            raise ValueError("unsupported problem section: " + str(section[0]))
+    return (Problem.from_elements(name, objects), initial_state, goal_state)
\ No newline at end of file
@@ -0,0 +1,143 @@
+from .custom_types import Object, Proposition
+from .proposition_space import PropositionSpace
+from .ground import GroundActionRegistry, get_literal_id
+from .writer import describe_ground_action
+from array import array
+from typing import Iterator, Sequence
+
+class GoalRelevance:
+    """The reachable actions and the propositions relevant to the goal, found by a backward pass over the reachable actions.
+
+    A (proposition, value) pair of the goal is relevant, an action is relevant if one of its effects (in any scenario) is
+    a relevant pair, and the preconditions of a relevant action are relevant pairs. A proposition is relevant if one of
+    its pairs is. An action that is not relevant can be left out of every plan, since it only sets pairs that no goal and
+    no relevant action asks for; and the propositions that are not relevant can be left out of the problem, since they
+    are never tested.
+
+    The problem restricted to the relevant actions and propositions (see 'project_state', 'project_reached' and
+    'iter_actions') renumbers the relevant propositions in index order, and drops the effects over the others.
+
+    Attributes:
+        num_propositions (int): The number of propositions of the problem.
+        relevant_pairs (array): For each literal id (see 'get_literal_id'), 1 if the pair is relevant and 0 otherwise.
+        actions (list[int]): The positions, in the registry, of the relevant actions, in registry order.
+        propositions (list[int]): The indices of the relevant propositions, in index order.
+        new_indices (dict[int, int]): A map from the indices of the relevant propositions to their positions in 'propositions'.
+        num_removed (int): The number of reachable actions that are not relevant.
+
+    Examples:
+        >>> relevance = GoalRelevance(parser.get_goal_state(), parser.get_registry())
+        >>> relevance.get_num_removed()
+        6
+    """
+
+    def __init__(self, goal_state: list[int], registry: GroundActionRegistry) -> None:
+        """Initializes a 'GoalRelevance' object by running the backward pass from the goal.
+
+        Args:
+            goal_state (list[int]): The goal value (1 for true, 0 for false, -1 for don't care) of each proposition.
+            registry (GroundActionRegistry): The reachable actions, which must keep their actions.
+
+        Raises:
+            ValueError: If 'registry' does not keep its actions (see 'GroundActionRegistry.keep_actions').
+        """
+        if not registry.keep_actions:
+            raise ValueError("the relevance analysis needs a registry that keeps its actions")
+        num_propositions = len(goal_state)
+        self.num_propositions = num_propositions
+        producers = {}
+        for position, effects in enumerate(registry.effects):
+            for effect_scenario in effects:
+                for index, value in effect_scenario:
+                    if index != -1:
+                        producers.setdefault(get_literal_id(index, value, num_propositions), []).append(position)
+
+        relevant_pairs = array("b", [0]) * (2 * num_propositions)
+        relevant_actions = bytearray(len(registry.entries))
+        stack = []
+        for index, value in enumerate(goal_state):
+            if value != -1:
+                literal_id = get_literal_id(index, value, num_propositions)
+                relevant_pairs[literal_id] = 1
+                stack.append(literal_id)
+        preconditions = registry.preconditions
+        while len(stack) > 0:
+            for position in producers.get(stack.pop(), ()):
+                if relevant_actions[position]:
+                    continue
+                relevant_actions[position] = 1
+                for index, value in preconditions[position]:
+                    if index == -1:
+                        continue
+                    literal_id = get_literal_id(index, value, num_propositions)
+                    if not relevant_pairs[literal_id]:
+                        relevant_pairs[literal_id] = 1
+                        stack.append(literal_id)
+
+        self.relevant_pairs = relevant_pairs
+        self.actions = [position for position, relevant in enumerate(relevant_actions) if relevant]
+        self.propositions = [index for index in range(num_propositions)
+                             if relevant_pairs[index] or relevant_pairs[index + num_propositions]]
+        self.new_indices = {index: position for position, index in enumerate(self.propositions)}
+        self.num_removed = len(registry.entries) - len(self.actions)
+
+    def is_relevant(self, index: int, value: int) -> bool:
+        """Checks whether a (proposition, value) pair is relevant to the goal."""
+        return self.relevant_pairs[get_literal_id(index, value, self.num_propositions)] == 1
+
+    def project_propositions(self, propositions: PropositionSpace) -> list[Proposition]:
+        """Gets the relevant propositions, in index order."""
+        return [propositions[index] for index in self.propositions]
+
+    def project_state(self, state: Sequence[int]) -> list[int]:
+        """Gets the values of a state (initial or goal) for the relevant propositions, in their new order."""
+        return [state[index] for index in self.propositions]
+
+    def project_reached(self, reached: Sequence[int]) -> array:
+        """Gets the entries of a reached list (see 'create_reached_list') for the relevant propositions, in their new order."""
+        num_propositions = self.num_propositions
+        return array("b", [reached[index] for index in self.propositions] +
+                     [reached[index + num_propositions] for index in self.propositions])
+
+    def project_atoms(self, atoms: list[tuple[int, bool]]) -> list[tuple[int, bool]]:
+        """Renumbers some (proposition index, value) pairs, dropping those over propositions that are not relevant.
+
+        Pairs outside the space (with index -1) are kept as they are.
+        """
+        new_indices = self.new_indices
+        return [(new_indices[index], value) if index != -1 else (index, value)
+                for index, value in atoms if index == -1 or index in new_indices]
+
+    def iter_actions(self, registry: GroundActionRegistry, object_list: list[Object]
+                     ) -> Iterator[tuple[str, list[tuple[int, bool]], list[list[tuple[int, bool]]]]]:
+        """Generates the name, the ground preconditions and the ground effect scenarios of each relevant action, renumbered.
+
+        Args:
+            registry (GroundActionRegistry): The reachable actions the analysis was run on.
+            object_list (list[Object]): The objects, indexed by global id (see 'PropositionSpace.object_list').
+
+        Note:
+            As in 'describe_ground_action', a scenario left without effects stands for the preconditions.
+        """
+        for position in self.actions:
+            schema, parameters = registry.entries[position]
+            name, preconditions, effects = describe_ground_action(schema, parameters, registry.effects[position],
+                                                                  object_list, registry.preconditions[position])
+            new_preconditions = self.project_atoms(preconditions)
+            new_effects = []
+            for effect_scenario in effects:
+                new_scenario = self.project_atoms(effect_scenario) if effect_scenario is not preconditions else []
+                new_effects.append(new_scenario if len(new_scenario) > 0 else new_preconditions)
+            yield (name, new_preconditions, new_effects)
+
+    def get_actions(self) -> list[int]:
+        """Gets the positions of the relevant actions in the registry."""
+        return self.actions
+
+    def get_propositions(self) -> list[int]:
+        """Gets the indices of the relevant propositions."""
+        return self.propositions
+
+    def get_num_removed(self) -> int:
+        """Gets the number of reachable actions that are not relevant."""
+        return self.num_removed
\ No newline at end of file
@@ -0,0 +1,110 @@
+from contextlib import contextmanager
+from typing import Iterator, TextIO, Union
+import json
+import os
+import time
+import tracemalloc
+
+class ParserStats:
+    """Represents the instrumentation of a 'Parser': the wall time and peak memory of each phase, and the work counters.
+
+    Attributes:
+        track_memory (bool): Whether the peak memory of each phase is measured, with 'tracemalloc'.
+        phases (dict[str, dict[str, float]]): A map from phase names, in the order they first ran, to their wall time in
+            seconds ("time") and, if 'track_memory' is set, the peak memory in bytes allocated during the phase ("peak_memory").
+            A phase that runs several times accumulates its time and keeps its largest peak.
+        counters (dict[str, int]): A map from counter names to their values.
+
+    Note:
+        Measuring memory traces every allocation, which slows the parser down several times; the times of a run with
+        'track_memory' set are not comparable with those of a run without it.
+
+    Examples:
+        >>> stats = ParserStats()
+        >>> parser = Parser("tests/examples/gripper3.pddl", "tests/examples/gripper3_3_balls.pddl", stats=stats)
+        >>> parser.print_bdds("parser_output.out")
+        >>> stats.write_json("parser_stats.json")
+    """
+
+    def __init__(self, track_memory: bool = False) -> None:
+        """Initializes an empty 'ParserStats' object.
+
+        Args:
+            track_memory (bool): Whether the peak memory of each phase is measured. Defaults to False.
+        """
+        self.track_memory = track_memory
+        self.phases = {}
+        self.counters = {}
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Measures the code run in a 'with' block as a phase.
+
+        Args:
+            name (str): The name of the phase.
+        """
+        started_tracing = False
+        if self.track_memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                started_tracing = True
+            initial_memory = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            phase = self.phases.setdefault(name, {"time": 0.0})
+            phase["time"] += elapsed
+            if self.track_memory:
+                peak_memory = tracemalloc.get_traced_memory()[1] - initial_memory
+                phase["peak_memory"] = max(phase.get("peak_memory", 0), peak_memory)
+                if started_tracing:
+                    tracemalloc.stop()
+
+    def count(self, name: str, value: int) -> None:
+        """Adds a value to a counter, which starts at zero."""
+        self.counters[name] = self.counters.get(name, 0) + value
+
+    def get_phase_time(self, name: str) -> float:
+        """Gets the wall time, in seconds, of a phase (0 if it did not run)."""
+        return self.phases.get(name, {}).get("time", 0.0)
+
+    def get_total_time(self) -> float:
+        """Gets the total wall time, in seconds, of all phases."""
+        return sum(phase["time"] for phase in self.phases.values())
+
+    def get_counters(self) -> dict[str, int]:
+        """Gets the map from counter names to their values."""
+        return self.counters
+
+    def as_dict(self) -> dict:
+        """Gets the phases and counters as a JSON-serializable dictionary."""
+        return {"phases": {name: dict(phase) for name, phase in self.phases.items()},
+                "total_time": self.get_total_time(),
+                "counters": dict(self.counters)}
+
+    def write_json(self, output: Union[str, os.PathLike, TextIO]) -> None:
+        """Writes the phases and counters as JSON.
+
+        Args:
+            output (Union[str, os.PathLike, TextIO]): The path of the output file, or a text stream open for writing.
+        """
+        if isinstance(output, (str, os.PathLike)):
+            with open(output, 'w') as output_file:
+                json.dump(self.as_dict(), output_file, indent=2)
+        else:
+            json.dump(self.as_dict(), output, indent=2)
+
+    def format(self) -> str:
+        """Formats the phases and counters as a human-readable table."""
+        lines = [f"{'phase':<20} {'time(s)':>9}" + (f" {'peak(MiB)':>10}" if self.track_memory else "")]
+        for name, phase in self.phases.items():
+            line = f"{name:<20} {phase['time']:9.4f}"
+            if "peak_memory" in phase:
+                line += f" {phase['peak_memory'] / 2**20:10.2f}"
+            lines.append(line)
+        lines.append(f"{'total':<20} {self.get_total_time():9.4f}")
+        lines.extend(f"{name:<20} {value:9d}" for name, value in self.counters.items())
+        return "\n".join(lines)
\ No newline at end of file
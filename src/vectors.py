@@ -0,0 +1,117 @@
+from .ground import ReachedView
+from array import array
+from typing import Sequence
+
+def _import_numpy():
+    """Imports NumPy, which is an optional dependency of this module."""
+    try:
+        import numpy
+    except ImportError as error:
+        raise ImportError("NumPy is required for the vectorized states; install it with 'pip install numpy'") from error
+    return numpy
+
+def as_int8_array(values: Sequence[int]):
+    """Converts a sequence of -1/0/1 values into a NumPy int8 array, without copying it if possible.
+
+    Args:
+        values (Sequence[int]): The values; an 'array' of signed bytes, or a view over one (such as 'ReachedView'), is
+            wrapped without copying, and any other sequence is copied.
+
+    Returns:
+        numpy.ndarray: A one-dimensional int8 array with the values. An array that shares its memory with 'values' is
+            read-only.
+
+    Raises:
+        ImportError: If NumPy is not installed.
+    """
+    numpy = _import_numpy()
+    if isinstance(values, ReachedView):
+        values = values.get_array()
+    if isinstance(values, array) and values.typecode == "b":
+        vector = numpy.frombuffer(values, dtype=numpy.int8)
+        vector.flags.writeable = False
+        return vector
+    return numpy.fromiter(values, dtype=numpy.int8, count=len(values))
+
+def state_to_bitmask(state):
+    """Packs the true propositions of a state into a bitmask, one bit per proposition.
+
+    Args:
+        state (Union[numpy.ndarray, Sequence[int]]): The value of each proposition (1 for true, 0 for false, -1 for don't care).
+
+    Returns:
+        numpy.ndarray: A uint8 array of ceil(n / 8) bytes, where bit i % 8 of byte i // 8 is set if proposition i is true.
+    """
+    numpy = _import_numpy()
+    return numpy.packbits(numpy.asarray(state) == 1, bitorder="little")
+
+def bitmask_to_state(bitmask, num_propositions: int):
+    """Unpacks a bitmask (see 'state_to_bitmask') into the value of each proposition (1 for true, 0 for false).
+
+    Args:
+        bitmask (Union[numpy.ndarray, bytes]): The packed bits.
+        num_propositions (int): The number of propositions.
+
+    Returns:
+        numpy.ndarray: An int8 array with the value of each proposition.
+    """
+    numpy = _import_numpy()
+    bits = numpy.frombuffer(bitmask, dtype=numpy.uint8) if isinstance(bitmask, (bytes, bytearray)) else bitmask
+    return numpy.unpackbits(bits, count=num_propositions, bitorder="little").astype(numpy.int8)
+
+class StateVectors:
+    """NumPy int8 arrays of the initial state, the goal state and the reached (proposition, value) pairs of a problem.
+
+    Attributes:
+        initial_state (numpy.ndarray): The value of each proposition at the initial state (1 for true, 0 for false).
+        goal_state (numpy.ndarray): The goal value of each proposition (1 for true, 0 for false, -1 for don't care).
+        reachable (numpy.ndarray): The 2n entries of the reached pairs (1 if reachable, -1 otherwise); the i-th entry
+            corresponds to (P, True) and the (n + i)-th entry to (P, False).
+
+    Note:
+        NumPy is an optional dependency, imported when a 'StateVectors' object is built. The reached pairs are kept by
+        the grounding in an array of signed bytes (see 'ReachedView'), which is wrapped without copying it; the states
+        are copied once.
+
+    Examples:
+        >>> vectors = parser.get_state_vectors()
+        >>> vectors.get_true_atoms()
+        array([ 0,  3,  7])
+        >>> state_to_bitmask(vectors.initial_state)
+        array([137], dtype=uint8)
+    """
+
+    def __init__(self, initial_state: Sequence[int], goal_state: Sequence[int], reachable_propositions: Sequence[int]) -> None:
+        """Initializes a 'StateVectors' object.
+
+        Args:
+            initial_state (Sequence[int]): The value of each proposition at the initial state.
+            goal_state (Sequence[int]): The goal value of each proposition.
+            reachable_propositions (Sequence[int]): The entries of the reached pairs (see 'ReachedView').
+
+        Raises:
+            ImportError: If NumPy is not installed.
+        """
+        self.initial_state = as_int8_array(initial_state)
+        self.goal_state = as_int8_array(goal_state)
+        self.reachable = as_int8_array(reachable_propositions)
+
+    def get_num_propositions(self) -> int:
+        """Gets the number of propositions."""
+        return len(self.initial_state)
+
+    def get_true_atoms(self):
+        """Gets the indices of the propositions that are true at the initial state, as an integer array."""
+        return (self.initial_state == 1).nonzero()[0]
+
+    def get_goal_atoms(self):
+        """Gets the indices of the propositions whose value is specified by the goal, as an integer array."""
+        return (self.goal_state != -1).nonzero()[0]
+
+    def get_reachable_literals(self):
+        """Gets the literal ids (see 'get_literal_id') of the reachable (proposition, value) pairs, as an integer array."""
+        return (self.reachable == 1).nonzero()[0]
+
+    def get_reachable_atoms(self):
+        """Gets the indices of the propositions that can be reached as true, as an integer array."""
+        return (self.reachable[:self.get_num_propositions()] == 1).nonzero()[0]
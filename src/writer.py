@@ -0,0 +1,227 @@
+from .custom_types import Object, Proposition
+from .action_schema import ActionSchema
+from .ground import GroundActionRegistry
+from .proposition_space import PropositionSpace
+from .binary_format import pack_bdds, format_atoms
+from typing import BinaryIO, Iterable, Iterator, Sequence, TextIO, Union
+import os
+
+def describe_ground_action(schema: ActionSchema, parameters: tuple[int, ...], effects: list[list[tuple[int, bool]]],
+                           object_list: list[Object], preconditions: Union[list[tuple[int, bool]], None] = None
+                           ) -> tuple[str, list[tuple[int, bool]], list[list[tuple[int, bool]]]]:
+    """Gets the name, the ground preconditions and the ground effect scenarios of an instantiated action, as written in the output.
+
+    Args:
+        schema (ActionSchema): The compiled action.
+        parameters (tuple[int, ...]): The global ids of the objects assigned to the parameters.
+        effects (list[list[tuple[int, bool]]]): The ground effects of the instantiation (see 'ActionSchema.ground_effects').
+        object_list (list[Object]): The objects, indexed by global id (see 'PropositionSpace.object_list').
+        preconditions (Union[list[tuple[int, bool]], None]): The ground preconditions of the instantiation, if already
+            resolved (see 'GroundActionRegistry.preconditions'); otherwise, they are resolved from the schema. Defaults to None.
+
+    Note:
+        As in the output, an action without effects has a single scenario, and the preconditions stand for the effects
+        of an empty scenario.
+    """
+    name = "_".join([schema.get_action().get_name()] + [object_list[object].get_name() for object in parameters])
+    if preconditions is None:
+        preconditions = schema.ground_preconditions(parameters)
+    if len(effects) == 0:
+        effects = [preconditions]
+    elif not all(effects):
+        effects = [effect_scenario if len(effect_scenario) > 0 else preconditions for effect_scenario in effects]
+    return (name, preconditions, effects)
+
+class BddsWriter:
+    """Represents the output stage of the parser, which writes the problem in the format read by the planner.
+
+    The output is produced as a stream of blocks of lines, section by section, and written in large chunks. The indices of the
+    ground preconditions and effects are those resolved during grounding (see 'GroundActionRegistry').
+
+    Attributes:
+        problem_name (str): The name of the problem.
+        propositions (Union[PropositionSpace, Sequence[Proposition]]): The space of all propositions of the problem, or the
+            propositions written, if the actions are given by 'actions' (see 'GoalRelevance').
+        initial_state (list[int]): The bitmask representing the initial truth values of propositions (1 for true, 0 for false).
+        goal_state (list[int]): The bitmask representing the goal truth values of propositions (1 for true, 0 for false, -1 for don't care).
+        registry (Union[GroundActionRegistry, None]): The reachable instantiated actions, unless they are given by 'actions'.
+        reachable_propositions (Sequence[int]): The entries indicating whether each proposition (and its negation) is reachable (1) or not (-1).
+        chunk_size (int): The number of blocks written at once.
+        actions (Union[Iterable[tuple[str, list[tuple[int, bool]], list[list[tuple[int, bool]]]]], None]): The reachable
+            actions, as generated by 'iter_actions', written instead of those of 'registry'; they are consumed once.
+        num_actions (Union[int, None]): The number of reachable actions, or None if it is only known once 'actions' is
+            consumed, in which case the text output spills the actions to a temporary file to write their number first.
+
+    Examples:
+        >>> writer = BddsWriter.from_parser(parser)
+        >>> writer.write("parser_output.out")
+        >>> writer.write_binary("parser_output.bin")
+    """
+
+    def __init__(self, problem_name: str, propositions: Union[PropositionSpace, Sequence[Proposition]], initial_state: list[int], goal_state: list[int],
+                 registry: Union[GroundActionRegistry, None], reachable_propositions: Sequence[int], chunk_size: int = 4096,
+                 actions: Union[Iterable[tuple[str, list[tuple[int, bool]], list[list[tuple[int, bool]]]]], None] = None,
+                 num_actions: Union[int, None] = None) -> None:
+        """Initializes a 'BddsWriter' object.
+
+        Args:
+            problem_name (str): The name of the problem.
+            propositions (Union[PropositionSpace, Sequence[Proposition]]): The space of all propositions of the problem, or
+                the propositions written, if the actions are given by 'actions'.
+            initial_state (list[int]): The bitmask representing the initial truth values of propositions.
+            goal_state (list[int]): The bitmask representing the goal truth values of propositions.
+            registry (Union[GroundActionRegistry, None]): The reachable instantiated actions, or None if they are given by 'actions'.
+            reachable_propositions (Sequence[int]): The entries indicating whether each proposition (and its negation) is
+                reachable; if the actions are generated while grounding, it only has to be complete once they are consumed.
+            chunk_size (int): The number of blocks written at once. Defaults to 4096.
+            actions (Union[Iterable[tuple[str, list[tuple[int, bool]], list[list[tuple[int, bool]]]]], None]): The reachable
+                actions, written instead of those of 'registry'. Defaults to None.
+            num_actions (Union[int, None]): The number of actions of 'actions', if known in advance. Defaults to None.
+        """
+        self.problem_name = problem_name
+        self.propositions = propositions
+        self.initial_state = initial_state
+        self.goal_state = goal_state
+        self.registry = registry
+        self.reachable_propositions = reachable_propositions
+        self.chunk_size = chunk_size
+        self.actions = actions
+        self.num_actions = len(registry) if actions is None else num_actions
+
+    @classmethod
+    def from_parser(cls, parser, chunk_size: int = 4096) -> 'BddsWriter':
+        """Builds a 'BddsWriter' object for the output of a 'Parser' object.
+
+        Args:
+            parser (Parser): The parser whose problem is written.
+            chunk_size (int): The number of blocks written at once. Defaults to 4096.
+        """
+        return cls(parser.problem.get_name(), parser.get_propositions(), parser.get_initial_state(), parser.get_goal_state(),
+                   parser.get_registry(), parser.reachable_propositions, chunk_size)
+
+    def write(self, output: Union[str, os.PathLike, TextIO]) -> None:
+        """Writes the output to a file.
+
+        Args:
+            output (Union[str, os.PathLike, TextIO]): The path of the output file, which is created or truncated, or a
+                text stream open for writing, which is left open.
+        """
+        if isinstance(output, (str, os.PathLike)):
+            with open(output, 'w') as output_file:
+                self.__write_lines(output_file)
+        else:
+            self.__write_lines(output)
+
+    def write_binary(self, output: Union[str, os.PathLike, BinaryIO]) -> None:
+        """Writes the output to a file in the binary format (see 'BinaryBdds').
+
+        Args:
+            output (Union[str, os.PathLike, BinaryIO]): The path of the output file, which is created or truncated, or a
+                binary stream open for writing, which is left open.
+        """
+        num_propositions = len(self.reachable_propositions) // 2
+        pack_bdds(output, self.problem_name, (str(proposition) for proposition in self.propositions), self.initial_state,
+                  ((i, value) for i, value in enumerate(self.goal_state) if value != -1), self.iter_actions(),
+                  (i for i, value in zip(range(num_propositions), self.reachable_propositions) if value == 1))
+
+    def iter_actions(self) -> Iterator[tuple[str, list[tuple[int, bool]], list[list[tuple[int, bool]]]]]:
+        """Generates the name, the ground preconditions and the ground effect scenarios of each reachable action.
+
+        Note:
+            The actions are those of 'actions', if given, or those of 'registry' (see 'describe_ground_action').
+        """
+        if self.actions is not None:
+            yield from self.actions
+            return
+        object_list = self.propositions.object_list
+        preconditions_list = self.registry.preconditions
+        effects_list = self.registry.effects
+        for position, (schema, parameters) in enumerate(self.registry):
+            yield describe_ground_action(schema, parameters, effects_list[position], object_list, preconditions_list[position])
+
+    def __write_lines(self, output_file: TextIO) -> None:
+        """Writes the output to a text stream, 'chunk_size' blocks at a time; the last line is not terminated."""
+        separator = ""
+        chunk = []
+        for block in self.iter_blocks():
+            chunk.append(block)
+            if len(chunk) == self.chunk_size:
+                output_file.write(separator + "\n".join(chunk))
+                separator = "\n"
+                chunk = []
+        if len(chunk) > 0:
+            output_file.write(separator + "\n".join(chunk))
+
+    def iter_blocks(self) -> Iterator[str]:
+        """Generates the output, section by section, as blocks of one or more lines without the final line terminator."""
+        yield from self.__problem_name_blocks()
+        yield from self.__proposition_blocks()
+        yield from self.__initial_state_blocks()
+        yield from self.__goal_state_blocks()
+        yield from self.__action_blocks()
+        yield from self.__reachable_proposition_blocks()
+
+    def __problem_name_blocks(self) -> Iterator[str]:
+        """Generates the problem name, enclosed in 'begin_problem_name' and 'end_problem_name' tags."""
+        yield "begin_problem_name\n" + self.problem_name + "\nend_problem_name"
+
+    def __proposition_blocks(self) -> Iterator[str]:
+        """Generates the propositions and their indices, enclosed in 'begin_propositions' and 'end_propositions' tags."""
+        yield "begin_propositions\n" + str(len(self.propositions))
+        for i, proposition in enumerate(self.propositions):
+            yield f"{proposition} {i}"
+        yield "end_propositions"
+
+    def __initial_state_blocks(self) -> Iterator[str]:
+        """Generates the initial state, enclosed in 'begin_initial_state' and 'end_initial_state' tags."""
+        yield "begin_initial_state\n" + str(len(self.initial_state))
+        yield "\n".join([f"{i} {value}" for i, value in enumerate(self.initial_state)] + ["end_initial_state"])
+
+    def __goal_state_blocks(self) -> Iterator[str]:
+        """Generates the goal state, enclosed in 'begin_goal_state' and 'end_goal_state' tags; don't care values are omitted."""
+        lines = ["begin_goal_state"]
+        lines.extend(f"{i} {value}" for i, value in enumerate(self.goal_state) if value != -1)
+        lines.append("end_goal_state")
+        yield "\n".join(lines)
+
+    def __action_blocks(self) -> Iterator[str]:
+        """Generates the reachable actions, one block per action, enclosed in 'begin_actions' and 'end_actions' tags.
+
+        Note:
+            Each action lists its preconditions, followed by its effect scenarios enclosed in 'begin_nd_effects' and
+            'end_nd_effects' tags. An action without effects, or an empty scenario, is written with its preconditions as effects.
+            If 'num_actions' is unknown, the blocks are first written to a temporary file, and read back once the number of
+            actions, which precedes them, is known, in blocks of a few hundred bytes, about the size of an action block.
+        """
+        if self.num_actions is not None:
+            yield "begin_actions\n" + str(self.num_actions)
+            yield from self.__iter_action_blocks()
+        else:
+            import tempfile
+            with tempfile.TemporaryFile("w+") as spill_file:
+                num_actions = 0
+                for block in self.__iter_action_blocks():
+                    spill_file.write(block + "\n")
+                    num_actions += 1
+                spill_file.seek(0)
+                yield "begin_actions\n" + str(num_actions)
+                for lines in iter(lambda: spill_file.readlines(512), []):
+                    yield "".join(lines)[:-1]
+        yield "end_actions"
+
+    def __iter_action_blocks(self) -> Iterator[str]:
+        """Generates the lines of each reachable action, one block per action."""
+        for name, preconditions, effects in self.iter_actions():
+            formatted_preconditions = format_atoms(preconditions)
+            lines = ["begin_action", name, "preconditions", formatted_preconditions, "begin_nd_effects", str(len(effects))]
+            for effect_scenario in effects:
+                lines.append("effects")
+                lines.append(formatted_preconditions if effect_scenario is preconditions else format_atoms(effect_scenario))
+            lines.append("end_nd_effects\nend_action")
+            yield "\n".join(lines)
+
+    def __reachable_proposition_blocks(self) -> Iterator[str]:
+        """Generates the indices of the reachable propositions, enclosed in 'begin_reachable_propositions' and 'end_reachable_propositions' tags."""
+        num_propositions = len(self.reachable_propositions) // 2
+        reachable = [str(i) for i, value in zip(range(num_propositions), self.reachable_propositions) if value == 1]
+        yield "\n".join(["begin_reachable_propositions", str(len(reachable))] + reachable + ["end_reachable_propositions"])
@@ -0,0 +1,53 @@
+import pytest
+from src import Parser, Object, Predicate, Proposition, Action, PropositionSpace
+from src import get_relation_bases, get_relation_id, compile_actions
+
+@pytest.mark.parametrize("domain_filename, problem_filename, prune_static", [
+    ("tests/examples/gripper3.pddl", "tests/examples/gripper3_3_balls.pddl", True),
+    ("tests/examples/triangle-tire.pddl", "tests/examples/triangle-tire-2.pddl", False),
+    ("tests/examples/logistics.pddl", "tests/examples/logistics-1.pddl", True),
+    ])
+def test_schemas_resolve_by_name(domain_filename, problem_filename, prune_static):
+    parser = Parser(domain_filename, problem_filename, prune_static)
+    propositions = parser.get_propositions()
+    names = parser.get_dict_propositions()
+    schemas = {schema.get_action(): schema for schema in parser.schemas}
+
+    def expected(atoms, parameters, action):
+        positions = {parameter.get_name(): i for i, parameter in enumerate(action.get_parameters())}
+        result = []
+        for generic_proposition, value in atoms:
+            if generic_proposition.get_predicate().get_name() not in propositions.predicate_ids:
+                continue
+            objects = [parameters[positions[o.get_name()]].get_name() if o.get_name() in positions else o.get_name()
+                       for o in generic_proposition.get_objects()]
+            name = "_".join([generic_proposition.get_predicate().get_name()] + objects)
+            result.append((names[name].get_index(), bool(value)))
+        return result
+
+    for action, parameters in parser.get_reachable_actions():
+        binding = [propositions.global_ids[parameter.get_name()] for parameter in parameters]
+        schema = schemas[action]
+        assert schema.ground_preconditions(binding) == expected(action.get_preconditions(), parameters, action)
+        assert schema.ground_effects(binding) == [expected(scenario, parameters, action) for scenario in action.get_effects()]
+
+def test_schema_constants():
+    objects = {"ball": [Object("ball1", "ball"), Object("ball2", "ball")],
+               "room": [Object("rooma", "room"), Object("roomb", "room")]}
+    at_ball = Predicate("at-ball", ["ball", "room"])
+    ball = Object("?b", "ball")
+    room = Object("?r", "room")
+    rooma = Object("rooma", "room")
+    move = Action("move", [ball, room],
+                  [(Proposition(at_ball, [ball, rooma]), True)],
+                  [[(Proposition(at_ball, [ball, room]), True), (Proposition(at_ball, [ball, rooma]), False)]])
+    space = PropositionSpace({"at-ball": at_ball}, objects)
+    relation_bases = get_relation_bases(space, {"at-ball": at_ball})
+    schema = compile_actions([move], space, relation_bases)[0]
+    assert schema.constants == (space.global_ids["rooma"],)
+    assert schema.preconditions == [(get_relation_id(0, True), 0, (0, 2), True)]
+
+    binding = [space.global_ids["ball2"], space.global_ids["roomb"]]
+    assert schema.ground_preconditions(binding) == [(space.index_of("at-ball", ["ball2", "rooma"]), True)]
+    assert schema.ground_effects(binding) == [[(space.index_of("at-ball", ["ball2", "roomb"]), True),
+                                               (space.index_of("at-ball", ["ball2", "rooma"]), False)]]
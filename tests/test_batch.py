@@ -0,0 +1,43 @@
+import os
+import pytest
+from src import Parser, parse_many, get_output_path
+
+PROBLEMS = ["./tests/examples/triangle-tire-1.pddl", "./tests/examples/triangle-tire-2.pddl", "./tests/examples/missing.pddl"]
+
+def test_parse_many(tmp_path):
+    results = list(parse_many("./tests/examples/triangle-tire.pddl", PROBLEMS, workers=2, output_dir=str(tmp_path),
+                              keep_parsers=True))
+    assert sorted(result.get_problem_path() for result in results) == sorted(PROBLEMS)
+    for result in results:
+        if result.get_problem_path().endswith("missing.pddl"):
+            assert not result.succeeded()
+            assert result.get_error().startswith("FileNotFoundError")
+            assert result.get_output_path() is None
+            continue
+        assert result.succeeded()
+        expected = Parser("./tests/examples/triangle-tire.pddl", result.get_problem_path())
+        assert result.num_actions == len(expected.get_reachable_actions())
+        assert result.get_output_path() == get_output_path(result.get_problem_path(), str(tmp_path))
+        assert os.path.exists(result.get_output_path())
+        parser = result.get_parser()
+        assert [(schema.get_index(), parameters) for schema, parameters in parser.get_registry()] == \
+               [(schema.get_index(), parameters) for schema, parameters in expected.get_registry()]
+
+def test_parse_many_timeout():
+    results = list(parse_many("./tests/examples/gripper3.pddl", ["./tests/examples/gripper3_3_balls.pddl"], workers=1,
+                              timeout=1e-6))
+    assert results[0].get_error() == "TimeoutError: time limit exceeded"
+
+def test_parse_many_invalid_workers():
+    with pytest.raises(ValueError):
+        list(parse_many("./tests/examples/gripper3.pddl", [], workers=0))
+
+def test_parse_many_without_timer(monkeypatch):
+    import signal
+    monkeypatch.delattr(signal, "setitimer")
+    monkeypatch.delattr(signal, "SIGALRM")
+    with pytest.raises(ValueError):
+        list(parse_many("./tests/examples/gripper3.pddl", [], workers=2, timeout=60))
+    results = list(parse_many("./tests/examples/gripper3.pddl", ["./tests/examples/gripper3_1_ball.pddl"], workers=2,
+                              memory_limit=2**40))
+    assert results[0].succeeded()
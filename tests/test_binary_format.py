@@ -0,0 +1,74 @@
+import io
+import os
+import pytest
+from src import Parser, BinaryBdds, pack_bdds, read_text_bdds, text_to_binary, binary_to_text
+
+@pytest.mark.parametrize("domain_filename, problem_filename", [
+    ("tests/examples/gripper3.pddl", "tests/examples/gripper3_3_balls.pddl"),
+    ("tests/examples/gripper_se.pddl", "tests/examples/gripper_se_1_ball.pddl"),
+    ("tests/examples/triangle-tire.pddl", "tests/examples/triangle-tire-2.pddl"),
+    ("tests/examples/logistics.pddl", "tests/examples/logistics-1.pddl"),
+    ])
+def test_binary_round_trip(domain_filename, problem_filename, tmp_path):
+    parser = Parser(domain_filename, problem_filename)
+    text_path = tmp_path / "output.out"
+    binary_path = tmp_path / "output.bin"
+    parser.print_bdds(text_path)
+    parser.print_binary(binary_path)
+    text = text_path.read_text()
+
+    stream = io.BytesIO()
+    text_to_binary(text_path, stream)
+    assert stream.getvalue() == binary_path.read_bytes()
+
+    converted = io.StringIO()
+    binary_to_text(binary_path, converted)
+    assert converted.getvalue() == text
+    binary_to_text(binary_path.read_bytes(), tmp_path / "converted.out")
+    assert (tmp_path / "converted.out").read_text() == text
+
+    with BinaryBdds(binary_path) as bdds:
+        assert bdds.get_problem_name() == parser.problem.get_name()
+        assert bdds.num_propositions == len(parser.get_propositions())
+        assert list(bdds.initial_state) == parser.get_initial_state()
+        assert bdds.num_actions == len(parser.get_reachable_actions())
+        for i, proposition in enumerate(parser.get_propositions()):
+            assert bdds.get_proposition_name(i) == str(proposition)
+        _, _, _, _, actions, reachable = read_text_bdds(io.StringIO(text))
+        assert list(bdds.reachable_propositions) == reachable
+        for position, (name, preconditions, effects) in enumerate(actions):
+            assert bdds.get_action_name(position) == name
+            assert bdds.get_preconditions(position) == preconditions
+            assert bdds.get_effects(position) == effects
+
+def test_binary_small_problem():
+    stream = io.BytesIO()
+    pack_bdds(stream, "tiny", ["p", "q"], [1, 0], [(1, 1)],
+              [("a_x", [(0, 1)], [[(1, 1), (0, 0)]]), ("b", [], [[]])], [0, 1])
+    bdds = BinaryBdds(stream.getvalue())
+    assert bdds.get_goal_state() == [(1, 1)]
+    assert bdds.get_action_name(1) == "b"
+    assert bdds.get_effects(0) == [[(1, 1), (0, 0)]]
+    assert bdds.get_effects(1) == [[]]
+    assert bdds.action_data.format == "i"
+    bdds.close()
+
+def test_binary_invalid():
+    with pytest.raises(ValueError):
+        BinaryBdds(b"begin_problem_name\nx\nend_problem_name\n" + bytes(40))
+    with pytest.raises(ValueError):
+        BinaryBdds(b"PDDL")
+    with pytest.raises(ValueError):
+        read_text_bdds(io.StringIO("begin_problem_name\nx\n"))
+
+@pytest.mark.skipif(not os.path.isdir("/proc/self/fd"), reason="needs /proc to list the open files")
+def test_binary_invalid_file_is_closed(tmp_path):
+    num_open_files = len(os.listdir("/proc/self/fd"))
+    errors = []
+    for index, contents in enumerate([b"", b"PDDL", b"begin_problem_name\nx\nend_problem_name\n" + bytes(40)]):
+        path = tmp_path / ("invalid-" + str(index) + ".bin")
+        path.write_bytes(contents)
+        with pytest.raises(ValueError) as error:
+            BinaryBdds(path)
+        errors.append(error)
+    assert len(os.listdir("/proc/self/fd")) == num_open_files
@@ -0,0 +1,63 @@
+import io
+import os
+import shutil
+import pytest
+from src import Parser, ParseCache, load_domain
+
+def output(parser):
+    stream = io.StringIO()
+    parser.print_bdds(stream)
+    return stream.getvalue()
+
+@pytest.mark.parametrize("domain_filename, problem_filename, options", [
+    ("tests/examples/gripper3.pddl", "tests/examples/gripper3_3_balls.pddl", {}),
+    ("tests/examples/triangle-tire.pddl", "tests/examples/triangle-tire-2.pddl", {"prune_static": False}),
+    ("tests/examples/logistics.pddl", "tests/examples/logistics-1.pddl", {"grounding": "layered"}),
+    ])
+def test_cache_warm_run(tmp_path, domain_filename, problem_filename, options):
+    cache = ParseCache(tmp_path)
+    cold_parser = Parser(domain_filename, problem_filename, cache=cache, **options)
+    assert (cache.get_hits(), cache.get_misses()) == (0, 1)
+    warm_parser = Parser(domain_filename, problem_filename, cache=str(tmp_path), **options)
+    assert warm_parser.cache_key == cold_parser.cache_key
+    assert output(warm_parser) == output(cold_parser)
+    assert [str(action) for action, _ in warm_parser.get_reachable_actions()] == \
+           [str(action) for action, _ in cold_parser.get_reachable_actions()]
+    Parser(load_domain(domain_filename), problem_filename, cache=cache, **options)
+    assert (cache.get_hits(), cache.get_misses()) == (1, 1)
+
+def test_cache_keeps_caller_arguments(tmp_path):
+    cache = ParseCache(tmp_path)
+    Parser("tests/examples/logistics.pddl", "tests/examples/logistics-1.pddl", cache=cache, grounding="layered")
+    domain = load_domain("tests/examples/logistics.pddl")
+    parser = Parser(domain, "tests/examples/logistics-1.pddl", cache=cache, reader="builtin", grammar_cache=False)
+    assert cache.get_hits() == 1
+    assert parser.domain is domain
+    assert (parser.reader, parser.grammar_cache, parser.grounding, parser.layers) == ("builtin", False, "queue", None)
+    assert all(any(action is domain_action for domain_action in domain.get_actions())
+               for action, _ in parser.get_reachable_actions())
+    assert all(schema.get_action() is action for schema, action in zip(parser.schemas, domain.get_actions()))
+
+def test_cache_key(tmp_path):
+    cache = ParseCache(tmp_path / "cache")
+    problem_path = tmp_path / "gripper3_1_ball.pddl"
+    shutil.copy("tests/examples/gripper3_1_ball.pddl", problem_path)
+    parser = Parser("tests/examples/gripper3.pddl", str(problem_path), cache=cache)
+    assert Parser("tests/examples/gripper3.pddl", str(problem_path), cache=cache, prune_static=False).cache_key != parser.cache_key
+    with open(problem_path, "a") as problem_file:
+        problem_file.write("\n")
+    assert Parser("tests/examples/gripper3.pddl", str(problem_path), cache=cache).cache_key != parser.cache_key
+    assert cache.get_hits() == 0
+
+def test_cache_eviction(tmp_path):
+    cache = ParseCache(tmp_path, max_size=1)
+    first = Parser("tests/examples/gripper3.pddl", "tests/examples/gripper3_1_ball.pddl", cache=cache)
+    second = Parser("tests/examples/gripper3.pddl", "tests/examples/gripper3_2_balls.pddl", cache=cache)
+    assert os.listdir(tmp_path) == []
+    cache.max_size = 2**30
+    Parser("tests/examples/gripper3.pddl", "tests/examples/gripper3_1_ball.pddl", cache=cache)
+    Parser("tests/examples/gripper3.pddl", "tests/examples/gripper3_2_balls.pddl", cache=cache)
+    os.utime(cache.get_path(first.cache_key), (0, 0))
+    cache.max_size = os.path.getsize(cache.get_path(second.cache_key))
+    cache.evict()
+    assert os.listdir(tmp_path) == [second.cache_key + ".pickle"]
@@ -0,0 +1,31 @@
+import pickle
+from src import Object, Predicate, Proposition, load_domain
+
+def test_objects_are_interned():
+    rooma = Object("rooma", "room")
+    assert Object("rooma", "room") is rooma
+    assert Object("rooma", "location") is not rooma
+    assert pickle.loads(pickle.dumps(rooma)) is rooma
+    at_ball = Predicate("at-ball", ["ball", "room"])
+    assert Predicate("at-ball", ("ball", "room")) is at_ball
+    assert pickle.loads(pickle.dumps(at_ball)) is at_ball
+    assert str(at_ball) == "at-ball ['ball', 'room']"
+
+def test_domain_shares_objects():
+    domain = load_domain("tests/examples/gripper3.pddl")
+    for action in domain.get_actions():
+        parameters = {id(parameter) for parameter in action.get_parameters()}
+        atoms = action.get_preconditions() + [atom for scenario in action.get_effects() for atom in scenario]
+        for proposition, _ in atoms:
+            assert all(id(object) in parameters for object in proposition.get_objects())
+
+def test_proposition_name_is_lazy():
+    objects = [Object("ball1", "ball"), Object("rooma", "room")]
+    proposition = Proposition(Predicate("at-ball", ["ball", "room"]), objects, 0)
+    objects.append(Object("roomb", "room"))
+    assert proposition.get_objects() == (Object("ball1", "ball"), Object("rooma", "room"))
+    assert proposition._name is None
+    assert str(proposition) == "at-ball_ball1_rooma"
+    assert str(Proposition(Predicate("handempty"), [])) == "handempty"
+    restored = pickle.loads(pickle.dumps(proposition))
+    assert restored == proposition and restored.get_index() == 0
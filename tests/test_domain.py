@@ -1,6 +1,8 @@
 import pytest
 import pddl
-from src import Domain
+from src import Domain, DomainRegistry, Parser
+from concurrent.futures import ThreadPoolExecutor
+import shutil
 
 @pytest.mark.parametrize("domain_filename,expected", [
     ("./tests/examples/gripper3.pddl", {"gripper": ["left","right"]}),
@@ -87,4 +89,43 @@ def test_actions_effects(domain_filename, expected):
         for effect in action.effects:
             ans_effects.append(sorted([(str(obj[0]), str(obj[1])) for obj in effect])) 
         answer[action.name] = sorted(ans_effects)
-    assert answer == expected
\ No newline at end of file
+    assert answer == expected
+
+@pytest.mark.parametrize("domain_filename,expected_static,expected_fluent", [
+    ("./tests/examples/gripper3.pddl", [], ["at-ball", "at-robby", "carry", "free", "whole"]),
+    ("./tests/examples/triangle-tire.pddl", ["road"], ["not-flattire", "spare-in", "vehicle-at"]),
+    ])
+def test_predicates_classification(domain_filename, expected_static, expected_fluent):
+    domain = pddl.parse_domain(domain_filename)
+    domain = Domain(domain)
+    assert sorted(domain.get_static_predicates()) == expected_static
+    assert sorted(domain.get_fluent_predicates()) == expected_fluent
+
+def test_domain_registry(tmp_path):
+    registry = DomainRegistry(max_size=2)
+    gripper = registry.get("./tests/examples/gripper3.pddl")
+    assert registry.get("./tests/examples/gripper3.pddl") is gripper
+    assert registry.get("tests/examples/gripper3.pddl") is gripper
+    assert (registry.get_hits(), registry.get_misses()) == (2, 1)
+    parsers = [Parser(gripper, problem) for problem in ["./tests/examples/gripper3_1_ball.pddl", "./tests/examples/gripper3_2_balls.pddl"]]
+    assert all(parser.domain is gripper for parser in parsers)
+
+    domain_path = tmp_path / "triangle-tire.pddl"
+    shutil.copy("./tests/examples/triangle-tire.pddl", domain_path)
+    triangle_tire = registry.get(str(domain_path))
+    registry.get("./tests/examples/gripper3.pddl")
+    with open(domain_path, "a") as domain_file:
+        domain_file.write("\n")
+    assert registry.get(str(domain_path)) is not triangle_tire
+    assert len(registry) == 2
+    assert registry.get("./tests/examples/triangle-tire.pddl") is not triangle_tire
+    assert registry.get("./tests/examples/gripper3.pddl") is not gripper
+    assert (registry.get_hits(), registry.get_misses()) == (3, 5)
+
+def test_domain_registry_threads():
+    registry = DomainRegistry()
+    with ThreadPoolExecutor(8) as executor:
+        domains = list(executor.map(registry.get, ["./tests/examples/logistics.pddl"] * 32))
+    assert all(domain is domains[0] for domain in domains)
+    assert registry.get_hits() + registry.get_misses() == 32
+    assert len(registry) == 1
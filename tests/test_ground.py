@@ -1,5 +1,6 @@
 import pytest
-from src import Parser
+from src import (Parser, ReachedView, GroundActionRegistry, create_reached_list, get_literal_id, get_literal_pair,
+                 store_initial_queue, iter_ground)
 
 @pytest.mark.parametrize("domain_filename, problem_filename, expected", [
     ("tests/examples/gripper3.pddl", "tests/examples/gripper3_3_balls.pddl", 
@@ -19,3 +20,158 @@ def test_ground(domain_filename, problem_filename, expected):
     
     actions.sort()
     assert actions == expected
+
+@pytest.mark.parametrize("domain_filename, problem_filename", [
+    ("tests/examples/triangle-tire.pddl", "tests/examples/triangle-tire-1.pddl"),
+    ("tests/examples/triangle-tire.pddl", "tests/examples/triangle-tire-2.pddl"),
+    ])
+def test_ground_static_pruning(domain_filename, problem_filename):
+    def action_names(parser):
+        return sorted(str(action) + "".join("_" + str(object) for object in objects)
+                      for action, objects in parser.get_reachable_actions())
+    parser = Parser(domain_filename, problem_filename)
+    full_parser = Parser(domain_filename, problem_filename, prune_static=False)
+    assert action_names(parser) == action_names(full_parser)
+
+
+def write_logistics_goal(tmp_path, goal, removed_fact=""):
+    with open("tests/examples/logistics-1.pddl") as problem_file:
+        text = problem_file.read()
+    text = text.replace(removed_fact, "") if removed_fact else text
+    text = text.replace("(:goal (at-pkg pkg1 locc))", "(:goal (and (at-pkg pkg1 locc) " + goal + "))")
+    problem_path = tmp_path / "problem.pddl"
+    problem_path.write_text(text)
+    return str(problem_path)
+
+@pytest.mark.parametrize("reader", ["pddl", "builtin"])
+def test_static_goal_facts(tmp_path, reader):
+    parser = Parser("tests/examples/logistics.pddl", "tests/examples/logistics-1.pddl", reader=reader)
+    true_goal_parser = Parser("tests/examples/logistics.pddl", write_logistics_goal(tmp_path, "(in-city locc city1)"),
+                              reader=reader)
+    assert true_goal_parser.get_goal_state() == parser.get_goal_state()
+    false_goal_path = write_logistics_goal(tmp_path, "(in-city locc city1)", "(in-city locc city1)")
+    with pytest.raises(ValueError):
+        Parser("tests/examples/logistics.pddl", false_goal_path, reader=reader)
+    full_parser = Parser("tests/examples/logistics.pddl", false_goal_path, prune_static=False, reader=reader)
+    assert full_parser.get_goal_state()[full_parser.get_propositions().index_of("in-city", ["locc", "city1"])] == 1
+    with pytest.raises(ValueError):
+        parser.add_objects({"location": ["locx"]}, [], [("in-city", ("locx", "city1"), True)])
+    parser.add_objects({"location": ["locx"]}, [("in-city", ("locx", "city1"), True)], [("in-city", ("locx", "city1"), True)])
+
+@pytest.mark.parametrize("prune_static", [True, False])
+def test_ground_join_all_preconditions(prune_static):
+    parser = Parser("tests/examples/logistics.pddl", "tests/examples/logistics-1.pddl", prune_static=prune_static)
+    actions = sorted(str(action) + "".join("_" + str(object) for object in objects)
+                     for action, objects in parser.get_reachable_actions())
+    assert actions == ['drive_truck1_loca_locb_city1', 'drive_truck1_loca_locc_city1', 'drive_truck1_locb_loca_city1',
+                       'drive_truck1_locb_locc_city1', 'drive_truck1_locc_loca_city1', 'drive_truck1_locc_locb_city1',
+                       'load_pkg1_truck1_loca', 'load_pkg1_truck1_locb', 'load_pkg1_truck1_locc',
+                       'unload_pkg1_truck1_loca', 'unload_pkg1_truck1_locb', 'unload_pkg1_truck1_locc']
+
+@pytest.mark.parametrize("domain_filename, problem_filename, prune_static", [
+    ("tests/examples/gripper3.pddl", "tests/examples/gripper3_3_balls.pddl", True),
+    ("tests/examples/triangle-tire.pddl", "tests/examples/triangle-tire-2.pddl", True),
+    ("tests/examples/triangle-tire.pddl", "tests/examples/triangle-tire-2.pddl", False),
+    ("tests/examples/logistics.pddl", "tests/examples/logistics-1.pddl", True),
+    ])
+def test_ground_layered(domain_filename, problem_filename, prune_static):
+    def action_names(parser):
+        return [str(action) + "".join("_" + str(object) for object in objects)
+                for action, objects in parser.get_reachable_actions()]
+    parser = Parser(domain_filename, problem_filename, prune_static)
+    layered_parser = Parser(domain_filename, problem_filename, prune_static, grounding="layered")
+    layered_actions = action_names(layered_parser)
+    assert len(layered_actions) == len(set(layered_actions))
+    assert sorted(layered_actions) == sorted(set(action_names(parser)))
+    assert layered_parser.reachable_propositions == [1 if value != -1 else -1 for value in parser.reachable_propositions]
+    assert parser.get_layers() is None
+
+    layers = layered_parser.get_layers()
+    num_propositions = len(layered_parser.get_propositions())
+    assert sum(layers.get_new_actions()) == len(layered_actions)
+    assert sum(layers.get_new_atoms()) == layered_parser.reachable_propositions.count(1)
+    assert layers.get_new_atoms()[0] == num_propositions
+    for index, value in enumerate(layered_parser.get_initial_state()):
+        assert layers.get_atom_layer(index, value) == 0
+    assert max(layers.atom_layers) == layers.get_num_layers() - 1
+
+@pytest.mark.parametrize("domain_filename, problem_filename, prune_static, workers", [
+    ("tests/examples/gripper3.pddl", "tests/examples/gripper3_3_balls.pddl", True, 2),
+    ("tests/examples/triangle-tire.pddl", "tests/examples/triangle-tire-2.pddl", True, 3),
+    ("tests/examples/triangle-tire.pddl", "tests/examples/triangle-tire-2.pddl", False, 2),
+    ("tests/examples/hub.pddl", "tests/examples/hub-1.pddl", True, 2),
+    ("tests/examples/logistics.pddl", "tests/examples/logistics-1.pddl", True, 1),
+    ])
+def test_ground_parallel(domain_filename, problem_filename, prune_static, workers):
+    layered_parser = Parser(domain_filename, problem_filename, prune_static, grounding="layered")
+    parallel_parser = Parser(domain_filename, problem_filename, prune_static, grounding="parallel", workers=workers)
+    def instantiations(parser):
+        return [(schema.get_index(), parameters) for schema, parameters in parser.get_registry()]
+    assert instantiations(parallel_parser) == instantiations(layered_parser)
+    assert parallel_parser.reachable_propositions == layered_parser.reachable_propositions
+    assert parallel_parser.get_layers().atom_layers == layered_parser.get_layers().atom_layers
+    assert parallel_parser.get_layers().get_new_actions() == layered_parser.get_layers().get_new_actions()
+
+def test_ground_parallel_invalid_workers():
+    with pytest.raises(ValueError):
+        Parser("tests/examples/logistics.pddl", "tests/examples/logistics-1.pddl", grounding="parallel", workers=0)
+
+def test_ground_unknown_engine():
+    with pytest.raises(ValueError):
+        Parser("tests/examples/logistics.pddl", "tests/examples/logistics-1.pddl", grounding="bfs")
+
+@pytest.mark.parametrize("grounding, expected_duplicates", [("queue", 2), ("layered", 0)])
+def test_ground_registry_deduplication(grounding, expected_duplicates):
+    parser = Parser("tests/examples/hub.pddl", "tests/examples/hub-1.pddl", grounding=grounding)
+    actions = [str(action) + "".join("_" + str(object) for object in objects)
+               for action, objects in parser.get_reachable_actions()]
+    assert sorted(actions) == ['visit_hub_n1', 'visit_hub_n2', 'visit_n1_hub', 'visit_n1_n2', 'visit_n2_hub', 'visit_n2_n1']
+    registry = parser.get_registry()
+    assert len(registry) == len(actions)
+    assert registry.get_duplicates() == expected_duplicates
+    global_ids = parser.get_propositions().global_ids
+    for position, (schema, parameters) in enumerate(registry):
+        assert (schema.get_index(), parameters) in registry
+        assert registry.get_preconditions(position) == schema.ground_preconditions(parameters)
+    assert (0, (global_ids["n1"], global_ids["n1"])) not in registry
+
+def test_reached_list_and_literals():
+    initial_state = [1, 0, 1]
+    reached = create_reached_list(initial_state)
+    assert reached.itemsize == 1 and len(reached) == 6
+    assert list(reached) == [0, -1, 0, -1, 0, -1]
+    assert list(store_initial_queue(initial_state)) == [0, 4, 2]
+    for index in range(3):
+        for value in (0, 1):
+            assert get_literal_pair(get_literal_id(index, value, 3), 3) == (index, value)
+
+@pytest.mark.parametrize("grounding", ["queue", "layered"])
+def test_reached_view(grounding):
+    parser = Parser("tests/examples/triangle-tire.pddl", "tests/examples/triangle-tire-1.pddl", grounding=grounding)
+    reached = parser.reachable_propositions
+    assert isinstance(reached, ReachedView)
+    entries = list(reached)
+    assert set(entries) <= {-1, 1}
+    assert reached == entries and entries == reached[:]
+    assert reached.count(1) == entries.count(1)
+    assert len(reached) == 2 * len(parser.get_propositions())
+    assert reached.get_array().tobytes() == bytes(value & 0xFF for value in entries)
+
+@pytest.mark.parametrize("prune_static", [True, False])
+def test_iter_ground(prune_static):
+    parser = Parser("tests/examples/hub.pddl", "tests/examples/hub-1.pddl", prune_static=prune_static)
+    registry = GroundActionRegistry(keep_actions=False)
+    reached = create_reached_list(parser.get_initial_state())
+    generated = iter_ground(parser.get_initial_state(), parser.get_propositions(), parser.schemas, parser.relation_bases,
+                            parser.static_facts, registry, None, reached)
+    expected = list(parser.get_registry())
+    for position, (schema, parameters, effects) in enumerate(generated):
+        assert (schema, parameters) == expected[position]
+        assert effects == parser.get_registry().get_effects(position)
+    assert len(registry) == len(expected) and registry.get_duplicates() == parser.get_registry().get_duplicates()
+    assert list(registry) == [] and registry.effects == []
+    assert ReachedView(reached) == parser.reachable_propositions
+
+def test_streaming_requires_queue_engine():
+    with pytest.raises(ValueError):
+        Parser("tests/examples/logistics.pddl", "tests/examples/logistics-1.pddl", grounding="layered", streaming=True)
@@ -0,0 +1,98 @@
+import random
+import pytest
+from src import Parser, GroundActionRegistry, run_ground
+
+def ground_from_scratch(parser, initial_state):
+    registry = GroundActionRegistry()
+    _, reached = run_ground(initial_state, parser.propositions, parser.schemas, parser.relation_bases, parser.static_facts,
+                            registry)
+    return (set(registry.keys), list(reached))
+
+@pytest.mark.parametrize("filenames", [
+    ("./tests/examples/gripper3.pddl", "./tests/examples/gripper3_3_balls.pddl"),
+    ("./tests/examples/triangle-tire.pddl", "./tests/examples/triangle-tire-2.pddl"),
+    ("./tests/examples/logistics.pddl", "./tests/examples/logistics-1.pddl"),
+    ("./tests/examples/hub.pddl", "./tests/examples/hub-1.pddl"),
+    ])
+@pytest.mark.parametrize("grounding", ["queue", "layered"])
+def test_update_matches_grounding_from_scratch(filenames, grounding):
+    parser = Parser(filenames[0], filenames[1], grounding=grounding)
+    propositions = [str(proposition) for proposition in parser.propositions]
+    generator = random.Random(0)
+    for _ in range(5):
+        initial_state = parser.get_initial_state()[:]
+        for index in generator.sample(range(len(initial_state)), 3):
+            initial_state[index] = 1 - initial_state[index]
+        parser.update_initial_state(initial_state)
+        keys, reached = ground_from_scratch(parser, initial_state)
+        assert set(parser.get_registry().keys) == keys
+        assert list(parser.reachable_propositions) == reached
+        assert len(parser.get_reachable_actions()) == len(keys)
+        registry = parser.get_registry()
+        assert all(registry.get_preconditions(position) == schema.ground_preconditions(parameters)
+                   for position, (schema, parameters) in enumerate(registry))
+        assert [str(proposition) for proposition in parser.propositions] == propositions
+    assert parser.get_layers() is None
+
+def test_update_counts():
+    parser = Parser("./tests/examples/gripper3.pddl", "./tests/examples/gripper3_1_ball.pddl", stats=True)
+    index_of = parser.get_propositions().index_of
+    num_actions = len(parser.get_reachable_actions())
+    initial_state = parser.get_initial_state()[:]
+    initial_state[index_of("whole", ["ball1"])] = 0
+    num_added, num_removed = parser.update_initial_state(initial_state)
+    assert num_added == 0 and num_removed > 0
+    assert len(parser.get_reachable_actions()) == num_actions - num_removed
+    initial_state[index_of("whole", ["ball1"])] = 1
+    assert parser.update_initial_state(initial_state) == (num_removed, 0)
+    assert len(parser.get_reachable_actions()) == num_actions
+    assert parser.get_stats().get_counters()["updated_actions_added"] == num_removed
+
+def test_update_rejects_invalid_states():
+    parser = Parser("./tests/examples/gripper3.pddl", "./tests/examples/gripper3_1_ball.pddl")
+    with pytest.raises(ValueError):
+        parser.update_initial_state(parser.get_initial_state()[1:])
+    with pytest.raises(ValueError):
+        parser.update_initial_state([-1] * len(parser.get_initial_state()))
+    streaming_parser = Parser("./tests/examples/gripper3.pddl", "./tests/examples/gripper3_1_ball.pddl", streaming=True)
+    with pytest.raises(ValueError):
+        streaming_parser.update_initial_state(streaming_parser.get_initial_state())
+
+def describe(parser):
+    propositions = parser.propositions
+    num_propositions = len(propositions)
+    reached = parser.reachable_propositions
+    entries = {str(propositions[index]): (parser.initial_state[index], parser.goal_state[index], reached[index],
+                                          reached[num_propositions + index]) for index in range(num_propositions)}
+    return (entries, sorted(name for name, _, _ in parser.iter_reachable_actions()))
+
+@pytest.mark.parametrize("prune_static", [True, False])
+def test_add_objects_matches_parsing_them(tmp_path, prune_static):
+    parser = Parser("./tests/examples/logistics.pddl", "./tests/examples/logistics-1.pddl", prune_static=prune_static)
+    names = [str(proposition) for proposition in parser.propositions]
+    num_actions = len(parser.get_reachable_actions())
+    num_propositions, num_actions_added = parser.add_objects(
+        {"location": ["locx"], "package": ["pkgx"]},
+        [("in-city", ("locx", "city1"), True), ("at-pkg", ("pkgx", "locx"), True)], [("at-pkg", ("pkgx", "loca"), True)])
+    assert [str(proposition) for proposition in parser.propositions][:len(names)] == names
+    assert len(parser.propositions) == len(names) + num_propositions
+    assert len(parser.get_reachable_actions()) == num_actions + num_actions_added > num_actions
+    with open("./tests/examples/logistics-1.pddl") as problem_file:
+        text = problem_file.read()
+    text = text.replace("pkg1 - package", "pkg1 pkgx - package locx - location")
+    text = text.replace("(at-pkg pkg1 locb)", "(at-pkg pkg1 locb) (in-city locx city1) (at-pkg pkgx locx)")
+    text = text.replace("(:goal (at-pkg pkg1 locc))", "(:goal (and (at-pkg pkg1 locc) (at-pkg pkgx loca)))")
+    problem_path = tmp_path / "problem.pddl"
+    problem_path.write_text(text)
+    assert describe(parser) == describe(Parser("./tests/examples/logistics.pddl", str(problem_path),
+                                               prune_static=prune_static))
+
+def test_add_objects_rejects_invalid_arguments():
+    parser = Parser("./tests/examples/gripper3.pddl", "./tests/examples/gripper3_1_ball.pddl")
+    with pytest.raises(ValueError):
+        parser.add_objects({"ball": ["ball1"]})
+    with pytest.raises(ValueError):
+        parser.add_objects({"ball": ["ball2"]}, [("at-robby", ("roomb",), True)])
+    streaming_parser = Parser("./tests/examples/gripper3.pddl", "./tests/examples/gripper3_1_ball.pddl", streaming=True)
+    with pytest.raises(ValueError):
+        streaming_parser.add_objects({"ball": ["ball2"]})
@@ -0,0 +1,63 @@
+import os
+import subprocess
+import sys
+import pytest
+import main
+
+def test_batch_output(tmp_path, monkeypatch):
+    output_dir = tmp_path / "output"
+    monkeypatch.setattr(sys, "argv", ["main.py", "./tests/examples/gripper3.pddl", "./tests/examples/gripper3_*.pddl",
+                                      "--output-dir", str(output_dir)])
+    main.main()
+    assert sorted(os.listdir(output_dir)) == ["gripper3_1_ball.out", "gripper3_2_balls.out", "gripper3_3_balls.out"]
+
+def test_batch_continues_after_failure(tmp_path, monkeypatch, capsys):
+    output_dir = tmp_path / "output"
+    monkeypatch.setattr(sys, "argv", ["main.py", "./tests/examples/triangle-tire.pddl", "./tests/examples/missing.pddl",
+                                      "./tests/examples/triangle-tire-1.pddl", "--output-dir", str(output_dir)])
+    with pytest.raises(SystemExit) as exit_info:
+        main.main()
+    assert exit_info.value.code == 1
+    assert os.listdir(output_dir) == ["triangle-tire-1.out"]
+    assert "missing" in capsys.readouterr().out
+
+@pytest.mark.parametrize("patterns,expected", [
+    (["./tests/examples/hub-1.pddl"], ["./tests/examples/hub-1.pddl"]),
+    (["./tests/examples/hub*.pddl", "./tests/examples/hub-1.pddl"], ["./tests/examples/hub-1.pddl"]),
+    ])
+def test_expand_problem_paths(patterns, expected):
+    assert main.expand_problem_paths(patterns, "./tests/examples/hub.pddl") == expected
+
+def test_batch_streaming(tmp_path, monkeypatch):
+    for name, options in (("default", []), ("streaming", ["--streaming"])):
+        monkeypatch.setattr(sys, "argv", ["main.py", "./tests/examples/logistics.pddl", "./tests/examples/logistics-1.pddl",
+                                          "--output-dir", str(tmp_path / name)] + options)
+        main.main()
+    assert (tmp_path / "streaming" / "logistics-1.out").read_text() == (tmp_path / "default" / "logistics-1.out").read_text()
+
+def test_batch_relevant_only(tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(sys, "argv", ["main.py", "./tests/examples/gripper3.pddl", "./tests/examples/gripper3_1_ball.pddl",
+                                      "--output-dir", str(tmp_path), "--relevant-only"])
+    main.main()
+    output = capsys.readouterr().out
+    assert "removed" in output.splitlines()[1]
+    assert (tmp_path / "gripper3_1_ball.out").exists()
+
+def run_main_in_subprocess(arguments):
+    script = ("import sys, main; sys.argv = ['main.py'] + sys.argv[1:]; main.main(); "
+              "print(sorted(name for name in sys.modules if name.split('.')[0] in ('pddl', 'lark')))")
+    process = subprocess.run([sys.executable, "-c", script] + arguments, capture_output=True, text=True, check=True)
+    return process.stdout.splitlines()[-1]
+
+def test_import_does_not_load_pddl():
+    process = subprocess.run([sys.executable, "-c", "import sys, src; print('pddl' in sys.modules, 'lark' in sys.modules)"],
+                             capture_output=True, text=True, check=True)
+    assert process.stdout.strip() == "False False"
+
+def test_cache_hit_does_not_load_pddl(tmp_path):
+    arguments = ["./tests/examples/gripper3.pddl", "./tests/examples/gripper3_2_balls.pddl", "--output-dir",
+                 str(tmp_path / "output"), "--cache-dir", str(tmp_path / "cache")]
+    assert run_main_in_subprocess(arguments) != "[]"
+    output = (tmp_path / "output" / "gripper3_2_balls.out").read_text()
+    assert run_main_in_subprocess(arguments) == "[]"
+    assert (tmp_path / "output" / "gripper3_2_balls.out").read_text() == output
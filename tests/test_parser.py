@@ -1,6 +1,6 @@
 import pytest
 import pddl
-from src import Parser
+from src import Parser, load_domain
 
 @pytest.mark.parametrize("filenames,expected", [
     (["./tests/examples/gripper3.pddl","./tests/examples/gripper3_2_balls.pddl"],
@@ -11,7 +11,7 @@ from src import Parser
 
     ])
 def test_prepositions_storage(filenames, expected):
-    parser = Parser(filenames[0],filenames[1])
+    parser = Parser(filenames[0],filenames[1], prune_static=False)
     ans = sorted([ str(i) for i in parser.propositions])
     assert ans == expected
 
@@ -23,7 +23,7 @@ def test_prepositions_storage(filenames, expected):
     (['./tests/examples/triangle-tire.pddl', './tests/examples/triangle-tire-2.pddl'], ['not-flattire', 'road_l-1-1_l-1-2', 'road_l-1-1_l-2-1', 'road_l-1-2_l-1-3', 'road_l-1-2_l-2-2', 'road_l-1-3_l-1-4', 'road_l-1-3_l-2-3', 'road_l-1-4_l-1-5', 'road_l-1-4_l-2-4', 'road_l-2-1_l-1-2', 'road_l-2-1_l-3-1', 'road_l-2-2_l-1-3', 'road_l-2-3_l-1-4', 'road_l-2-3_l-3-3', 'road_l-2-4_l-1-5', 'road_l-3-1_l-2-2', 'road_l-3-1_l-3-2', 'road_l-3-1_l-4-1', 'road_l-3-2_l-3-3', 'road_l-3-2_l-4-2', 'road_l-3-3_l-2-4', 'road_l-4-1_l-3-2', 'road_l-4-1_l-5-1', 'road_l-4-2_l-3-3', 'road_l-5-1_l-4-2', 'spare-in_l-2-1', 'spare-in_l-2-2', 'spare-in_l-2-3', 'spare-in_l-2-4', 'spare-in_l-3-1', 'spare-in_l-3-3', 'spare-in_l-4-1', 'spare-in_l-4-2', 'spare-in_l-5-1', 'vehicle-at_l-1-1'])
     ])
 def test_initial_state_storage(filenames, expected):
-    parser = Parser(filenames[0],filenames[1])
+    parser = Parser(filenames[0],filenames[1], prune_static=False)
     initial_state = parser.get_initial_state()
     ans = sorted([str(parser.propositions[i]) for i in range(len(parser.propositions)) if initial_state[i] == 1])
     assert ans==expected
@@ -40,3 +40,42 @@ def test_goal_state_storage(filenames, expected):
     goal_state = parser.get_goal_state()
     ans = sorted([(str(parser.propositions[i]), goal_state[i]) for i in range(len(parser.propositions)) if goal_state[i] != -1])
     assert ans==expected
+
+@pytest.mark.parametrize("filenames,expected_static", [
+    (["./tests/examples/gripper3.pddl","./tests/examples/gripper3_2_balls.pddl"], {}),
+    (['./tests/examples/triangle-tire.pddl', './tests/examples/triangle-tire-1.pddl'],
+    {'road': [('l-1-1', 'l-1-2'), ('l-1-1', 'l-2-1'), ('l-1-2', 'l-1-3'), ('l-1-2', 'l-2-2'), ('l-2-1', 'l-1-2'), ('l-2-1', 'l-3-1'), ('l-2-2', 'l-1-3'), ('l-3-1', 'l-2-2')]}),
+    ])
+def test_static_pruning(filenames, expected_static):
+    parser = Parser(filenames[0],filenames[1])
+    full_parser = Parser(filenames[0],filenames[1], prune_static=False)
+    static_facts = {name: sorted(facts) for name, facts in parser.static_facts.items()}
+    assert static_facts == expected_static
+    names = sorted(str(proposition) for proposition in parser.propositions)
+    full_names = sorted(str(proposition) for proposition in full_parser.propositions)
+    assert names == [name for name in full_names if name.split('_')[0] not in expected_static]
+    initial_state = parser.get_initial_state()
+    full_initial_state = full_parser.get_initial_state()
+    for i, proposition in enumerate(parser.propositions):
+        assert initial_state[i] == full_initial_state[full_parser.dict_propositions[str(proposition)].get_index()]
+
+
+def test_constants_merged_with_objects():
+    parser = Parser("./tests/examples/hub.pddl", "./tests/examples/hub-1.pddl")
+    assert sorted(str(object) for object in parser.objects["node"]) == ["hub", "n1", "n2"]
+    assert sorted(str(object) for object in parser.problem.get_objects()["node"]) == ["n1", "n2"]
+
+@pytest.mark.parametrize("filenames", [
+    (["./tests/examples/gripper3.pddl", "./tests/examples/gripper3_2_balls.pddl", "./tests/examples/gripper3_3_balls.pddl"]),
+    (['./tests/examples/triangle-tire.pddl', './tests/examples/triangle-tire-1.pddl', './tests/examples/triangle-tire-2.pddl']),
+    ])
+def test_shared_domain(filenames):
+    domain = load_domain(filenames[0])
+    for problem_path in filenames[1:]:
+        parser = Parser(domain, problem_path)
+        assert parser.domain is domain
+        expected = Parser(filenames[0], problem_path)
+        assert sorted(str(proposition) for proposition in parser.propositions) == sorted(str(proposition) for proposition in expected.propositions)
+        actions = sorted((action.get_name(), [str(object) for object in parameters]) for action, parameters in parser.get_reachable_actions())
+        expected_actions = sorted((action.get_name(), [str(object) for object in parameters]) for action, parameters in expected.get_reachable_actions())
+        assert actions == expected_actions
@@ -0,0 +1,58 @@
+import os
+import pddl
+import pytest
+from src import (Domain, get_grammar_cache_dir, get_pddl_parser, get_plain_name, load_domain, parse_pddl_domain,
+                 parse_pddl_problem)
+
+@pytest.mark.parametrize("domain_filename,problem_filename", [
+    ("./tests/examples/gripper3.pddl", "./tests/examples/gripper3_3_balls.pddl"),
+    ("./tests/examples/triangle-tire.pddl", "./tests/examples/triangle-tire-2.pddl"),
+    ("./tests/examples/hub.pddl", "./tests/examples/hub-1.pddl"),
+    ])
+def test_same_result_as_pddl(domain_filename, problem_filename):
+    assert parse_pddl_domain(domain_filename) == pddl.parse_domain(domain_filename)
+    assert parse_pddl_problem(problem_filename) == pddl.parse_problem(problem_filename)
+
+def test_grammar_cache_file(tmp_path):
+    cache_path = tmp_path / "domain.lark"
+    with open("./tests/examples/gripper3.pddl") as domain_file:
+        text = domain_file.read()
+    first = get_pddl_parser("domain", grammar_cache=str(cache_path))(text)
+    assert cache_path.exists()
+    assert get_pddl_parser("domain", grammar_cache=str(cache_path))(text) == first
+    with pytest.raises(ValueError):
+        get_pddl_parser("plan")
+
+@pytest.mark.skipif(not hasattr(os, "getuid"), reason="needs POSIX permissions")
+def test_grammar_cache_dir_is_private(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    cache_dir = get_grammar_cache_dir()
+    assert cache_dir == str(tmp_path / "parser-pddl")
+    assert os.stat(cache_dir).st_mode & 0o777 == 0o700
+    parse_pddl_domain("./tests/examples/gripper3.pddl")
+    assert len(os.listdir(cache_dir)) == 1
+    os.chmod(cache_dir, 0o777)
+    assert get_grammar_cache_dir() is None
+    assert parse_pddl_domain("./tests/examples/gripper3.pddl") == pddl.parse_domain("./tests/examples/gripper3.pddl")
+
+def test_without_grammar_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    domain = load_domain("./tests/examples/gripper3.pddl", grammar_cache=False)
+    assert sorted(action.name for action in domain.actions) == ["drop", "move", "pick"]
+    assert not (tmp_path / "parser-pddl").exists()
+
+def test_without_private_parser_method(monkeypatch):
+    from pddl.parser.base import BaseParser
+    monkeypatch.delattr(BaseParser, "_call_parser")
+    monkeypatch.setattr(BaseParser, "__call__", lambda parser, text: parser._parser.parse(text))
+    with open("./tests/examples/gripper3.pddl") as domain_file:
+        text = domain_file.read()
+    assert get_pddl_parser("domain", grammar_cache=False)(text) == pddl.parse_domain("./tests/examples/gripper3.pddl")
+
+def test_plain_names():
+    parsed_domain = parse_pddl_domain("./tests/examples/gripper3.pddl")
+    assert all(type(get_plain_name(predicate.name)) is str for predicate in parsed_domain.predicates)
+    mixed_case = pddl.custom_types.name("Ball1")
+    assert get_plain_name(mixed_case) is mixed_case
+    domain = Domain(parsed_domain)
+    assert all(type(action.name) is str for action in domain.actions)
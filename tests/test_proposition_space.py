@@ -0,0 +1,85 @@
+import pytest
+import itertools
+from src import Object, Predicate, PropositionSpace, PropositionNames
+
+def build_space():
+    objects = {"ball": [Object("ball1", "ball"), Object("ball2", "ball")],
+               "room": [Object("rooma", "room"), Object("roomb", "room"), Object("room_c", "room")]}
+    predicates = {"at-ball": Predicate("at-ball", ["ball", "room"]),
+                  "road": Predicate("road", ["room", "room"]),
+                  "empty": Predicate("empty", ["gripper"]),
+                  "not-flattire": Predicate("not-flattire", [])}
+    return PropositionSpace(predicates, objects), predicates, objects
+
+def test_propositions_order():
+    space, predicates, objects = build_space()
+    expected = []
+    for predicate in predicates.values():
+        products = itertools.product(*[objects.get(t, []) for t in predicate.get_variable_types()])
+        for tup in products:
+            if len(tup) == len(set(tup)):
+                expected.append("_".join([predicate.get_name()] + [o.get_name() for o in tup]))
+    assert len(space) == len(expected)
+    assert [str(proposition) for proposition in space] == expected
+    assert [proposition.get_index() for proposition in space] == list(range(len(expected)))
+
+@pytest.mark.parametrize("predicate_name, object_names, expected", [
+    ("at-ball", ["ball1", "rooma"], "at-ball_ball1_rooma"),
+    ("road", ["room_c", "roomb"], "road_room_c_roomb"),
+    ("not-flattire", [], "not-flattire"),
+    ])
+def test_index_of(predicate_name, object_names, expected):
+    space, _, _ = build_space()
+    index = space.index_of(predicate_name, object_names)
+    assert str(space[index]) == expected
+    assert PropositionNames(space)[expected].get_index() == index
+
+@pytest.mark.parametrize("predicate_name, object_names", [
+    ("road", ["rooma", "rooma"]),
+    ("at-ball", ["ball3", "rooma"]),
+    ("unknown", []),
+    ])
+def test_index_of_missing(predicate_name, object_names):
+    space, _, _ = build_space()
+    assert space.index_of(predicate_name, object_names) == -1
+
+def test_names_missing():
+    space, _, _ = build_space()
+    names = PropositionNames(space)
+    assert "road_rooma_rooma" not in names
+    with pytest.raises(KeyError):
+        names["road_rooma_roomd"]
+
+def test_encode_objects_roundtrip():
+    space, _, _ = build_space()
+    for index in range(len(space)):
+        predicate_id, global_ids = space.decode_ids(index)
+        assert [space.object_list[i].get_name() for i in global_ids] == [o.get_name() for o in space[index].get_objects()]
+        assert space.encode_objects(predicate_id, global_ids) == index
+    road = space.predicate_ids["road"]
+    rooma, ball1 = space.global_ids["rooma"], space.global_ids["ball1"]
+    assert space.encode_objects(road, [rooma, rooma]) == -1
+    assert space.encode_objects(road, [rooma, ball1]) == -1
+
+def test_add_objects_appends_propositions():
+    space, predicates, objects = build_space()
+    before = [str(proposition) for proposition in space]
+    added = space.add_objects({"room": [Object("roomd", "room")], "gripper": [Object("left", "gripper")]})
+    first_names = [str(proposition) for proposition in space]
+    assert len(first_names) == len(before) + added
+    assert all("roomd" in name or "left" in name for name in first_names[len(before):])
+    space.add_objects({"ball": [Object("ball3", "ball")], "room": [Object("roome", "room")]})
+    names = [str(proposition) for proposition in space]
+    assert names[:len(first_names)] == first_names
+    expected = set()
+    for predicate in predicates.values():
+        for tup in itertools.product(*[objects.get(t, []) for t in predicate.get_variable_types()]):
+            if len(tup) == len(set(tup)):
+                expected.add("_".join([predicate.get_name()] + [o.get_name() for o in tup]))
+    assert len(names) == len(expected) and set(names) == expected
+    for index in range(len(space)):
+        predicate_id, global_ids = space.decode_ids(index)
+        assert space.encode_objects(predicate_id, global_ids) == index
+        assert PropositionNames(space)[names[index]].get_index() == index
+    with pytest.raises(ValueError):
+        space.add_objects({"ball": [Object("ball1", "ball")]})
@@ -0,0 +1,75 @@
+import pytest
+from src import Parser, load_domain, read_domain, read_problem
+
+EXAMPLES = [
+    ("./tests/examples/gripper3.pddl", "./tests/examples/gripper3_3_balls.pddl"),
+    ("./tests/examples/gripper_se.pddl", "./tests/examples/gripper_se_1_ball.pddl"),
+    ("./tests/examples/triangle-tire.pddl", "./tests/examples/triangle-tire-2.pddl"),
+    ("./tests/examples/ext-domain-triangle-tire.pddl", "./tests/examples/triangle-tire-1.pddl"),
+    ("./tests/examples/logistics.pddl", "./tests/examples/logistics-1.pddl"),
+    ("./tests/examples/hub.pddl", "./tests/examples/hub-1.pddl"),
+    ]
+
+def describe(parser):
+    propositions = parser.propositions
+    def get_state(state):
+        return sorted((str(propositions[i]), value) for i, value in enumerate(state) if value != 0)
+    actions = sorted((action.name, tuple(str(object) for object in parameters))
+                     for action, parameters in parser.get_reachable_actions())
+    return (sorted(str(proposition) for proposition in propositions), get_state(parser.get_initial_state()),
+            get_state(parser.get_goal_state()), actions)
+
+@pytest.mark.parametrize("domain_filename,problem_filename", EXAMPLES)
+def test_builtin_reader_matches_pddl(domain_filename, problem_filename):
+    builtin_parser = Parser(domain_filename, problem_filename, reader="builtin", stats=True)
+    assert describe(builtin_parser) == describe(Parser(domain_filename, problem_filename))
+    assert "reader_fallbacks" not in builtin_parser.get_stats().get_counters()
+
+def test_read_problem_keeps_file_order():
+    problem, initial_literals, goal_literals = read_problem("./tests/examples/gripper3_2_balls.pddl")
+    assert problem.name == "gripper3_2_balls"
+    assert [object.name for object in problem.objects["ball"]] == ["ball1", "ball2"]
+    assert initial_literals[0] == ("free", ("left",), True)
+    assert ("at-ball", ("ball2", "roomb"), True) in goal_literals
+
+def test_read_domain():
+    domain = read_domain("./tests/examples/gripper3.pddl")
+    assert sorted(action.name for action in domain.actions) == ["drop", "move", "pick"]
+    assert [constant.name for constant in domain.constants["gripper"]] == ["left", "right"]
+
+@pytest.mark.parametrize("text", [
+    "(define (problem p) (:domain d) (:objects Ball1 - ball) (:init) (:goal (and)))",
+    "(define (problem p) (:domain d) (:objects b - ball) (:init (free b)) (:goal (or (free b) (full b))))",
+    "(define (problem p) (:domain d) (:objects b - ball) (:init (free b)) (:goal (forall (?x - ball) (free ?x))))",
+    "(define (problem p) (:domain d) (:objects b - ball) (:init (= (cost) 1)) (:goal (free b)))",
+    "(define (problem p) (:domain d) (:objects b - ball) (:init (free b)) (:goal (free b)) (:metric minimize (cost)))",
+    "(define (problem p) (:domain d) (:objects b - ball) (:init (free b)) (:goal (free b))",
+    "(define (problem p) (:domain d) (:objects b) (:init (free b)) (:goal (free b)))",
+    ])
+def test_read_problem_rejects_unsupported(tmp_path, text):
+    problem_path = tmp_path / "problem.pddl"
+    problem_path.write_text(text)
+    with pytest.raises(ValueError):
+        read_problem(str(problem_path))
+
+def test_fallback_to_pddl(tmp_path):
+    problem_path = tmp_path / "problem.pddl"
+    with open("./tests/examples/gripper3_1_ball.pddl") as problem_file:
+        problem_path.write_text(problem_file.read().replace("ball1", "Ball1"))
+    parser = Parser("./tests/examples/gripper3.pddl", str(problem_path), reader="builtin", stats=True)
+    assert parser.get_stats().get_counters()["reader_fallbacks"] == 1
+    assert "whole_Ball1" in [str(proposition) for proposition in parser.propositions]
+
+def test_domain_fallback_to_pddl(tmp_path):
+    domain_path = tmp_path / "domain.pddl"
+    with open("./tests/examples/gripper3.pddl") as domain_file:
+        domain_path.write_text(domain_file.read().replace("(free ?g", "(FREE ?g"))
+    with pytest.raises(ValueError):
+        read_domain(str(domain_path))
+    assert sorted(action.name for action in load_domain(str(domain_path), reader="builtin").actions) == ["drop", "move", "pick"]
+
+def test_unknown_reader():
+    with pytest.raises(ValueError):
+        Parser("./tests/examples/gripper3.pddl", "./tests/examples/gripper3_1_ball.pddl", reader="lark")
+    with pytest.raises(ValueError):
+        load_domain("./tests/examples/gripper3.pddl", reader="lark")
@@ -0,0 +1,74 @@
+import pytest
+from src import BinaryBdds, GoalRelevance, Parser, read_text_bdds
+
+def write_problem_with_idle_package(tmp_path):
+    with open("./tests/examples/logistics-1.pddl") as problem_file:
+        text = problem_file.read()
+    text = text.replace("pkg1 - package", "pkg1 pkg2 - package")
+    text = text.replace("(at-pkg pkg1 locb)", "(at-pkg pkg1 locb) (at-pkg pkg2 loca)")
+    problem_path = tmp_path / "problem.pddl"
+    problem_path.write_text(text)
+    return str(problem_path)
+
+def test_actions_without_goal_are_removed(tmp_path):
+    parser = Parser("./tests/examples/logistics.pddl", write_problem_with_idle_package(tmp_path), stats=True)
+    relevance = parser.get_relevance()
+    names = [name for name, _, _ in parser.iter_reachable_actions()]
+    relevant_names = [name for name, _, _ in relevance.iter_actions(parser.registry, parser.propositions.object_list)]
+    assert relevance.get_num_removed() == 6
+    assert sorted(set(names) - set(relevant_names)) == sorted(action + "_pkg2_truck1_" + location
+                                                             for action in ("load", "unload")
+                                                             for location in ("loca", "locb", "locc"))
+    assert not any("pkg2" in str(parser.propositions[index]) for index in relevance.get_propositions())
+    assert parser.get_stats().get_counters()["irrelevant_actions"] == 6
+
+@pytest.mark.parametrize("filenames", [
+    ("./tests/examples/gripper3.pddl", "./tests/examples/gripper3_3_balls.pddl"),
+    ("./tests/examples/triangle-tire.pddl", "./tests/examples/triangle-tire-2.pddl"),
+    ("./tests/examples/logistics.pddl", "./tests/examples/logistics-1.pddl"),
+    ])
+def test_relevant_pairs_are_closed(filenames):
+    parser = Parser(filenames[0], filenames[1])
+    relevance = GoalRelevance(parser.get_goal_state(), parser.get_registry())
+    for index, value in enumerate(parser.get_goal_state()):
+        if value != -1:
+            assert relevance.is_relevant(index, value)
+    relevant_actions = set(relevance.get_actions())
+    for position, (schema, parameters) in enumerate(parser.get_registry()):
+        achieves = any(relevance.is_relevant(index, value) for scenario in parser.get_registry().get_effects(position)
+                       for index, value in scenario if index != -1)
+        assert achieves == (position in relevant_actions)
+        if achieves:
+            assert all(relevance.is_relevant(index, value) for index, value in schema.ground_preconditions(parameters))
+
+def test_relevant_only_output(tmp_path):
+    problem_path = write_problem_with_idle_package(tmp_path)
+    parser = Parser("./tests/examples/logistics.pddl", problem_path, relevant_only=True)
+    relevance = parser.get_relevance()
+    parser.print_bdds(tmp_path / "output.out")
+    parser.print_binary(tmp_path / "output.bin")
+    _, proposition_names, initial_state, goal_pairs, actions, reachable = read_text_bdds(tmp_path / "output.out")
+    assert proposition_names == [str(parser.propositions[index]) for index in relevance.get_propositions()]
+    assert initial_state == relevance.project_state(parser.get_initial_state())
+    assert [proposition_names[index] for index, _ in goal_pairs] == ["at-pkg_pkg1_locc"]
+    assert len(actions) == len(parser.get_registry()) - 6
+    for _, preconditions, effects in actions:
+        for index, _ in preconditions + [pair for scenario in effects for pair in scenario]:
+            assert 0 <= index < len(proposition_names)
+    assert all(0 <= index < len(proposition_names) for index in reachable)
+    with BinaryBdds(tmp_path / "output.bin") as binary:
+        assert "\n".join(binary.iter_blocks()) == (tmp_path / "output.out").read_text()
+
+def test_relevant_only_with_cache(tmp_path):
+    problem_path = write_problem_with_idle_package(tmp_path)
+    cache_dir = str(tmp_path / "cache")
+    Parser("./tests/examples/logistics.pddl", problem_path, cache=cache_dir)
+    parser = Parser("./tests/examples/logistics.pddl", problem_path, cache=cache_dir, relevant_only=True, stats=True)
+    assert "ground" not in parser.get_stats().phases
+    parser.print_bdds(tmp_path / "output.out")
+    assert len(read_text_bdds(tmp_path / "output.out")[4]) == len(parser.get_registry()) - 6
+
+def test_relevant_only_rejects_streaming():
+    with pytest.raises(ValueError):
+        Parser("./tests/examples/gripper3.pddl", "./tests/examples/gripper3_1_ball.pddl", streaming=True,
+               relevant_only=True)
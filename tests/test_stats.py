@@ -0,0 +1,61 @@
+import io
+import json
+import pytest
+from src import GroundingCounters, IncrementalGrounding, Parser, ParserStats, iter_ground, load_domain
+
+@pytest.mark.parametrize("domain_filename, problem_filename", [
+    ("tests/examples/gripper3.pddl", "tests/examples/gripper3_3_balls.pddl"),
+    ("tests/examples/triangle-tire.pddl", "tests/examples/triangle-tire-2.pddl"),
+    ])
+def test_stats_phases_and_counters(domain_filename, problem_filename):
+    parser = Parser(domain_filename, problem_filename, stats=True)
+    parser.print_bdds(io.StringIO())
+    stats = parser.get_stats()
+    assert list(stats.phases) == ["parse_problem", "build_problem", "parse_domain", "build_domain", "propositions",
+                                  "static_facts", "states", "compile_schemas", "ground", "write"]
+    assert all(phase["time"] >= 0 and "peak_memory" not in phase for phase in stats.phases.values())
+    counters = stats.get_counters()
+    assert counters["propositions"] == len(parser.get_propositions())
+    assert counters["actions"] == len(parser.get_reachable_actions())
+    assert counters["queue_pops"] == counters["queue_pushes"] == counters["reachable_pairs"]
+    assert counters["candidates"] >= counters["rejected"]
+    for grounding in ("layered", "parallel"):
+        other_counters = Parser(domain_filename, problem_filename, grounding=grounding, workers=2, stats=True).get_stats().get_counters()
+        assert {name: other_counters[name] for name in ("actions", "reachable_pairs", "queue_pops")} == \
+               {name: counters[name] for name in ("actions", "reachable_pairs", "queue_pops")}
+
+def test_counters_of_partial_grounding():
+    parser = Parser("tests/examples/logistics.pddl", "tests/examples/logistics-1.pddl")
+    counters = GroundingCounters()
+    actions = iter_ground(parser.get_initial_state(), parser.propositions, parser.schemas, parser.relation_bases,
+                          parser.static_facts, counters=counters)
+    next(actions)
+    actions.close()
+    assert counters.queue_pops > 0
+    assert counters.queue_pushes > counters.queue_pops
+    initial_state = parser.get_initial_state()[:]
+    initial_state[parser.get_propositions().index_of("at-truck", ["truck1", "loca"])] = 0
+    initial_state[parser.get_propositions().index_of("at-truck", ["truck1", "locc"])] = 1
+    incremental = IncrementalGrounding(parser.propositions, parser.schemas, parser.relation_bases, parser.static_facts,
+                                       parser.get_initial_state(), parser.get_registry(),
+                                       parser.reachable_propositions.get_array())
+    counters = GroundingCounters()
+    incremental.update(initial_state, counters)
+    assert counters.queue_pushes == counters.queue_pops > 0
+
+def test_stats_memory_and_json():
+    stats = ParserStats(track_memory=True)
+    Parser(load_domain("tests/examples/logistics.pddl"), "tests/examples/logistics-1.pddl", stats=stats)
+    assert "parse_domain" not in stats.phases
+    assert all(phase["peak_memory"] >= 0 for phase in stats.phases.values())
+    output = io.StringIO()
+    stats.write_json(output)
+    assert json.loads(output.getvalue()) == stats.as_dict()
+    assert "peak(MiB)" in stats.format()
+
+def test_stats_cache(tmp_path):
+    Parser("tests/examples/gripper3.pddl", "tests/examples/gripper3_1_ball.pddl", cache=str(tmp_path), stats=True)
+    parser = Parser("tests/examples/gripper3.pddl", "tests/examples/gripper3_1_ball.pddl", cache=str(tmp_path), stats=True)
+    assert list(parser.get_stats().phases) == ["cache_load"]
+    assert parser.get_stats().get_counters()["actions"] == len(parser.get_reachable_actions())
+    assert Parser("tests/examples/gripper3.pddl", "tests/examples/gripper3_1_ball.pddl", cache=str(tmp_path)).get_stats() is None
@@ -0,0 +1,39 @@
+import sys
+import pytest
+from src import Parser, as_int8_array, bitmask_to_state, state_to_bitmask
+
+def test_state_vectors_without_numpy(monkeypatch):
+    parser = Parser("tests/examples/gripper3.pddl", "tests/examples/gripper3_1_ball.pddl")
+    monkeypatch.setitem(sys.modules, "numpy", None)
+    with pytest.raises(ImportError, match="pip install numpy"):
+        parser.get_state_vectors()
+
+@pytest.mark.parametrize("grounding", ["queue", "layered"])
+def test_state_vectors(grounding):
+    numpy = pytest.importorskip("numpy")
+    parser = Parser("tests/examples/triangle-tire.pddl", "tests/examples/triangle-tire-2.pddl", grounding=grounding)
+    vectors = parser.get_state_vectors()
+    assert parser.get_state_vectors() is vectors
+    assert vectors.initial_state.dtype == numpy.int8 and vectors.initial_state.tolist() == parser.initial_state
+    assert vectors.goal_state.tolist() == parser.goal_state
+    assert vectors.reachable.tolist() == list(parser.reachable_propositions)
+    assert numpy.shares_memory(vectors.reachable, numpy.frombuffer(parser.reachable_propositions.get_array(), dtype=numpy.int8))
+    assert not vectors.reachable.flags.writeable
+
+    num_propositions = len(parser.get_propositions())
+    assert vectors.get_num_propositions() == num_propositions
+    assert vectors.get_true_atoms().tolist() == [i for i, value in enumerate(parser.initial_state) if value == 1]
+    assert vectors.get_goal_atoms().tolist() == [i for i, value in enumerate(parser.goal_state) if value != -1]
+    reached = list(parser.reachable_propositions)
+    assert vectors.get_reachable_literals().tolist() == [i for i, value in enumerate(reached) if value == 1]
+    assert vectors.get_reachable_atoms().tolist() == [i for i in range(num_propositions) if reached[i] == 1]
+
+def test_bitmask():
+    numpy = pytest.importorskip("numpy")
+    state = [1, 0, 0, 1, 0, 0, 0, 1, 1, -1]
+    bitmask = state_to_bitmask(state)
+    assert bitmask.tolist() == [137, 1]
+    assert bitmask_to_state(bitmask, len(state)).tolist() == [1, 0, 0, 1, 0, 0, 0, 1, 1, 0]
+    assert bitmask_to_state(bitmask.tobytes(), len(state)).tolist() == [1, 0, 0, 1, 0, 0, 0, 1, 1, 0]
+    assert as_int8_array([]).tolist() == []
+    assert state_to_bitmask(as_int8_array(state)).tolist() == [137, 1]
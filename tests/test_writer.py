@@ -0,0 +1,83 @@
+import io
+import pytest
+from src import Parser, BddsWriter
+
+@pytest.mark.parametrize("domain_filename, problem_filename", [
+    ("tests/examples/gripper3.pddl", "tests/examples/gripper3_3_balls.pddl"),
+    ("tests/examples/gripper_se.pddl", "tests/examples/gripper_se_1_ball.pddl"),
+    ("tests/examples/triangle-tire.pddl", "tests/examples/triangle-tire-1.pddl"),
+    ])
+def test_writer_outputs(domain_filename, problem_filename, tmp_path):
+    parser = Parser(domain_filename, problem_filename)
+    output_path = tmp_path / "output.out"
+    parser.print_bdds(output_path)
+    expected = output_path.read_text()
+    assert expected.startswith("begin_problem_name\n")
+    assert expected.endswith("\nend_reachable_propositions")
+
+    stream = io.StringIO()
+    parser.print_bdds(stream)
+    assert stream.getvalue() == expected
+    for chunk_size in (1, 7):
+        stream = io.StringIO()
+        BddsWriter.from_parser(parser, chunk_size).write(stream)
+        assert stream.getvalue() == expected
+    parser.print_bdds(str(output_path))
+    assert output_path.read_text() == expected
+
+def test_writer_actions():
+    parser = Parser("tests/examples/logistics.pddl", "tests/examples/logistics-1.pddl")
+    stream = io.StringIO()
+    parser.print_bdds(stream)
+    lines = stream.getvalue().split("\n")
+    names = parser.get_dict_propositions()
+    start = lines.index("load_pkg1_truck1_locb")
+    assert lines[start - 1] == "begin_action"
+    assert lines[start + 1:start + 4] == ["preconditions", "2", str(names["at-truck_truck1_locb"].get_index()) + " 1"]
+    assert lines[start + 4] == str(names["at-pkg_pkg1_locb"].get_index()) + " 1"
+    assert lines[start + 5:start + 9] == ["begin_nd_effects", "1", "effects", "2"]
+    assert lines[start + 9:start + 11] == [str(names["in_pkg1_truck1"].get_index()) + " 1",
+                                           str(names["at-pkg_pkg1_locb"].get_index()) + " 0"]
+    assert lines[start + 11:start + 13] == ["end_nd_effects", "end_action"]
+
+@pytest.mark.parametrize("domain_filename, problem_filename", [
+    ("tests/examples/gripper3.pddl", "tests/examples/gripper3_3_balls.pddl"),
+    ("tests/examples/triangle-tire.pddl", "tests/examples/triangle-tire-2.pddl"),
+    ("tests/examples/hub.pddl", "tests/examples/hub-1.pddl"),
+    ])
+def test_writer_streaming(domain_filename, problem_filename):
+    parser = Parser(domain_filename, problem_filename)
+    streaming_parser = Parser(domain_filename, problem_filename, streaming=True)
+    assert streaming_parser.reachable_actions is None and streaming_parser.reachable_propositions is None
+    expected = io.StringIO()
+    parser.print_bdds(expected)
+    for spill in (True, False):
+        stream = io.StringIO()
+        streaming_parser.print_bdds(stream, spill=spill)
+        assert stream.getvalue() == expected.getvalue()
+    assert streaming_parser.reachable_propositions == parser.reachable_propositions
+    assert len(streaming_parser.get_registry()) == len(parser.get_registry())
+
+    expected_actions = list(parser.iter_reachable_actions())
+    assert expected_actions == list(BddsWriter.from_parser(parser).iter_actions())
+    assert list(streaming_parser.iter_reachable_actions()) == expected_actions
+    assert [(str(action), objects) for action, objects in streaming_parser.get_reachable_actions()] == \
+           [(str(action), objects) for action, objects in parser.get_reachable_actions()]
+
+    expected_binary, binary = io.BytesIO(), io.BytesIO()
+    parser.print_binary(expected_binary)
+    streaming_parser.print_binary(binary)
+    assert binary.getvalue() == expected_binary.getvalue()
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 4096])
+def test_writer_spills_actions(chunk_size):
+    parser = Parser("tests/examples/logistics.pddl", "tests/examples/logistics-1.pddl")
+    expected = io.StringIO()
+    parser.print_bdds(expected)
+    writer = BddsWriter(parser.problem.get_name(), parser.get_propositions(), parser.get_initial_state(),
+                        parser.get_goal_state(), None, parser.reachable_propositions, chunk_size,
+                        actions=parser.iter_reachable_actions())
+    stream = io.StringIO()
+    writer.write(stream)
+    assert stream.getvalue() == expected.getvalue()
+